@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File
+import asyncio
 import logging
 import json
 import os
@@ -13,15 +14,20 @@ from models.fashion_models import (
 )
 from pydantic import BaseModel
 from services.fashion_expert_service import SimpleFashionExpertService, get_fashion_expert_service
-from services.redis_service import redis_service
+from services.async_redis_service import async_redis_service
 from config import settings
 from services.claude_vision_service import ClaudeVisionService
 from services.s3_service import s3_service
+from services.async_s3_service import async_s3_service
 from services.score_calculator_service import ScoreCalculator
-from services.batch_analyzer_service import BatchAnalyzerService
+from services.batch_analyzer_service import batch_analyzer_service
 from services.outfit_analyzer_service import OutfitAnalyzerService
 from services.outfit_matcher_service import outfit_matcher_service
 from services.fashion_index_service import fashion_index_service
+from services.index_worker_service import index_worker_service
+from services.vision_cache_service import vision_cache_service
+from services.expert_response_cache_service import expert_response_cache_service
+from services.fashion_vocabulary import COLOR_MAPPING, COLOR_MAPPING_MATCHER, extract_color_candidates, extract_item_candidates
 from services.utils import save_outfit_analysis_to_json, analyze_situations_from_outfit
 
 logger = logging.getLogger(__name__)
@@ -105,7 +111,7 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
     try:
         # S3에서 매칭되는 착장 찾기
         print(f"🔍 S3 매칭 시도: '{request.user_input}' (전문가: {request.expert_type.value}, room_id: {request.room_id})")
-        matching_result = outfit_matcher_service.find_matching_outfits_from_s3(request.user_input, request.expert_type.value, request.room_id)
+        matching_result = await outfit_matcher_service.find_matching_outfits_from_s3_async(request.user_input, request.expert_type.value, request.room_id)
         
         if not matching_result:
             # S3 연결 실패 등의 경우 기존 방식 사용
@@ -124,10 +130,13 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
             print("ℹ️ 매칭 점수가 낮지만 가장 높은 점수의 착장 선택")
             # 모든 JSON 파일을 점수순으로 정렬하여 가장 높은 것 선택
             all_outfits = []
-            for file_info in matching_result.get('all_files', []):
+            all_files = matching_result.get('all_files', [])
+            contents = await outfit_matcher_service.load_outfit_contents_async([f['filename'] for f in all_files])
+            scores = outfit_matcher_service.score_contents(request.user_input, contents, request.expert_type.value)
+            for file_info in all_files:
                 try:
-                    json_content = s3_service.get_json_content(file_info['filename'])
-                    match_score = outfit_matcher_service.score_calculator.calculate_match_score(request.user_input, json_content, request.expert_type.value)
+                    json_content = contents[file_info['filename']]
+                    match_score = scores[file_info['filename']]
                     all_outfits.append({
                         'filename': file_info['filename'],
                         'content': json_content,
@@ -155,7 +164,7 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
             selection_pool = top_matches[:min(20, len(top_matches))]
             
             # Redis에서 최근 사용된 아이템들 확인 (같은 세션에서 중복 방지)
-            recent_used = redis_service.get_recent_used_outfits(request.room_id, limit=20)
+            recent_used = await async_redis_service.get_recent_used_outfits(request.room_id, limit=20)
             
             # Redis 연결 실패 시에도 기본 중복 방지를 위한 로컬 캐시 사용
             if not recent_used:
@@ -183,10 +192,12 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
                 if unused_files:
                     # 랜덤하게 10개 선택하여 풀에 추가
                     random_additional = random.sample(unused_files, min(10, len(unused_files)))
+                    contents = await outfit_matcher_service.load_outfit_contents_async([f['filename'] for f in random_additional])
+                    scores = outfit_matcher_service.score_contents(request.user_input, contents, request.expert_type.value)
                     for file_info in random_additional:
                         try:
-                            json_content = s3_service.get_json_content(file_info['filename'])
-                            match_score = outfit_matcher_service.score_calculator.calculate_match_score(request.user_input, json_content, request.expert_type.value)
+                            json_content = contents[file_info['filename']]
+                            match_score = scores[file_info['filename']]
                             available_matches.append({
                                 'filename': file_info['filename'],
                                 'content': json_content,
@@ -293,7 +304,7 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
                     print(f"🎲 후보 부족으로 랜덤 선택: {selected_match['filename']}")
                 
                 # 선택된 아이템을 최근 사용 목록에 추가
-                redis_service.add_recent_used_outfit(request.room_id, selected_match['filename'])
+                await async_redis_service.add_recent_used_outfit(request.room_id, selected_match['filename'])
                 
                 print(f"✅ 선택된 착장: {selected_match['filename']} (점수: {selected_match['score']:.2f})")
                 print(f"📊 선택 풀 크기: {len(available_matches)}개, 전체 매칭: {len(top_matches)}개")
@@ -330,7 +341,7 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
         if expert_service:
             # JSON 데이터를 request에 추가
             request.json_data = extracted_items
-            expert_result = await expert_service.get_single_expert_analysis(request)
+            expert_result = await expert_service.get_single_expert_analysis(request, outfit_filename=selected_match['filename'])
             response = expert_result['analysis']
             print(f"✅ JSON 기반 전문가 분석 완료: {expert_result['expert_type']}")
         else:
@@ -340,7 +351,7 @@ async def single_expert_analysis(request: ExpertAnalysisRequest):
         
         # Redis에 분석 결과 추가
         analysis_content = f"[{request.expert_type.value}] S3 매칭 결과: {selected_match['filename']}"
-        redis_service.append_prompt(request.room_id, analysis_content)
+        await async_redis_service.append_prompt(request.room_id, analysis_content)
         
         return ResponseModel(
             success=True,
@@ -369,7 +380,7 @@ async def fallback_expert_analysis(request: ExpertAnalysisRequest):
     """기존 방식의 전문가 분석 (폴백)"""
     try:
         # Redis에서 기존 프롬프트 히스토리 가져오기
-        existing_prompt = redis_service.get_prompt(request.room_id)
+        existing_prompt = await async_redis_service.get_prompt(request.room_id)
         
         # 기존 프롬프트와 새로운 user_input 합치기
         if existing_prompt:
@@ -394,7 +405,7 @@ async def fallback_expert_analysis(request: ExpertAnalysisRequest):
         
         # 분석 결과를 Redis에 추가
         analysis_content = f"[{request.expert_type.value}] {result.get('analysis', '분석 결과 없음')}"
-        redis_service.append_prompt(request.room_id, analysis_content)
+        await async_redis_service.append_prompt(request.room_id, analysis_content)
         
         return ResponseModel(
             success=True,
@@ -617,7 +628,7 @@ async def upload_image_to_s3(file: UploadFile = File(...)):
             )
         
         # S3에 업로드
-        s3_url = s3_service.upload_image(image_bytes, file.filename)
+        s3_url = await async_s3_service.upload_image(image_bytes, file.filename)
         print("✅ S3 업로드 완료")
         
         return ResponseModel(
@@ -657,6 +668,7 @@ async def upload_images_to_s3(files: list[UploadFile] = File(...)):
     try:
         uploaded_files = []
         failed_files = []
+        pending_files = []  # (파일, 이미지 바이트) - 검증 통과 후 동시 업로드
         
         for file in files:
             try:
@@ -680,23 +692,33 @@ async def upload_images_to_s3(files: list[UploadFile] = File(...)):
                     })
                     continue
                 
-                # S3에 업로드
-                s3_url = s3_service.upload_image(image_bytes, file.filename)
-                print(f"✅ S3 업로드 완료: {file.filename}")
-                
-                uploaded_files.append({
-                    "s3_url": s3_url,
-                    "filename": file.filename,
-                    "file_size": len(image_bytes)
-                })
+                pending_files.append((file, image_bytes))
                 
             except Exception as e:
-                print(f"❌ 파일 업로드 실패: {file.filename} - {str(e)}")
+                print(f"❌ 파일 읽기 실패: {file.filename} - {str(e)}")
                 failed_files.append({
                     "filename": file.filename,
                     "error": str(e)
                 })
         
+        # S3에 동시 업로드
+        results = await async_s3_service.upload_images([(image_bytes, file.filename) for file, image_bytes in pending_files])
+        for (file, image_bytes), result in zip(pending_files, results):
+            if isinstance(result, Exception):
+                print(f"❌ 파일 업로드 실패: {file.filename} - {str(result)}")
+                failed_files.append({
+                    "filename": file.filename,
+                    "error": str(result)
+                })
+                continue
+            
+            print(f"✅ S3 업로드 완료: {file.filename}")
+            uploaded_files.append({
+                "s3_url": result,
+                "filename": file.filename,
+                "file_size": len(image_bytes)
+            })
+        
         return ResponseModel(
             success=True,
             message=f"업로드 완료: {len(uploaded_files)}개 성공, {len(failed_files)}개 실패",
@@ -722,12 +744,12 @@ async def upload_images_to_s3(files: list[UploadFile] = File(...)):
 async def batch_analyze_images():
     """S3의 /image 디렉토리에서 JSON이 없는 이미지들을 일괄 분석"""
     
-    # BatchAnalyzerService 인스턴스 생성
-    batch_analyzer = BatchAnalyzerService()
-    
     try:
-        # 배치 분석 수행
-        result = await batch_analyzer.analyze_batch()
+        # 배치 분석 수행 (전역 인스턴스 - 토큰 버킷을 모든 호출이 공유)
+        result = await batch_analyzer_service.analyze_batch()
+        
+        if result.get("already_running"):
+            raise HTTPException(status_code=409, detail="이미 배치 분석이 진행 중입니다. /vision/batch-analyze/progress에서 진행 상황을 확인하세요.")
         
         if result["total_files"] == 0:
             return ResponseModel(
@@ -742,11 +764,26 @@ async def batch_analyze_images():
             data=result
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ 배치 분석 에러 발생: {str(e)}")
         logger.error(f"배치 분석 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"배치 분석 실패: {str(e)}")
 
+@router.get("/vision/batch-analyze/progress",
+            summary="배치 분석 진행 상황",
+            description="마지막(또는 진행 중인) 배치 분석의 체크포인트를 조회합니다. 중단된 배치는 다음 batch-analyze 호출 시 이어서 진행됩니다.",
+            tags=["비전 분석", "배치 처리"])
+async def get_batch_analyze_progress():
+    """배치 분석 체크포인트 조회"""
+    progress = batch_analyzer_service.get_progress()
+    return ResponseModel(
+        success=True,
+        message="배치 분석 진행 상황 조회 완료" if progress else "배치 분석 기록이 없습니다",
+        data={"progress": progress}
+    )
+
 # ✅ 관리자 API - JSON 파일 관리
 @router.get("/admin/json-files")
 async def get_json_files():
@@ -764,7 +801,7 @@ async def get_json_files():
         )
     
     try:
-        json_files = s3_service.list_json_files()
+        json_files = await async_s3_service.list_json_files(use_cache=False)
         
         return ResponseModel(
             success=True,
@@ -796,7 +833,7 @@ async def get_json_content(filename: str):
         )
     
     try:
-        json_content = s3_service.get_json_content(filename)
+        json_content = await async_s3_service.get_json_content(filename)
         
         return ResponseModel(
             success=True,
@@ -821,8 +858,10 @@ async def build_fashion_indexes(force_rebuild: bool = False):
     print(f"🔍 build_fashion_indexes 호출됨 (force_rebuild: {force_rebuild})")
     
     try:
-        # 인덱스 구축
-        result = fashion_index_service.build_indexes(force_rebuild=force_rebuild)
+        # 인덱스 구축 (S3 전체 조회/Redis 기록 동안 이벤트 루프를 막지 않도록 스레드에서 실행)
+        result = await asyncio.to_thread(fashion_index_service.build_indexes, force_rebuild=force_rebuild)
+        if result.get("already_running"):
+            raise HTTPException(status_code=409, detail="전체 재구축이 이미 진행 중입니다")
         
         if force_rebuild:
             message = "패션 인덱스 전체 재구축 완료"
@@ -835,6 +874,8 @@ async def build_fashion_indexes(force_rebuild: bool = False):
             data=result
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ 인덱스 구축 실패: {str(e)}")
         logger.error(f"인덱스 구축 실패: {str(e)}")
@@ -846,8 +887,10 @@ async def rebuild_fashion_indexes():
     print("🔍 rebuild_fashion_indexes 호출됨")
     
     try:
-        # 강제 재구축
-        result = fashion_index_service.build_indexes(force_rebuild=True)
+        # 강제 재구축 (구축 동안 이벤트 루프를 막지 않도록 스레드에서 실행)
+        result = await asyncio.to_thread(fashion_index_service.build_indexes, force_rebuild=True)
+        if result.get("already_running"):
+            raise HTTPException(status_code=409, detail="전체 재구축이 이미 진행 중입니다")
         
         return ResponseModel(
             success=True,
@@ -855,6 +898,8 @@ async def rebuild_fashion_indexes():
             data=result
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ 인덱스 재구축 실패: {str(e)}")
         logger.error(f"인덱스 재구축 실패: {str(e)}")
@@ -878,7 +923,9 @@ async def get_index_stats():
             data={
                 **stats,
                 "is_healthy": is_healthy,
-                "status": "정상" if is_healthy else "복구 필요"
+                "status": "정상" if is_healthy else "복구 필요",
+                "index_worker": index_worker_service.get_status(),
+                "s3_json_cache": s3_service.get_json_cache_stats() if s3_service else {}
             }
         )
         
@@ -887,6 +934,47 @@ async def get_index_stats():
         logger.error(f"인덱스 통계 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"인덱스 통계 조회 실패: {str(e)}")
 
+@router.get("/admin/vision-cache-stats",
+            summary="비전 분석 캐시 통계",
+            description="이미지 내용 기반 비전 분석 캐시의 적중률(완전 일치/유사 이미지), 저장 개수, 제거 횟수를 조회합니다.",
+            tags=["관리자", "비전 분석"])
+async def get_vision_cache_stats():
+    """비전 분석 캐시 통계 조회"""
+    try:
+        stats = await asyncio.to_thread(vision_cache_service.get_stats)
+        return ResponseModel(
+            success=True,
+            message="비전 분석 캐시 통계 조회 완료",
+            data=stats
+        )
+    
+    except Exception as e:
+        print(f"❌ 비전 분석 캐시 통계 조회 실패: {str(e)}")
+        logger.error(f"비전 분석 캐시 통계 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"비전 분석 캐시 통계 조회 실패: {str(e)}")
+
+@router.get("/admin/llm-cache-stats",
+            summary="LLM 응답 캐시 통계",
+            description="전문가 답변 캐시(착장 + 전문가 타입 + 검색 의도 기준)의 적중률과 저장 횟수, Anthropic 프롬프트 캐시의 읽기/쓰기 토큰 수를 조회합니다.",
+            tags=["관리자", "전문가 분석"])
+async def get_llm_cache_stats():
+    """전문가 답변 캐시 / 프롬프트 캐시 통계 조회"""
+    try:
+        expert_service = get_fashion_expert_service()
+        return ResponseModel(
+            success=True,
+            message="LLM 응답 캐시 통계 조회 완료",
+            data={
+                "expert_response_cache": await expert_response_cache_service.get_stats(),
+                "prompt_cache": await expert_service.get_prompt_cache_stats() if expert_service else None
+            }
+        )
+    
+    except Exception as e:
+        print(f"❌ LLM 응답 캐시 통계 조회 실패: {str(e)}")
+        logger.error(f"LLM 응답 캐시 통계 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"LLM 응답 캐시 통계 조회 실패: {str(e)}")
+
 @router.post("/admin/check-index-health")
 async def check_index_health():
     """인덱스 상태 확인 및 필요시 자동 복구"""
@@ -1006,7 +1094,12 @@ async def update_situations(filename: str, request: SituationsUpdateRequest):
         )
     
     try:
-        s3_url = s3_service.update_json_situations(filename, request.situations)
+        s3_url = await async_s3_service.update_json_situations(filename, request.situations)
+        
+        # 이전 situation 인덱스에서 빠지고 새 인덱스에만 추가되도록 재인덱싱 (인덱스 워커가 반영, 큐에 넣지 못하면 바로 반영)
+        index_queued = await index_worker_service.enqueue_async("upsert", filename, "update_situations")
+        if not index_queued:
+            await asyncio.to_thread(fashion_index_service.reindex_file, filename)
         
         return ResponseModel(
             success=True,
@@ -1014,7 +1107,8 @@ async def update_situations(filename: str, request: SituationsUpdateRequest):
             data={
                 "filename": filename,
                 "updated_situations": request.situations,
-                "s3_url": s3_url
+                "s3_url": s3_url,
+                "index_queued": index_queued
             }
         )
         
@@ -1038,36 +1132,34 @@ async def delete_outfit(filename: str):
     
     try:
         # JSON 파일 내용 가져오기 (이미지 URL 확인용)
-        json_content = s3_service.get_json_content(filename)
+        json_content = await async_s3_service.get_json_content(filename)
         image_url = json_content.get('source_image_url', '')
         
         deleted_files = []
         
         # 1. JSON 파일 삭제
+        # (S3Service를 통해 삭제해야 파일 목록 manifest 캐시도 함께 무효화됨)
         json_key = f"{s3_service.bucket_json_prefix}/{filename}.json"
-        try:
-            s3_service.s3_client.delete_object(
-                Bucket=s3_service.bucket_name,
-                Key=json_key
-            )
+        if await async_s3_service.delete_json(filename):
             deleted_files.append(f"JSON: {json_key}")
             print(f"✅ JSON 파일 삭제 완료: {json_key}")
-        except Exception as e:
-            print(f"⚠️ JSON 파일 삭제 실패: {e}")
+        else:
+            print(f"⚠️ JSON 파일 삭제 실패: {json_key}")
         
         # 2. 이미지 파일 삭제 (URL에서 키 추출)
         if image_url:
-            try:
-                # URL에서 S3 키 추출
-                image_key = image_url.replace(f"https://{s3_service.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/", "")
-                s3_service.s3_client.delete_object(
-                    Bucket=s3_service.bucket_name,
-                    Key=image_key
-                )
+            # URL에서 S3 키 추출
+            image_key = image_url.replace(f"https://{s3_service.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/", "")
+            if await async_s3_service.delete_image(image_url):
                 deleted_files.append(f"Image: {image_key}")
                 print(f"✅ 이미지 파일 삭제 완료: {image_key}")
-            except Exception as e:
-                print(f"⚠️ 이미지 파일 삭제 실패: {e}")
+            else:
+                print(f"⚠️ 이미지 파일 삭제 실패: {image_key}")
+        
+        # 3. 모든 인덱스/메타데이터에서 제거 (삭제된 아웃핏이 후보로 선택되지 않도록, 큐에 넣지 못하면 바로 반영)
+        index_queued = await index_worker_service.enqueue_async("delete", filename, "delete_outfit")
+        if not index_queued:
+            await asyncio.to_thread(fashion_index_service.remove_file, filename)
         
         return ResponseModel(
             success=True,
@@ -1075,7 +1167,8 @@ async def delete_outfit(filename: str):
             data={
                 "filename": filename,
                 "deleted_files": deleted_files,
-                "image_url": image_url
+                "image_url": image_url,
+                "index_queued": index_queued
             }
         )
         
@@ -1220,115 +1313,24 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
             matching_result = None
             try:
                 user_input_lower = (request.user_input or "").lower()
-                color_keywords = [
-                    "블랙", "화이트", "그레이", "브라운", "네이비", "베이지",
-                    "검정", "흰색", "회색", "갈색", "남색",
-                    "검은", "검은색", "하얀", "하얀색", "흰", "흰색",
-                    "파란", "파란색", "파랑", "하늘색", "스카이블루",
-                    "빨간", "빨간색", "빨강", "레드", "빨강색",
-                    "주황", "주황색", "오렌지",
-                    "노란", "노란색", "노랑", "옐로우", "노랑색",
-                    "초록", "초록색", "녹색", "그린",
-                    "보라", "보라색", "퍼플", "보랑",
-                    "분홍", "분홍색", "핑크",
-                    "베이지색", "카키", "카키색",
-                    "네이비블루", "다크블루", "라이트블루",
-                    "다크그레이", "라이트그레이", "실버",
-                    "골드", "골든", "금색"
-                ]
-                # 상의/하의 중심 아이템 키워드
-                item_keywords = [
-                    # 상의
-                    "티셔츠", "반팔티", "긴팔티", "셔츠", "폴로셔츠", "니트", "스웨터",
-                    "맨투맨", "후드티", "카디건", "가디건", "베스트", "조끼",
-                    "블라우스", "헨리넥", "터틀넥", "목폴라", "블레이저", "자켓", "재킷",
-                    
-                    # 하의
-                    "슬랙스", "치노팬츠", "청바지", "데님", "데님팬츠", "팬츠", "바지",
-                    "와이드팬츠", "스트레이트팬츠", "테이퍼드팬츠", "스키니진",
-                    "카고팬츠", "조거팬츠", "스웨트팬츠",
-                    "반바지", "쇼츠", "숏팬츠", "하프팬츠",
-                    "스커트"
-                ]
-
-                color_candidates = [c for c in color_keywords if c.lower() in user_input_lower]
-                item_candidates = [i for i in item_keywords if i.lower() in user_input_lower]
-                
-                # "셔츠" 입력 시 "티셔츠" 제외하는 로직
-                if "셔츠" in item_candidates and "티셔츠" in item_candidates:
-                    item_candidates.remove("티셔츠")
-                
-                # 영어 색상 키워드를 한글 색상 키워드로 매핑 (Redis 인덱스는 한글로 저장되어 있음)
-                color_mapping = {
-                    "블랙": ["검정", "검은", "블랙"],
-                    "화이트": ["흰색", "하얀", "화이트"],
-                    "그레이": ["회색", "그레이"],
-                    "브라운": ["갈색", "브라운"],
-                    "네이비": ["남색", "네이비"],
-                    "베이지": ["베이지"],
-                    "레드": ["빨간", "빨강", "레드"],
-                    "오렌지": ["주황", "오렌지"],
-                    "옐로우": ["노란", "노랑", "옐로우"],
-                    "그린": ["초록", "녹색", "그린"],
-                    "퍼플": ["보라", "퍼플"],
-                    "핑크": ["분홍", "핑크"],
-                    "스카이블루": ["하늘색", "파란", "파랑", "스카이블루"],
-                    "다크블루": ["남색", "다크블루"],
-                    "라이트블루": ["하늘색", "라이트블루"],
-                    "다크그레이": ["회색", "다크그레이"],
-                    "라이트그레이": ["회색", "라이트그레이"],
-                    "실버": ["회색", "실버"],
-                    "골드": ["금색", "골드"],
-                    "골든": ["금색", "골든"],
-                    "카키": ["카키"]
-                }
-                
-                # 영어 키워드를 한글 키워드로 확장
-                expanded_color_candidates = set(color_candidates)
-                for eng_color, kor_colors in color_mapping.items():
-                    if eng_color.lower() in user_input_lower:
-                        expanded_color_candidates.update(kor_colors)
-                        expanded_color_candidates.add(eng_color)  # 원본도 유지
-                
-                color_candidates = list(expanded_color_candidates)
+                color_candidates = extract_color_candidates(user_input_lower)
+                item_candidates = extract_item_candidates(user_input_lower)
 
                 if color_candidates and item_candidates:
                     yield f"data: {json.dumps({'type': 'status', 'message': '색상+아이템 교집합으로 후보 검색...', 'step': 2})}\n\n"
 
-                    # 사용자 요청 색상과 정확히 일치하는 아웃핏만 선택
-                    final_filenames = []
-                    
-                    # 각 색상별로 포함된 키들을 찾아서 파일들 수집
-                    for c in color_candidates:
-                        # 색상이 포함된 모든 키 찾기 (한글 우선, 영어도 포함)
-                        color_pattern = f"fashion_index:color:*{c.lower()}*"
-                        color_keys = redis_service.keys(color_pattern)
-                        color_files = set()
-                        for key in color_keys:
-                            color_files.update(redis_service.smembers(key))
-                        
-                        # 각 아이템별로 포함된 키들을 찾아서 파일들 수집
-                        for i in item_candidates:
-                            # 아이템이 포함된 모든 키 찾기
-                            item_pattern = f"fashion_index:item:*{i.lower()}*"
-                            item_keys = redis_service.keys(item_pattern)
-                            item_files = set()
-                            for key in item_keys:
-                                item_files.update(redis_service.smembers(key))
-                            
-                            # 색상과 아이템이 모두 포함된 파일들
-                            exact_matches = color_files.intersection(item_files)
-                            final_filenames.extend(list(exact_matches))
-                    
-                    # 중복 제거
-                    final_filenames = list(set(final_filenames))
+                    # 사용자 요청 색상과 아이템이 모두 포함된 아웃핏만 선택 (인덱스 구축 시 펼쳐 둔 키로 SUNION + SINTER)
+                    final_filenames = list(await asyncio.to_thread(fashion_index_service.search_by_color_and_item, color_candidates, item_candidates))
                     
                     # 상의 색상 필터링: 상의가 검정인 것만 선택
                     if final_filenames and color_candidates:
                         filtered_filenames = []
+                        contents = await outfit_matcher_service.load_outfit_contents_async(final_filenames)
+                        # 입력에 포함된 영어 색상 (한글 매핑 확인용, 파일마다 다시 찾지 않도록 한 번만 계산)
+                        mapped_colors = COLOR_MAPPING_MATCHER.categories_in(user_input_lower)
                         for filename in final_filenames:
                             try:
-                                json_content = s3_service.get_json_content(filename)
+                                json_content = contents[filename]
                                 if json_content:
                                     extracted_items = json_content.get('extracted_items', {})
                                     top_item = extracted_items.get('top', {})
@@ -1337,9 +1339,6 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                                     # 상의 색상이 입력된 색상 키워드와 매칭되는지 확인 (영어/한글 모두 지원)
                                     color_matched = False
                                     
-                                    # 원본 입력에서 추출한 색상 키워드들 (영어 포함)
-                                    original_color_candidates = [c for c in color_keywords if c.lower() in user_input_lower]
-                                    
                                     # 매칭 확인: 확장된 키워드 리스트와 상의 색상 비교
                                     for color_keyword in color_candidates:
                                         color_keyword_lower = color_keyword.lower()
@@ -1349,14 +1348,13 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                                     
                                     # 영어 키워드가 입력된 경우 한글 매핑으로도 확인
                                     if not color_matched:
-                                        for eng_color, kor_colors in color_mapping.items():
-                                            if eng_color.lower() in user_input_lower:
-                                                for kor_color in kor_colors:
-                                                    if kor_color.lower() in top_color or top_color in kor_color.lower():
-                                                        color_matched = True
-                                                        break
-                                                if color_matched:
+                                        for eng_color in mapped_colors:
+                                            for kor_color in COLOR_MAPPING[eng_color]:
+                                                if kor_color.lower() in top_color or top_color in kor_color.lower():
+                                                    color_matched = True
                                                     break
+                                            if color_matched:
+                                                break
                                     
                                     if color_matched:
                                         filtered_filenames.append(filename)
@@ -1375,17 +1373,17 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                     if final_filenames:
                         yield f"data: {json.dumps({'type': 'status', 'message': f'교집합 후보 {len(final_filenames)}개 발견', 'step': 7})}\n\n"
 
-                        recent_used = redis_service.get_recent_used_outfits(request.room_id, limit=20) or []
+                        recent_used = await async_redis_service.get_recent_used_outfits(request.room_id, limit=20) or []
                         available = [fn for fn in final_filenames if fn not in recent_used]
                         candidate_pick = random.choice(available if available else final_filenames)
 
-                        json_content = s3_service.get_json_content(candidate_pick)
+                        json_content = (await outfit_matcher_service.load_outfit_contents_async([candidate_pick])).get(candidate_pick)
                         score = (
                             outfit_matcher_service.score_calculator.calculate_match_score(
                                 request.user_input, json_content, request.expert_type.value
                             ) if json_content else 0.0
                         )
-                        meta = redis_service.get_json(f"fashion_metadata:{candidate_pick}") or {}
+                        meta = await async_redis_service.get_json(fashion_index_service.metadata_key(candidate_pick)) or {}
 
                         selected_match = {
                             'filename': candidate_pick,
@@ -1398,7 +1396,7 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                         recent_used.append(candidate_pick)
                         if len(recent_used) > 20:
                             recent_used.pop(0)
-                        redis_service.set_recent_used_outfits(request.room_id, recent_used)
+                        await async_redis_service.set_recent_used_outfits(request.room_id, recent_used)
 
                         matching_result = {
                             'matching_count': len(final_filenames),
@@ -1414,7 +1412,7 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                 # S3에서 매칭되는 착장 찾기
                 yield f"data: {json.dumps({'type': 'status', 'message': 'S3에서 착장 검색 중...', 'step': 2})}\n\n"
 
-                matching_result = outfit_matcher_service.find_matching_outfits_from_s3(
+                matching_result = await outfit_matcher_service.find_matching_outfits_from_s3_async(
                     request.user_input, request.expert_type.value, request.room_id
                 )
             
@@ -1429,12 +1427,13 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                 yield f"data: {json.dumps({'type': 'status', 'message': '매칭 점수가 낮아 최고 점수 착장 선택...', 'step': 4})}\n\n"
                 # 기존 로직과 동일한 fallback 처리
                 all_outfits = []
-                for file_info in matching_result.get('all_files', []):
+                all_files = matching_result.get('all_files', [])
+                contents = await outfit_matcher_service.load_outfit_contents_async([f['filename'] for f in all_files])
+                scores = outfit_matcher_service.score_contents(request.user_input, contents, request.expert_type.value)
+                for file_info in all_files:
                     try:
-                        json_content = s3_service.get_json_content(file_info['filename'])
-                        match_score = outfit_matcher_service.score_calculator.calculate_match_score(
-                            request.user_input, json_content, request.expert_type.value
-                        )
+                        json_content = contents[file_info['filename']]
+                        match_score = scores[file_info['filename']]
                         all_outfits.append({
                             'filename': file_info['filename'],
                             'content': json_content,
@@ -1462,7 +1461,7 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                 top_matches = matching_result['matches']
                 selection_pool = top_matches[:min(20, len(top_matches))]
                 
-                recent_used = redis_service.get_recent_used_outfits(request.room_id, limit=20)
+                recent_used = await async_redis_service.get_recent_used_outfits(request.room_id, limit=20)
                 if not recent_used:
                     recent_used = []
                 
@@ -1476,12 +1475,12 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                     
                     if unused_files:
                         random_additional = random.sample(unused_files, min(10, len(unused_files)))
+                        contents = await outfit_matcher_service.load_outfit_contents_async([f['filename'] for f in random_additional])
+                        scores = outfit_matcher_service.score_contents(request.user_input, contents, request.expert_type.value)
                         for file_info in random_additional:
                             try:
-                                json_content = s3_service.get_json_content(file_info['filename'])
-                                match_score = outfit_matcher_service.score_calculator.calculate_match_score(
-                                    request.user_input, json_content, request.expert_type.value
-                                )
+                                json_content = contents[file_info['filename']]
+                                match_score = scores[file_info['filename']]
                                 available_matches.append({
                                     'filename': file_info['filename'],
                                     'content': json_content,
@@ -1505,7 +1504,7 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
                 recent_used.append(selected_match['filename'])
                 if len(recent_used) > 20:
                     recent_used.pop(0)
-                redis_service.set_recent_used_outfits(request.room_id, recent_used)
+                await async_redis_service.set_recent_used_outfits(request.room_id, recent_used)
             
             # 2단계: 전문가 분석 시작
             yield f"data: {json.dumps({'type': 'status', 'message': '전문가 분석 시작...', 'step': 11})}\n\n"
@@ -1534,7 +1533,7 @@ async def single_expert_analysis_stream(request: ExpertAnalysisRequest):
             
             # Redis에 분석 결과 추가
             analysis_content = f"[{request.expert_type.value}] S3 매칭 결과: {selected_match['filename']}"
-            redis_service.append_prompt(request.room_id, analysis_content)
+            await async_redis_service.append_prompt(request.room_id, analysis_content)
             
             # 최종 완료 메시지
             final_data = {
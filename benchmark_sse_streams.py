@@ -0,0 +1,196 @@
+import asyncio
+import json
+import time
+import statistics
+from typing import List, Dict, Any
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anthropic
+
+class SSEStreamBenchmark:
+    """워커 하나(이벤트 루프 하나)가 동시에 버티는 Claude 스트림 수 비교 (동기 클라이언트 vs AsyncAnthropic)"""
+    
+    def __init__(self):
+        self.tokens_per_stream = 40
+        self.token_interval = 0.01  # 업스트림 토큰 간격 (초) → 스트림 하나에 약 0.4초
+        self.concurrency_levels = [1, 5, 10, 25, 50, 100]
+        self.max_concurrent_requests = 32  # 서비스 기본 LLM_MAX_CONCURRENT_REQUESTS와 동일
+        self.sustain_ratio = 1.5  # 단일 스트림 대비 p95 소요 시간이 이 배수 이내면 "유지"로 판단
+        self.base_url = None
+        self.upstream_server = None
+    
+    def _sse_events(self) -> List[bytes]:
+        """Claude Messages API 스트리밍 응답 이벤트"""
+        events = [
+            ("message_start", {"type": "message_start", "message": {
+                "id": "msg_benchmark", "type": "message", "role": "assistant", "model": "benchmark",
+                "content": [], "stop_reason": None, "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 1}
+            }}),
+            ("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})
+        ]
+        for i in range(self.tokens_per_stream):
+            events.append(("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": f"토큰{i} "}}))
+        events.extend([
+            ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None}, "usage": {"output_tokens": self.tokens_per_stream}}),
+            ("message_stop", {"type": "message_stop"})
+        ])
+        return [f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8") for name, data in events]
+    
+    def start_upstream(self) -> str:
+        """모의 Claude 업스트림 서버를 별도 스레드에서 실행 (벤치마크 대상 이벤트 루프와 분리)"""
+        events = self._sse_events()
+        token_interval = self.token_interval
+        
+        class UpstreamHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for event in events:
+                    if b"content_block_delta" in event:
+                        time.sleep(token_interval)
+                    self.wfile.write(event)
+                    self.wfile.flush()
+            
+            def log_message(self, format, *args):
+                pass
+        
+        class UpstreamServer(ThreadingHTTPServer):
+            request_queue_size = 256  # 기본 backlog(5)로는 동시 연결 시 SYN 재전송 지연이 측정에 섞임
+        
+        server = UpstreamServer(("127.0.0.1", 0), UpstreamHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.upstream_server = server
+        return f"http://127.0.0.1:{server.server_address[1]}"
+    
+    def _sync_client(self) -> anthropic.Anthropic:
+        """변경 전: 동기 클라이언트 (토큰 대기 중 이벤트 루프 스레드 블로킹)"""
+        return anthropic.Anthropic(api_key="benchmark", base_url=self.base_url, max_retries=0)
+    
+    def _async_client(self) -> anthropic.AsyncAnthropic:
+        """변경 후: AsyncAnthropic + 공유 커넥션 풀"""
+        return anthropic.AsyncAnthropic(
+            api_key="benchmark", base_url=self.base_url, max_retries=0,
+            http_client=anthropic.DefaultAsyncHttpxClient()
+        )
+    
+    async def _stream_before(self, client: anthropic.Anthropic):
+        """기존 _call_claude_stream 방식: async 제너레이터 안에서 동기 스트림 순회"""
+        stream = client.messages.create(
+            model="benchmark", max_tokens=1000, system="", messages=[{"role": "user", "content": "벤치마크"}], stream=True
+        )
+        for chunk in stream:
+            if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
+                yield chunk.delta.text
+    
+    async def _stream_after(self, client: anthropic.AsyncAnthropic, limiter: asyncio.Semaphore):
+        """변경된 _call_claude_stream 방식: 동시 호출 제한 + 비동기 스트림"""
+        async with limiter:
+            async with client.messages.stream(
+                model="benchmark", max_tokens=1000, system="", messages=[{"role": "user", "content": "벤치마크"}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+    
+    async def _consume(self, stream_factory, request_id: int, start_time: float) -> Dict[str, Any]:
+        """스트림 하나를 끝까지 읽고 요청 시작 시점 기준 첫 토큰 시간/총 시간 기록"""
+        first_token_time = None
+        chunks = 0
+        try:
+            async for _ in stream_factory():
+                if first_token_time is None:
+                    first_token_time = time.perf_counter() - start_time
+                chunks += 1
+            return {"request_id": request_id, "success": True, "first_token": first_token_time or 0.0,
+                    "duration": time.perf_counter() - start_time, "chunks": chunks}
+        except Exception as e:
+            return {"request_id": request_id, "success": False, "error": str(e),
+                    "first_token": 0.0, "duration": time.perf_counter() - start_time, "chunks": chunks}
+    
+    async def _measure_loop_lag(self, stop: asyncio.Event, lags: List[float]):
+        """10ms 주기 타이머가 얼마나 늦게 깨어나는지로 이벤트 루프 블로킹 측정"""
+        while not stop.is_set():
+            expected = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            lags.append(max(0.0, time.perf_counter() - expected))
+    
+    async def run_level(self, mode: str, concurrency: int) -> Dict[str, Any]:
+        """동시 스트림 concurrency개를 한 이벤트 루프에서 실행"""
+        if mode == "before":
+            client = self._sync_client()
+            stream_factory = lambda: self._stream_before(client)
+        else:
+            client = self._async_client()
+            limiter = asyncio.Semaphore(self.max_concurrent_requests)
+            stream_factory = lambda: self._stream_after(client, limiter)
+        
+        stop = asyncio.Event()
+        lags: List[float] = []
+        lag_task = asyncio.create_task(self._measure_loop_lag(stop, lags))
+        
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*[self._consume(stream_factory, i + 1, start_time) for i in range(concurrency)])
+        wall_time = time.perf_counter() - start_time
+        
+        stop.set()
+        await lag_task
+        
+        durations = sorted(r["duration"] for r in results if r["success"])
+        first_tokens = sorted(r["first_token"] for r in results if r["success"])
+        return {
+            "mode": mode,
+            "concurrency": concurrency,
+            "success": len(durations),
+            "wall_time": wall_time,
+            "p95_duration": durations[int(len(durations) * 0.95) - 1 if len(durations) > 1 else 0] if durations else 0.0,
+            "p95_first_token": first_tokens[int(len(first_tokens) * 0.95) - 1 if len(first_tokens) > 1 else 0] if first_tokens else 0.0,
+            "max_loop_lag": max(lags) if lags else wall_time,
+            "avg_loop_lag": statistics.mean(lags) if lags else wall_time
+        }
+    
+    async def run(self) -> Dict[str, List[Dict[str, Any]]]:
+        """변경 전/후 각각 동시성 단계별 실행"""
+        results = {"before": [], "after": []}
+        for mode in ("before", "after"):
+            print(f"\n🚀 {mode} 측정 시작")
+            for concurrency in self.concurrency_levels:
+                level_result = await self.run_level(mode, concurrency)
+                results[mode].append(level_result)
+                print(f"  - 동시 {concurrency:>3}개: 총 {level_result['wall_time']:.2f}초, "
+                      f"p95 소요 {level_result['p95_duration']:.2f}초, p95 첫 토큰 {level_result['p95_first_token']:.3f}초, "
+                      f"최대 루프 지연 {level_result['max_loop_lag'] * 1000:.0f}ms")
+                # 유지 기준을 크게 넘으면 더 높은 동시성은 측정하지 않음 (동기 클라이언트는 스트림이 직렬화되어 오래 걸림)
+                baseline = results[mode][0]["p95_duration"]
+                if level_result["p95_duration"] > baseline * self.sustain_ratio * 4:
+                    print(f"  ⏹️ 유지 기준 초과로 {mode} 측정 중단")
+                    break
+        return results
+    
+    def print_results(self, results: Dict[str, List[Dict[str, Any]]]):
+        """단일 스트림 대비 p95 소요 시간이 sustain_ratio 이내인 최대 동시 스트림 수 출력"""
+        print(f"\n📊 워커 하나가 유지하는 동시 스트림 수 (p95 소요 시간 ≤ 단일 스트림 × {self.sustain_ratio})")
+        for mode, levels in results.items():
+            baseline = levels[0]["p95_duration"]
+            sustained = 0
+            for level in levels:
+                if level["success"] == level["concurrency"] and level["p95_duration"] <= baseline * self.sustain_ratio:
+                    sustained = level["concurrency"]
+            print(f"  - {mode}: {sustained}개 (단일 스트림 {baseline:.2f}초)")
+
+async def main():
+    """메인 함수"""
+    print("🚀 SSE 동시 스트림 벤치마크 시작 (모의 Claude 업스트림)")
+    benchmark = SSEStreamBenchmark()
+    benchmark.base_url = benchmark.start_upstream()
+    results = await benchmark.run()
+    benchmark.print_results(results)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+import base64
+import io
+import json
+import time
+import statistics
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any
+
+import anthropic
+import numpy as np
+from PIL import Image
+
+from config import settings
+from api import fashion_routes  # noqa: F401 (services ↔ api 순환 import를 main.py와 같은 순서로 초기화)
+from services.claude_vision_service import ClaudeVisionService
+from services.vision_cache_service import vision_cache_service
+
+class VisionPreprocessBenchmark:
+    """비전 API 전송 바이트/지연시간 비교 (원본 전송 vs 전처리 후 전송)
+    
+    전송 바이트와 클라이언트 측 처리 시간(전처리 + 인코딩 + 로컬 HTTP)은 실측값이고,
+    업스트림 지연시간은 아래 업로드 대역폭/메가픽셀당 처리 시간 상수로 만든 모델값이다.
+    """
+    
+    def __init__(self):
+        self.photo_sizes = [(4032, 3024), (3024, 4032), (2048, 1536), (1080, 1350)]  # 휴대폰 사진 ~ SNS 이미지
+        self.repeats = 3
+        self.upload_bytes_per_second = 2.5 * 1024 * 1024  # 업로드 대역폭 (약 20Mbps)
+        self.model_seconds_per_megapixel = 0.15  # 이미지 토큰 수(픽셀 수)에 비례하는 처리 시간
+        self.base_url = None
+        self.upstream_server = None
+        self.received = []
+        self.modelled_delays = []
+    
+    def _photo(self, size: tuple) -> bytes:
+        """휴대폰 사진과 비슷한 크기의 JPEG (노이즈 + 그라데이션, 품질 92)"""
+        width, height = size
+        rng = np.random.default_rng(width * height)
+        gradient = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+        pixels = np.clip(gradient * 0.6 + rng.normal(100, 40, (height, width, 3)), 0, 255).astype(np.uint8)
+        output = io.BytesIO()
+        Image.fromarray(pixels, "RGB").save(output, format="JPEG", quality=92)
+        return output.getvalue()
+    
+    def start_upstream(self) -> str:
+        """모의 Claude Messages API (업로드 대역폭과 이미지 크기에 비례한 처리 시간을 모델값으로 반영)"""
+        benchmark = self
+        
+        class UpstreamHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                
+                # 이미지 픽셀 수 확인
+                request = json.loads(body)
+                image_data = request["messages"][0]["content"][0]["source"]["data"]
+                with Image.open(io.BytesIO(base64.b64decode(image_data))) as image:
+                    megapixels = image.size[0] * image.size[1] / 1_000_000
+                
+                modelled_delay = length / benchmark.upload_bytes_per_second + megapixels * benchmark.model_seconds_per_megapixel
+                benchmark.received.append(length)
+                benchmark.modelled_delays.append(modelled_delay)
+                time.sleep(modelled_delay)
+                
+                response = json.dumps({
+                    "id": "msg_benchmark", "type": "message", "role": "assistant", "model": "benchmark",
+                    "content": [{"type": "text", "text": "{\"top\": {\"item\": \"셔츠\", \"color\": \"화이트\"}}"}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": 1000, "output_tokens": 20}
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), UpstreamHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.upstream_server = server
+        return f"http://127.0.0.1:{server.server_address[1]}"
+    
+    def _vision_service(self) -> ClaudeVisionService:
+        """모의 업스트림을 바라보는 비전 서비스"""
+        service = ClaudeVisionService.__new__(ClaudeVisionService)
+        service.client = anthropic.Anthropic(api_key="benchmark", base_url=self.base_url, max_retries=0)
+        return service
+    
+    def run_case(self, preprocess: bool, photos: List[bytes]) -> Dict[str, Any]:
+        """한 가지 설정으로 모든 사진 분석"""
+        settings.VISION_PREPROCESS_ENABLED = preprocess
+        service = self._vision_service()
+        self.received = []
+        self.modelled_delays = []
+        latencies = []
+        
+        for _ in range(self.repeats):
+            for photo in photos:
+                start_time = time.time()
+                service.analyze_outfit(photo, filename="photo.jpg")
+                latencies.append(time.time() - start_time)
+        
+        # 모의 업스트림이 잠든 시간을 빼면 클라이언트 측 실측 처리 시간
+        client_times = [latency - delay for latency, delay in zip(latencies, self.modelled_delays)]
+        
+        return {
+            "mode": "전처리" if preprocess else "원본",
+            "bytes_on_wire": statistics.mean(self.received),
+            "client_p50": statistics.median(client_times),
+            "p50": statistics.median(latencies),
+            "max": max(latencies)
+        }
+    
+    def run(self):
+        vision_cache_service.enabled = False  # 반복 호출이 캐시에 걸리지 않도록
+        self.base_url = self.start_upstream()
+        photos = [self._photo(size) for size in self.photo_sizes]
+        
+        print("📸 테스트 이미지")
+        for size, photo in zip(self.photo_sizes, photos):
+            print(f"   - {size[0]}x{size[1]}: {len(photo) / 1024:.0f} KB")
+        print(f"⚙️ 최대 변 {settings.VISION_IMAGE_MAX_EDGE}px, {settings.VISION_IMAGE_FORMAT} 품질 {settings.VISION_IMAGE_QUALITY}")
+        
+        results = [self.run_case(False, photos), self.run_case(True, photos)]
+        
+        print("\n" + "=" * 72)
+        print("📊 비전 API 요청당 전송 바이트 / 지연시간 (base64 포함 요청 본문 기준)")
+        print("=" * 72)
+        print(f"{'모드':<8}{'요청 본문(KB)':>16}{'클라이언트 p50(초)':>20}{'모델 p50(초)':>14}{'모델 max(초)':>14}")
+        for result in results:
+            print(f"{result['mode']:<8}{result['bytes_on_wire'] / 1024:>16.0f}{result['client_p50']:>20.3f}"
+                  f"{result['p50']:>14.2f}{result['max']:>14.2f}")
+        
+        original, processed = results
+        print(f"\n✅ 전송 바이트 {100 * (1 - processed['bytes_on_wire'] / original['bytes_on_wire']):.1f}% 감소 (실측)")
+        print(f"   클라이언트 측 처리 시간 p50 {original['client_p50']:.3f}초 → {processed['client_p50']:.3f}초 (실측)")
+        print(f"   p50 지연시간 {100 * (1 - processed['p50'] / original['p50']):.1f}% 감소 "
+              f"(모델값: 업로드 {self.upload_bytes_per_second * 8 / 1_000_000:.0f}Mbps, "
+              f"메가픽셀당 {self.model_seconds_per_megapixel}초 가정, 실제 API 측정값 아님)")
+        
+        self.upstream_server.shutdown()
+
+if __name__ == "__main__":
+    VisionPreprocessBenchmark().run()
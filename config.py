@@ -38,6 +38,24 @@ class Settings:
     LLM_MODEL_NAME: str = os.getenv("LLM_MODEL_NAME", "claude-3-haiku-20240307")  # Claude 모델로 변경
     LLM_MAX_TOKENS: int = int(os.getenv("LLM_MAX_TOKENS", "1000"))
     LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", "0.7"))
+    LLM_MAX_CONCURRENT_REQUESTS: int = int(os.getenv("LLM_MAX_CONCURRENT_REQUESTS", "32"))  # 워커당 동시 Claude 호출 수
+    LLM_MAX_CONNECTIONS: int = int(os.getenv("LLM_MAX_CONNECTIONS", "64"))  # 공유 HTTP 커넥션 풀 크기
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "32"))
+    LLM_REQUEST_TIMEOUT: float = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))  # Claude 요청 타임아웃 (초)
+    
+    # 전문가 답변 캐시 (착장 + 전문가 타입 + 검색 의도 기준, 키마다 답변 여러 개를 모아 돌아가며 사용)
+    EXPERT_RESPONSE_CACHE_ENABLED: bool = os.getenv("EXPERT_RESPONSE_CACHE_ENABLED", "True").lower() == "true"
+    EXPERT_RESPONSE_CACHE_TTL: int = int(os.getenv("EXPERT_RESPONSE_CACHE_TTL", "86400"))  # 초
+    EXPERT_RESPONSE_CACHE_VARIANTS: int = int(os.getenv("EXPERT_RESPONSE_CACHE_VARIANTS", "3"))  # 풀이 이만큼 찰 때까지는 LLM으로 새 답변 생성
+    
+    # Anthropic 프롬프트 캐시 (정적 시스템 프롬프트에 cache_control 지정, 모델별 최소 길이 미만이면 캐시되지 않음)
+    PROMPT_CACHE_ENABLED: bool = os.getenv("PROMPT_CACHE_ENABLED", "True").lower() == "true"
+    PROMPT_CACHE_MIN_TOKENS: int = int(os.getenv("PROMPT_CACHE_MIN_TOKENS", "2048"))  # 모델별 최소 캐시 길이 (Haiku 2048, Sonnet/Opus 1024)
+
+    # 스트리밍 프레임 설정 (0이면 토큰 도착 즉시 전송)
+    STREAM_COALESCE_BYTES: int = int(os.getenv("STREAM_COALESCE_BYTES", "0"))  # 버퍼가 이 바이트 이상이면 프레임 전송
+    STREAM_COALESCE_WINDOW_MS: int = int(os.getenv("STREAM_COALESCE_WINDOW_MS", "0"))  # 첫 토큰 후 이 시간이 지나면 프레임 전송
+    STREAM_TYPING_CHUNK_CHARS: int = int(os.getenv("STREAM_TYPING_CHUNK_CHARS", "10"))  # typing_delay_ms 요청 시 완성 응답 분할 크기
     
     # 로그 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -46,6 +64,9 @@ class Settings:
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))  # 비동기 커넥션 풀 크기 (워커당)
+    REDIS_POOL_TIMEOUT: float = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))  # 풀이 가득 찼을 때 대기 시간 (초)
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))  # 연결/명령 타임아웃 (초)
 
     # AWS S3 설정
     AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY", "")
@@ -55,6 +76,59 @@ class Settings:
     S3_COMBINATION_BUCKET_IMAGE_PREFIX: str = os.getenv("S3_COMBINATION_BUCKET_IMAGE_PREFIX", "image")
     S3_COMBINATION_BUCKET_JSON_PREFIX: str = os.getenv("S3_COMBINATION_BUCKET_JSON_PREFIX", "json")
 
+    # S3 커넥션 풀 / 동시 요청 수
+    S3_MAX_POOL_CONNECTIONS: int = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50"))  # botocore 커넥션 풀 크기
+    S3_MAX_CONCURRENCY: int = int(os.getenv("S3_MAX_CONCURRENCY", "32"))  # 동시 S3 요청 스레드 수
+
+    # S3 파일 목록(manifest) 캐시 TTL (초, 자체 업로드/삭제 시 즉시 무효화)
+    S3_MANIFEST_TTL: float = float(os.getenv("S3_MANIFEST_TTL", "60"))
+
+    # S3 JSON 캐시 설정 (프로세스 로컬 LRU + TTL)
+    S3_JSON_CACHE_MAX_ENTRIES: int = int(os.getenv("S3_JSON_CACHE_MAX_ENTRIES", "2000"))
+    S3_JSON_CACHE_TTL: int = int(os.getenv("S3_JSON_CACHE_TTL", "300"))  # TTL 경과 후 ETag로 재검증 (초)
+
+    # 패션 인덱스 구축 (S3 조회/파싱 워커 풀 + 배치 단위 Redis 파이프라인 기록)
+    INDEX_BUILD_WORKERS: int = int(os.getenv("INDEX_BUILD_WORKERS", "16"))  # 인덱스 구축 시 조회/파싱/키워드 추출 워커 수
+    INDEX_BUILD_BATCH_SIZE: int = int(os.getenv("INDEX_BUILD_BATCH_SIZE", "200"))  # Redis에 한 번의 MULTI로 기록할 파일 수
+    FASHION_INDEX_GENERATION_CACHE_SECONDS: float = float(os.getenv("FASHION_INDEX_GENERATION_CACHE_SECONDS", "2"))  # 현재 인덱스 세대 포인터 캐시 (초)
+    FASHION_INDEX_GC_DELAY_SECONDS: float = float(os.getenv("FASHION_INDEX_GC_DELAY_SECONDS", "30"))  # 세대 전환 후 이전 세대 삭제까지 대기 (초)
+
+    # 배치 비전 분석 (동시 실행 수, API 쿼터에 맞춘 토큰 버킷, 429/5xx 재시도)
+    BATCH_ANALYZE_CONCURRENCY: int = int(os.getenv("BATCH_ANALYZE_CONCURRENCY", "4"))
+    VISION_RATE_LIMIT_PER_MINUTE: float = float(os.getenv("VISION_RATE_LIMIT_PER_MINUTE", "50"))  # 분당 비전 API 호출 수
+    VISION_RATE_LIMIT_BURST: int = int(os.getenv("VISION_RATE_LIMIT_BURST", "4"))  # 토큰 버킷 최대 크기
+    VISION_MAX_RETRIES: int = int(os.getenv("VISION_MAX_RETRIES", "4"))
+    VISION_RETRY_BASE_DELAY: float = float(os.getenv("VISION_RETRY_BASE_DELAY", "1.0"))  # 지수 백오프 기준 (초, full jitter)
+    VISION_RETRY_MAX_DELAY: float = float(os.getenv("VISION_RETRY_MAX_DELAY", "30"))
+
+    # 비전 API 전송 전 이미지 전처리 (EXIF 회전 보정, 축소, 재인코딩) 및 S3 썸네일 재사용
+    VISION_PREPROCESS_ENABLED: bool = os.getenv("VISION_PREPROCESS_ENABLED", "True").lower() == "true"
+    VISION_IMAGE_MAX_EDGE: int = int(os.getenv("VISION_IMAGE_MAX_EDGE", "1568"))  # 긴 변 최대 픽셀 (Claude 권장 크기)
+    VISION_IMAGE_FORMAT: str = os.getenv("VISION_IMAGE_FORMAT", "JPEG")  # JPEG 또는 WEBP
+    VISION_IMAGE_QUALITY: int = int(os.getenv("VISION_IMAGE_QUALITY", "85"))
+    VISION_HTTP_POOL_SIZE: int = int(os.getenv("VISION_HTTP_POOL_SIZE", "16"))  # 외부 이미지 URL 다운로드 세션 커넥션 수
+    S3_COMBINATION_BUCKET_THUMBNAIL_PREFIX: str = os.getenv("S3_COMBINATION_BUCKET_THUMBNAIL_PREFIX", "thumbnail")
+
+    # 비전 분석 결과 캐시 (이미지 SHA-256 + dHash 유사 이미지 매칭)
+    VISION_CACHE_ENABLED: bool = os.getenv("VISION_CACHE_ENABLED", "True").lower() == "true"
+    VISION_CACHE_TTL: int = int(os.getenv("VISION_CACHE_TTL", str(30 * 24 * 3600)))  # 초
+    VISION_CACHE_MAX_ENTRIES: int = int(os.getenv("VISION_CACHE_MAX_ENTRIES", "50000"))  # 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    VISION_CACHE_SIMILAR_ENABLED: bool = os.getenv("VISION_CACHE_SIMILAR_ENABLED", "False").lower() == "true"  # 유사 이미지(dHash) 결과 재사용 (기본은 완전 일치만)
+    VISION_CACHE_HAMMING_THRESHOLD: int = int(os.getenv("VISION_CACHE_HAMMING_THRESHOLD", "3"))  # 64비트 dHash 기준 유사 이미지로 볼 최대 거리
+    VISION_CACHE_COLOR_SIMILARITY: float = float(os.getenv("VISION_CACHE_COLOR_SIMILARITY", "0.9"))  # 유사 이미지 재사용 시 색상 히스토그램 교집합 최소 비율 (0~1)
+
+    # 인덱스 변경 이벤트 큐 (Redis Stream) 및 리더 워커
+    INDEX_WORKER_ENABLED: bool = os.getenv("INDEX_WORKER_ENABLED", "True").lower() == "true"
+    INDEX_QUEUE_MAX_LENGTH: int = int(os.getenv("INDEX_QUEUE_MAX_LENGTH", "100000"))  # Stream 최대 길이 (대략적 MAXLEN)
+    INDEX_QUEUE_MAX_LAG: int = int(os.getenv("INDEX_QUEUE_MAX_LAG", "5000"))  # 이보다 밀리면 증분 빌드로 따라잡기
+    INDEX_WORKER_BATCH_SIZE: int = int(os.getenv("INDEX_WORKER_BATCH_SIZE", "200"))  # 한 번에 읽어 반영할 이벤트 수
+    INDEX_WORKER_LEADER_TTL_MS: int = int(os.getenv("INDEX_WORKER_LEADER_TTL_MS", "15000"))  # 리더 락 TTL (1/3 주기로 연장)
+    INDEX_WORKER_MAX_ATTEMPTS: int = int(os.getenv("INDEX_WORKER_MAX_ATTEMPTS", "5"))  # 반영 실패 이벤트 재시도 횟수 (초과 시 dead-letter Stream으로)
+
+    # 패션 인덱스 인메모리 스냅샷 (비트맵 역색인, 프로세스별로 Redis에서 로드 후 증분 갱신)
+    FASHION_INDEX_IN_MEMORY: bool = os.getenv("FASHION_INDEX_IN_MEMORY", "False").lower() == "true"
+    FASHION_INDEX_MEMORY_REFRESH_SECONDS: float = float(os.getenv("FASHION_INDEX_MEMORY_REFRESH_SECONDS", "2"))  # Redis 버전 확인 주기 (초)
+
     # 프롬프트 관리 설정
     MAX_CONTEXT_LENGTH = 10000  # 최대 컨텍스트 길이
     MAX_CONTEXT_LINES = 20      # 최대 컨텍스트 라인 수
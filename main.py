@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+import asyncio
 import logging
 from api.fashion_routes import router
 import os
@@ -24,12 +25,22 @@ async def startup_event():
     try:
         from services.fashion_index_service import fashion_index_service
         
+        from services.index_worker_service import index_worker_service
+        
+        # 인덱스 상태 확인/복구와 변경 이벤트 반영은 리더로 선출된 워커 한 곳에서만 수행
+        # (--workers N으로 실행해도 전체 스캔이 중복되지 않음)
+        if index_worker_service.enabled:
+            index_worker_service.start()
+        
         # 백그라운드에서 인덱스 상태 확인 및 복구 (서버 시작 지연 방지)
         import threading
         def background_index_check():
             try:
                 logger.info("🔨 백그라운드에서 인덱스 상태 확인 시작...")
-                fashion_index_service._check_and_recover_indexes()
+                if not index_worker_service.enabled:
+                    fashion_index_service._check_and_recover_indexes()
+                # 인메모리 인덱스 스냅샷 로드/주기적 갱신 (FASHION_INDEX_IN_MEMORY 설정 시, 워커마다)
+                fashion_index_service.start_memory_refresh()
                 logger.info("✅ 백그라운드 인덱스 확인 완료")
             except Exception as e:
                 logger.error(f"❌ 백그라운드 인덱스 확인 실패: {e}")
@@ -37,12 +48,46 @@ async def startup_event():
         # 데몬 스레드로 실행 (메인 프로세스 종료 시 자동 종료)
         index_thread = threading.Thread(target=background_index_check, daemon=True)
         index_thread.start()
+        
+        # 공통 규칙 프롬프트가 실제로 캐시 가능한 길이인지 측정 (서버 시작은 기다리지 않음)
+        from services.fashion_expert_service import get_fashion_expert_service
+        expert_service = get_fashion_expert_service()
+        if expert_service:
+            asyncio.create_task(expert_service.measure_prompt_cache_prefix())
         logger.info("🚀 서버 시작 완료 (인덱스 확인은 백그라운드에서 진행 중)")
         
     except Exception as e:
         logger.error(f"❌ 인덱스 복구 시작 실패: {e}")
         # 실패해도 서버는 계속 시작
 
+# 서버 종료 시 커넥션 풀 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 인덱스 워커 리더 락 반납, 인메모리 인덱스 갱신 중지, 비동기 Redis / Claude HTTP 커넥션 풀 정리"""
+    try:
+        from services.index_worker_service import index_worker_service
+        index_worker_service.stop()
+    except Exception as e:
+        logger.error(f"❌ 인덱스 워커 정리 실패: {e}")
+    
+    try:
+        from services.fashion_index_service import fashion_index_service
+        fashion_index_service.stop_memory_refresh()
+    except Exception as e:
+        logger.error(f"❌ 인메모리 인덱스 갱신 중지 실패: {e}")
+    
+    try:
+        from services.async_redis_service import async_redis_service
+        await async_redis_service.close()
+    except Exception as e:
+        logger.error(f"❌ 비동기 Redis 정리 실패: {e}")
+    
+    try:
+        from services.fashion_expert_service import close_llm_http_client
+        await close_llm_http_client()
+    except Exception as e:
+        logger.error(f"❌ Claude HTTP 클라이언트 정리 실패: {e}")
+
 # CORS 설정 추가
 app.add_middleware(
     CORSMiddleware,
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Any, Dict
 from enum import Enum
 
@@ -22,6 +22,7 @@ class ExpertAnalysisRequest(BaseModel):
     user_profile: Optional[Dict] = None
     context_info: Optional[Dict] = None
     json_data: Optional[Dict] = None  # JSON 분석 결과 데이터
+    typing_delay_ms: Optional[int] = Field(None, ge=0, le=200)  # 스트리밍 프레임 간 지연 (타이핑 효과, 기본은 즉시 전송, 연결/워커 점유를 막기 위해 최대 200ms)
   # Pinterest 트렌드 데이터
 
 class ExpertChainRequest(BaseModel):
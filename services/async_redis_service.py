@@ -0,0 +1,234 @@
+import json
+import logging
+import os
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class AsyncRedisService:
+    """요청 경로용 비동기 Redis 서비스 (redis.asyncio + 제한된 커넥션 풀, 이벤트 루프를 블로킹하지 않음)"""
+    
+    def __init__(self):
+        self.redis_client = None
+        self._pool = None
+        self._connect()
+    
+    def _connect(self):
+        """커넥션 풀 생성 (실제 연결은 첫 명령 실행 시 이벤트 루프에서 수립)"""
+        try:
+            # 풀이 가득 차면 새 연결을 만들지 않고 pool_timeout 동안 반환을 기다림
+            self._pool = aioredis.BlockingConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                decode_responses=True,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                health_check_interval=30
+            )
+            self.redis_client = aioredis.Redis(connection_pool=self._pool)
+            logger.info(f"✅ 비동기 Redis 커넥션 풀 생성: {settings.REDIS_HOST}:{settings.REDIS_PORT} (최대 {settings.REDIS_MAX_CONNECTIONS}개)")
+        except Exception as e:
+            logger.error(f"❌ 비동기 Redis 커넥션 풀 생성 실패: {e}")
+            self.redis_client = None
+            self._pool = None
+    
+    async def ping(self) -> bool:
+        """연결 상태 확인"""
+        if not self.redis_client:
+            return False
+        
+        try:
+            return bool(await self.redis_client.ping())
+        except Exception as e:
+            logger.error(f"비동기 Redis 연결 확인 실패: {e}")
+            return False
+    
+    async def close(self):
+        """커넥션 풀 정리 (서버 종료 시)"""
+        if not self.redis_client:
+            return
+        
+        try:
+            await self.redis_client.aclose()
+            logger.info("🔌 비동기 Redis 커넥션 풀 종료")
+        except Exception as e:
+            logger.error(f"비동기 Redis 커넥션 풀 종료 실패: {e}")
+    
+    async def execute_pipeline(self, commands: list, transaction: bool = False) -> Optional[list]:
+        """여러 명령을 한 번의 왕복으로 실행 (commands: [(명령 이름, 인자...), ...], 실패 시 None)"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        if not commands:
+            return []
+        
+        try:
+            async with self.redis_client.pipeline(transaction=transaction) as pipe:
+                for command, *args in commands:
+                    getattr(pipe, command)(*args)
+                return await pipe.execute()
+        except Exception as e:
+            logger.error(f"비동기 Redis 파이프라인 실행 실패: {e}")
+            return None
+    
+    async def get_prompt(self, room_id: int) -> Optional[str]:
+        """Redis에서 프롬프트 히스토리 가져오기"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        try:
+            key = f"{room_id}:prompt"
+            value = await self.redis_client.get(key)
+            logger.info(f"Redis에서 프롬프트 조회: {key} = {value[:100] if value else 'None'}...")
+            return value
+        except Exception as e:
+            logger.error(f"Redis 프롬프트 조회 실패: {e}")
+            return None
+    
+    async def append_prompt(self, room_id: int, content: str) -> bool:
+        """Redis에 프롬프트 히스토리 추가"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return False
+        
+        try:
+            key = f"{room_id}:prompt"
+            current_value = await self.redis_client.get(key) or ""
+            
+            # 새로운 내용 추가
+            new_value = current_value + "\n" + content if current_value else content
+            
+            # 최대 길이 제한 (환경변수에서 직접 참조, 동기 서비스와 동일)
+            max_context_length = int(os.getenv("MAX_CONTEXT_LENGTH", "10000"))
+            max_context_lines = int(os.getenv("MAX_CONTEXT_LINES", "20"))
+            
+            if len(new_value) > max_context_length:
+                # 라인별로 분할하여 최근 N라인만 유지
+                lines = new_value.split('\n')
+                if len(lines) > max_context_lines:
+                    lines = lines[-max_context_lines:]
+                new_value = '\n'.join(lines)
+            
+            # Redis에 저장 (24시간 만료)
+            context_expire_time = int(os.getenv("CONTEXT_EXPIRE_TIME", "86400"))
+            await self.redis_client.setex(key, context_expire_time, new_value)
+            logger.info(f"Redis에 프롬프트 추가: {key} (길이: {len(new_value)})")
+            return True
+        except Exception as e:
+            logger.error(f"Redis 프롬프트 추가 실패: {e}")
+            return False
+    
+    async def get_recent_used_outfits(self, room_id: int, limit: int = 5) -> list:
+        """최근 사용된 아이템 목록 가져오기"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return []
+        
+        try:
+            key = f"{room_id}:recent_outfits"
+            recent_outfits = await self.redis_client.lrange(key, 0, limit - 1)
+            logger.info(f"Redis에서 최근 사용 아이템 조회: {key} = {len(recent_outfits)}개")
+            return recent_outfits
+        except Exception as e:
+            logger.error(f"최근 사용 아이템 조회 실패: {e}")
+            return []
+    
+    async def add_recent_used_outfit(self, room_id: int, filename: str) -> bool:
+        """최근 사용된 아이템 목록에 추가 (LREM → LPUSH → LTRIM → EXPIRE 한 번의 MULTI)"""
+        key = f"{room_id}:recent_outfits"
+        results = await self.execute_pipeline([
+            ("lrem", key, 0, filename),  # 기존 목록에서 같은 아이템 제거 (중복 방지)
+            ("lpush", key, filename),
+            ("ltrim", key, 0, 29),  # 최대 30개까지만 유지
+            ("expire", key, 14400)  # 4시간 만료
+        ], transaction=True)
+        
+        if results is None:
+            return False
+        
+        logger.info(f"최근 사용 아이템 추가: {room_id}:{filename}")
+        return True
+    
+    async def set_recent_used_outfits(self, room_id: int, filenames: list) -> bool:
+        """최근 사용된 아이템 목록을 한 번에 설정 (DELETE → RPUSH → EXPIRE 한 번의 MULTI)"""
+        key = f"{room_id}:recent_outfits"
+        commands = [("delete", key)]
+        if filenames:
+            commands.append(("rpush", key, *filenames))
+            commands.append(("expire", key, 14400))  # 4시간 만료
+        
+        results = await self.execute_pipeline(commands, transaction=True)
+        if results is None:
+            return False
+        
+        if filenames:
+            logger.info(f"최근 사용 아이템 목록 설정: {room_id} = {len(filenames)}개")
+        return True
+    
+    async def get(self, key: str) -> Optional[str]:
+        """문자열 값 조회"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        try:
+            return await self.redis_client.get(key)
+        except Exception as e:
+            logger.error(f"Redis 값 조회 실패: {e}")
+            return None
+    
+    async def get_json(self, key: str) -> Optional[dict]:
+        """Redis에서 JSON 데이터 조회"""
+        json_data = await self.get(key)
+        if not json_data:
+            return None
+        
+        try:
+            return json.loads(json_data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Redis JSON 데이터 조회 실패: {e}")
+            return None
+    
+    async def mget_json(self, keys: list) -> list:
+        """여러 JSON 데이터를 MGET 한 번으로 조회 (keys 순서대로, 없으면 None)"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return [None] * len(keys)
+        
+        if not keys:
+            return []
+        
+        try:
+            results = []
+            for json_data in await self.redis_client.mget(keys):
+                try:
+                    results.append(json.loads(json_data) if json_data else None)
+                except (TypeError, ValueError):
+                    results.append(None)
+            return results
+        except Exception as e:
+            logger.error(f"Redis JSON 데이터 일괄 조회 실패: {e}")
+            return [None] * len(keys)
+    
+    async def xadd(self, key: str, fields: dict, maxlen: int) -> Optional[str]:
+        """Stream에 이벤트 추가 (대략 maxlen개까지만 유지), 이벤트 ID 반환"""
+        if not self.redis_client:
+            logger.warning("비동기 Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        try:
+            return await self.redis_client.xadd(key, fields, maxlen=maxlen, approximate=True)
+        except Exception as e:
+            logger.error(f"Redis Stream 추가 실패: {e}")
+            return None
+
+# 전역 비동기 Redis 서비스 인스턴스
+async_redis_service = AsyncRedisService()
@@ -0,0 +1,86 @@
+import asyncio
+import functools
+import logging
+from typing import Dict, List, Tuple
+
+from services.s3_service import s3_service
+
+logger = logging.getLogger(__name__)
+
+class AsyncS3Service:
+    """S3Service 비동기 파사드 (S3 전용 스레드 풀에서 실행, 이벤트 루프를 블로킹하지 않음)"""
+    
+    def __init__(self, sync_service):
+        self.s3_service = sync_service
+    
+    async def _run(self, func, *args, **kwargs):
+        """동기 S3 호출을 S3 스레드 풀에서 실행"""
+        if self.s3_service is None:
+            raise Exception("S3 서비스가 초기화되지 않았습니다.")
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.s3_service.executor, functools.partial(func, *args, **kwargs))
+    
+    async def upload_image(self, image_bytes: bytes, original_filename: str = None) -> str:
+        """이미지를 S3에 업로드"""
+        return await self._run(self.s3_service.upload_image, image_bytes, original_filename)
+    
+    async def upload_json(self, json_data: dict, filename: str) -> str:
+        """JSON 데이터를 S3에 업로드"""
+        return await self._run(self.s3_service.upload_json, json_data, filename)
+    
+    async def get_json_content(self, filename: str) -> dict:
+        """특정 JSON 파일 내용 조회"""
+        return await self._run(self.s3_service.get_json_content, filename)
+    
+    async def check_json_exists(self, filename: str) -> bool:
+        """JSON 파일 존재 여부 확인"""
+        return await self._run(self.s3_service.check_json_exists, filename)
+    
+    async def list_json_files(self, use_cache: bool = True) -> list:
+        """JSON 파일 목록 조회 (기본은 캐시된 manifest)"""
+        return await self._run(self.s3_service.list_json_files, use_cache=use_cache)
+    
+    async def list_image_files(self, use_cache: bool = True) -> list:
+        """이미지 파일 목록 조회 (기본은 캐시된 manifest)"""
+        return await self._run(self.s3_service.list_image_files, use_cache=use_cache)
+    
+    async def update_json_situations(self, filename: str, situations: list) -> str:
+        """JSON 파일의 situations 필드 업데이트"""
+        return await self._run(self.s3_service.update_json_situations, filename, situations)
+    
+    async def delete_json(self, filename: str) -> bool:
+        """S3에서 JSON 파일 삭제"""
+        return await self._run(self.s3_service.delete_json, filename)
+    
+    async def delete_image(self, s3_url: str) -> bool:
+        """S3에서 이미지 삭제"""
+        return await self._run(self.s3_service.delete_image, s3_url)
+    
+    async def get_many(self, filenames: List[str]) -> Dict[str, dict]:
+        """여러 JSON 파일을 동시에 조회 (실패한 파일은 결과에서 제외)"""
+        if not filenames:
+            return {}
+        
+        results = await asyncio.gather(*[self.get_json_content(filename) for filename in filenames], return_exceptions=True)
+        
+        contents = {}
+        for filename, result in zip(filenames, results):
+            if isinstance(result, Exception):
+                logger.error(f"JSON 동시 조회 실패: {filename} - {result}")
+                continue
+            contents[filename] = result
+        return contents
+    
+    async def upload_images(self, images: List[Tuple[bytes, str]]) -> list:
+        """여러 이미지를 동시에 업로드 (입력 순서대로 s3_url 또는 예외 반환)"""
+        if not images:
+            return []
+        
+        return await asyncio.gather(
+            *[self.upload_image(image_bytes, original_filename) for image_bytes, original_filename in images],
+            return_exceptions=True
+        )
+
+# 전역 비동기 S3 서비스 인스턴스
+async_s3_service = AsyncS3Service(s3_service)
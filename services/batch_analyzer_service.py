@@ -1,23 +1,71 @@
+import asyncio
 import logging
-from typing import List, Dict, Any, Tuple
+import random
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import anthropic
+import requests
+
 from services.s3_service import s3_service
+from services.redis_service import redis_service
 from services.claude_vision_service import claude_vision_service
 from services.fashion_expert_service import get_fashion_expert_service
 from services.outfit_analyzer_service import OutfitAnalyzerService
 from api.fashion_routes import ImageAnalysisRequest
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+class TokenBucket:
+    """API 쿼터에 맞춘 비동기 토큰 버킷 (프로세스 단위)"""
+    
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# 비전 API 호출 토큰 버킷 (프로세스당 하나, 모든 배치 호출이 공유)
+vision_rate_limiter = TokenBucket(settings.VISION_RATE_LIMIT_PER_MINUTE, settings.VISION_RATE_LIMIT_BURST)
+
 class BatchAnalyzerService:
     """배치 이미지 분석을 담당하는 서비스 클래스"""
     
+    CHECKPOINT_KEY = "batch_analyze:checkpoint"
+    PROCESSED_KEY_PREFIX = "batch_analyze:processed"
+    CHECKPOINT_TTL = 7 * 24 * 3600
+    LOCK_KEY = "batch_analyze:lock"  # 배치는 전체 워커에서 한 번에 하나만 실행
+    LOCK_TTL_MS = 60000  # 1/3 주기로 연장 (워커가 죽으면 만료 후 다음 호출이 이어서 진행)
+    
     def __init__(self):
         self.s3_service = s3_service
         self.claude_vision_service = claude_vision_service
         self.outfit_analyzer = OutfitAnalyzerService()
         
+        self.concurrency = max(1, settings.BATCH_ANALYZE_CONCURRENCY)
+        self.rate_limiter = vision_rate_limiter
+        self.max_retries = settings.VISION_MAX_RETRIES
+        self.retry_base_delay = settings.VISION_RETRY_BASE_DELAY
+        self.retry_max_delay = settings.VISION_RETRY_MAX_DELAY
+    
     def get_files_to_analyze(self) -> List[Dict[str, str]]:
         """분석할 파일 목록을 가져옵니다 (JSON이 없는 이미지들)"""
         if not self.s3_service:
@@ -29,7 +77,7 @@ class BatchAnalyzerService:
         """이미지의 ContentType을 수정합니다 (필요한 경우)"""
         if not self.s3_service:
             return
-            
+        
         try:
             # S3에서 파일의 ContentType 확인
             response = self.s3_service.s3_client.head_object(
@@ -45,44 +93,110 @@ class BatchAnalyzerService:
         except Exception as e:
             print(f"⚠️ ContentType 확인 실패: {e}")
     
-    async def analyze_single_file(self, file_info: Dict[str, str]) -> Tuple[bool, Dict[str, Any]]:
-        """단일 파일을 분석합니다"""
-        try:
-            print(f"🔍 파일 분석 중: {file_info['filename']}")
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """재시도 가능한 에러(429/5xx, 연결 실패)면 대기 힌트(Retry-After, 없으면 0) 반환, 아니면 None"""
+        # 분석 서비스들이 예외를 감싸서 다시 던지므로 원인 예외까지 따라가며 확인
+        while error is not None:
+            response = None
+            if isinstance(error, (anthropic.APIConnectionError, requests.ConnectionError, requests.Timeout)):
+                return 0.0
+            if isinstance(error, anthropic.APIStatusError):
+                response = error.response
+            elif isinstance(error, requests.HTTPError):
+                response = error.response
             
-            # ContentType 문제가 있는 경우 수정 시도
-            self.fix_image_content_type_if_needed(file_info['s3_key'])
+            if response is not None:
+                status_code = response.status_code
+                if status_code != 429 and status_code < 500:
+                    return None
+                try:
+                    return float(response.headers.get("retry-after", 0))
+                except (TypeError, ValueError):
+                    return 0.0
             
-            # 새로운 OutfitAnalyzerService를 사용하여 분석 수행
-            result = await self.outfit_analyzer.analyze_outfit_from_url(
-                image_url=file_info['s3_url'],
-                room_id=None,  # 배치 처리시 room_id는 None
-                prompt=None
-            )
+            error = error.__cause__ or error.__context__
+        return None
+    
+    def _backoff_delay(self, attempt: int, retry_after: float) -> float:
+        """지수 백오프 + full jitter (서버가 준 Retry-After보다는 길게)"""
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * (2 ** attempt)))
+        return max(delay, retry_after)
+    
+    async def analyze_single_file(self, file_info: Dict[str, str]) -> Tuple[bool, Dict[str, Any]]:
+        """단일 파일을 분석합니다 (호출마다 토큰 버킷 대기, 429/5xx는 백오프 후 재시도)"""
+        print(f"🔍 파일 분석 중: {file_info['filename']}")
+        
+        # ContentType 문제가 있는 경우 수정 시도
+        await asyncio.to_thread(self.fix_image_content_type_if_needed, file_info['s3_key'])
+        
+        attempt = 0
+        while True:
+            try:
+                await self.rate_limiter.acquire()
+                
+                # 새로운 OutfitAnalyzerService를 사용하여 분석 수행
+                result = await self.outfit_analyzer.analyze_outfit_from_url(
+                    image_url=file_info['s3_url'],
+                    room_id=None,  # 배치 처리시 room_id는 None
+                    prompt=None,
+                    s3_key=file_info['s3_key']  # 공개 URL 대신 S3 클라이언트로 조회
+                )
+                
+                if result["success"]:
+                    return True, {
+                        "filename": file_info['filename'],
+                        "s3_url": file_info['s3_url'],
+                        "analysis_result": result["data"]
+                    }
+                else:
+                    return False, {
+                        "filename": file_info['filename'],
+                        "s3_url": file_info['s3_url'],
+                        "error": result["message"]
+                    }
             
-            if result["success"]:
-                return True, {
-                    "filename": file_info['filename'],
-                    "s3_url": file_info['s3_url'],
-                    "analysis_result": result["data"]
-                }
-            else:
+            except Exception as e:
+                retry_after = self._retry_after(e)
+                if retry_after is not None and attempt < self.max_retries:
+                    delay = self._backoff_delay(attempt, retry_after)
+                    attempt += 1
+                    print(f"⏳ 일시적 오류로 재시도 ({attempt}/{self.max_retries}, {delay:.1f}초 후): {file_info['filename']} - {str(e)}")
+                    await asyncio.sleep(delay)
+                    continue
+                
+                print(f"❌ 파일 분석 중 에러 발생: {file_info['filename']} - {str(e)}")
                 return False, {
                     "filename": file_info['filename'],
                     "s3_url": file_info['s3_url'],
-                    "error": result["message"]
+                    "error": str(e),
+                    "attempts": attempt + 1
                 }
-                
-        except Exception as e:
-            print(f"❌ 파일 분석 중 에러 발생: {file_info['filename']} - {str(e)}")
-            return False, {
-                "filename": file_info['filename'],
-                "s3_url": file_info['s3_url'],
-                "error": str(e)
-            }
+    
+    def _load_checkpoint(self) -> Optional[dict]:
+        """중단된 배치의 체크포인트 조회 (완료된 배치는 None)"""
+        checkpoint = redis_service.get_json(self.CHECKPOINT_KEY)
+        if checkpoint and checkpoint.get("status") == "running":
+            return checkpoint
+        return None
+    
+    def _save_checkpoint(self, checkpoint: dict):
+        """체크포인트 저장"""
+        checkpoint["updated_at"] = datetime.now().isoformat()
+        redis_service.set_json(self.CHECKPOINT_KEY, checkpoint, expire_time=self.CHECKPOINT_TTL)
+    
+    def get_progress(self) -> Optional[dict]:
+        """마지막 배치의 진행 상황 (체크포인트)"""
+        return redis_service.get_json(self.CHECKPOINT_KEY)
+    
+    async def _keep_lock(self, token: str):
+        """배치가 끝날 때까지 락 만료 시간 연장"""
+        while True:
+            await asyncio.sleep(self.LOCK_TTL_MS / 3000)
+            if not await asyncio.to_thread(redis_service.renew_lock, self.LOCK_KEY, token, self.LOCK_TTL_MS):
+                logger.error("배치 분석 락 연장 실패")
     
     async def analyze_batch(self) -> Dict[str, Any]:
-        """배치 이미지 분석을 수행합니다"""
+        """배치 이미지 분석을 수행합니다 (락으로 한 번에 하나만 실행, 이미 진행 중이면 already_running과 진행 상황 반환)"""
         print(f"🔍 batch_analyze_images 호출됨")
         print(f"🔍 s3_service 상태: {self.s3_service is not None}")
         
@@ -91,42 +205,101 @@ class BatchAnalyzerService:
             print("❌ s3_service가 None입니다!")
             raise Exception("S3 서비스가 초기화되지 않았습니다.")
         
+        # 진행 중인 배치를 다른 호출이 "이어서 진행"하며 처리 중인 파일을 다시 분석하지 않도록
+        token = uuid.uuid4().hex
+        if not redis_service.acquire_lock(self.LOCK_KEY, token, self.LOCK_TTL_MS):
+            print("⚠️ 이미 배치 분석이 진행 중입니다")
+            return {"already_running": True, "progress": self.get_progress()}
+        
+        lock_keeper = asyncio.create_task(self._keep_lock(token))
+        try:
+            return await self._analyze_batch()
+        finally:
+            lock_keeper.cancel()
+            redis_service.release_lock(self.LOCK_KEY, token)
+    
+    async def _analyze_batch(self) -> Dict[str, Any]:
+        """배치 분석 본체 (동시 실행 + 체크포인트, 중단된 배치는 이어서 진행)"""
         try:
             # JSON이 없는 이미지 파일들 조회
-            files_to_analyze = self.get_files_to_analyze()
+            files_to_analyze = await asyncio.to_thread(self.get_files_to_analyze)
+            
+            # 중단된 배치가 있으면 이미 처리한 파일(실패 포함)은 건너뛰고 이어서 진행
+            checkpoint = self._load_checkpoint()
+            resumed = checkpoint is not None
+            if resumed:
+                processed_key = f"{self.PROCESSED_KEY_PREFIX}:{checkpoint['batch_id']}"
+                processed = redis_service.smembers(processed_key)
+                files_to_analyze = [file_info for file_info in files_to_analyze if file_info['filename'] not in processed]
+                print(f"🔁 중단된 배치 이어서 진행: {checkpoint['batch_id']} (처리 완료 {len(processed)}개)")
             
             if not files_to_analyze:
+                if resumed:
+                    checkpoint["status"] = "completed"
+                    self._save_checkpoint(checkpoint)
+                    redis_service.delete(processed_key)
                 return {
                     "total_files": 0,
                     "analyzed_files": [],
                     "failed_files": []
                 }
             
-            print(f"🔍 분석 대상 파일 수: {len(files_to_analyze)}")
+            if not resumed:
+                checkpoint = {
+                    "batch_id": uuid.uuid4().hex[:12],
+                    "status": "running",
+                    "total": len(files_to_analyze),
+                    "success_count": 0,
+                    "failure_count": 0,
+                    "started_at": datetime.now().isoformat()
+                }
+                processed_key = f"{self.PROCESSED_KEY_PREFIX}:{checkpoint['batch_id']}"
+                self._save_checkpoint(checkpoint)
+            
+            print(f"🔍 분석 대상 파일 수: {len(files_to_analyze)} (동시 실행 {self.concurrency}개)")
             
             analyzed_files = []
             failed_files = []
+            semaphore = asyncio.Semaphore(self.concurrency)
+            
+            async def run(file_info: Dict[str, str]) -> Tuple[bool, Dict[str, Any]]:
+                async with semaphore:
+                    return await self.analyze_single_file(file_info)
             
-            # 각 파일에 대해 분석 수행
-            for file_info in files_to_analyze:
-                success, result = await self.analyze_single_file(file_info)
+            # 완료되는 순서대로 체크포인트 기록
+            for task in asyncio.as_completed([run(file_info) for file_info in files_to_analyze]):
+                success, result = await task
                 
                 if success:
                     analyzed_files.append(result)
-                    print(f"✅ 파일 분석 완료: {file_info['filename']}")
+                    checkpoint["success_count"] += 1
+                    print(f"✅ 파일 분석 완료: {result['filename']}")
                 else:
                     failed_files.append(result)
-                    print(f"❌ 파일 분석 실패: {file_info['filename']} - {result.get('error', 'Unknown error')}")
+                    checkpoint["failure_count"] += 1
+                    print(f"❌ 파일 분석 실패: {result['filename']} - {result.get('error', 'Unknown error')}")
+                
+                redis_service.sadd(processed_key, result['filename'])
+                self._save_checkpoint(checkpoint)
+            
+            checkpoint["status"] = "completed"
+            self._save_checkpoint(checkpoint)
+            redis_service.delete(processed_key)
             
             return {
                 "total_files": len(files_to_analyze),
                 "analyzed_files": analyzed_files,
                 "failed_files": failed_files,
                 "success_count": len(analyzed_files),
-                "failure_count": len(failed_files)
+                "failure_count": len(failed_files),
+                "batch_id": checkpoint["batch_id"],
+                "resumed": resumed
             }
-            
+        
         except Exception as e:
             print(f"❌ 배치 분석 에러 발생: {str(e)}")
             logger.error(f"배치 분석 실패: {str(e)}")
-            raise Exception(f"배치 분석 실패: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"배치 분석 실패: {str(e)}")
+
+# 전역 인스턴스
+batch_analyzer_service = BatchAnalyzerService()
@@ -3,6 +3,9 @@ import base64
 import requests
 from urllib.parse import urlparse
 from config import settings
+from services.vision_cache_service import vision_cache_service
+from services.image_preprocessor import preprocess_image_for_vision
+from services.s3_service import s3_service
 
 class ClaudeVisionService:
     def __init__(self, api_key: str):
@@ -14,10 +17,16 @@ class ClaudeVisionService:
             raise ValueError("ClaudeVisionService: API 키가 설정되지 않았습니다.")
         
         self.client = anthropic.Anthropic(api_key=api_key)
+        
+        # 외부 이미지 URL 다운로드용 세션 (커넥션/TLS 재사용)
+        self.http_session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=settings.VISION_HTTP_POOL_SIZE)
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
         print(f"🔍 ClaudeVisionService 초기화 완료")
 
-    def analyze_outfit_from_url(self, image_url: str, prompt: str = None) -> str:
-        """S3 이미지 링크로부터 착장 분석"""
+    def analyze_outfit_from_url(self, image_url: str, prompt: str = None, s3_key: str = None) -> str:
+        """S3 이미지 링크로부터 착장 분석 (우리 버킷 이미지는 공개 URL 대신 S3 클라이언트로 조회)"""
         try:
             print(f"🔍 S3 이미지 링크 분석 시작: {image_url}")
             
@@ -25,12 +34,30 @@ class ClaudeVisionService:
             if not self._is_valid_image_url(image_url):
                 raise ValueError("유효하지 않은 이미지 URL입니다.")
             
-            # 이미지 다운로드
-            image_bytes = self._download_image(image_url)
-            print(f"✅ 이미지 다운로드 완료: {len(image_bytes)} bytes")
-            
             # 파일명 추출 (확장자 감지용)
             filename = self._extract_filename_from_url(image_url)
+            image_name = filename.rsplit('.', 1)[0]
+            
+            # 우리 버킷 이미지는 저장된 썸네일이 있으면 원본 대신 사용 (배치 재분석 시 원본 다운로드/재압축 생략)
+            if s3_service is not None:
+                s3_key = s3_key or s3_service.s3_key_from_url(image_url)
+            is_own_image = bool(s3_key)
+            if is_own_image:
+                thumbnail_bytes = s3_service.get_thumbnail(image_name)
+                if thumbnail_bytes:
+                    print(f"✅ 저장된 썸네일 사용: {len(thumbnail_bytes)} bytes")
+                    return self.analyze_outfit(thumbnail_bytes, filename=s3_service.thumbnail_key(image_name), prompt=prompt, preprocessed=True)
+            
+            # 이미지 다운로드 (우리 버킷은 S3 클라이언트, 그 외는 공유 세션)
+            image_bytes = self._download_s3_image(s3_key) if is_own_image else self._download_image(image_url)
+            print(f"✅ 이미지 다운로드 완료: {len(image_bytes)} bytes")
+            
+            if is_own_image:
+                # 전처리 결과를 썸네일로 저장해 두고 그대로 분석
+                processed_bytes, media_type = preprocess_image_for_vision(image_bytes)
+                if media_type:
+                    s3_service.upload_thumbnail(image_name, processed_bytes, media_type)
+                    return self.analyze_outfit(processed_bytes, content_type=media_type, prompt=prompt, preprocessed=True)
             
             # 기존 analyze_outfit 메서드 호출
             return self.analyze_outfit(image_bytes, filename=filename, prompt=prompt)
@@ -39,6 +66,20 @@ class ClaudeVisionService:
             print(f"❌ S3 이미지 분석 실패: {str(e)}")
             raise Exception(f"S3 이미지 분석 실패: {str(e)}")
 
+    def _download_s3_image(self, s3_key: str) -> bytes:
+        """우리 버킷 이미지를 S3 클라이언트(커넥션 풀, 재시도 포함)로 조회"""
+        try:
+            image_bytes, content_type = s3_service.get_image_bytes(s3_key)
+        except Exception as e:
+            raise Exception(f"S3 이미지 조회 실패: {str(e)}")
+        
+        # ContentType이 잘못 저장된 이미지(binary/octet-stream)는 바이트 헤더로 판단
+        is_image = image_bytes.startswith((b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'GIF87a', b'GIF89a')) or (image_bytes.startswith(b'RIFF') and b'WEBP' in image_bytes[:12])
+        if not content_type.startswith('image/') and not is_image:
+            raise ValueError(f"이미지 파일이 아닙니다: {content_type}")
+        
+        return image_bytes
+
     def _is_valid_image_url(self, url: str) -> bool:
         """이미지 URL 유효성 검증"""
         try:
@@ -58,7 +99,7 @@ class ClaudeVisionService:
     def _download_image(self, url: str) -> bytes:
         """이미지 다운로드"""
         try:
-            response = requests.get(url, timeout=30)
+            response = self.http_session.get(url, timeout=(5, 30))
             response.raise_for_status()
             
             # Content-Type 확인
@@ -81,13 +122,26 @@ class ClaudeVisionService:
         except Exception:
             return 'image.jpg'
 
-    def analyze_outfit(self, image_bytes: bytes, filename: str = None, content_type: str = None, prompt: str = None) -> str:
+    def analyze_outfit(self, image_bytes: bytes, filename: str = None, content_type: str = None, prompt: str = None, preprocessed: bool = False) -> str:
         try:
+            # EXIF 회전 보정 + 축소 + 재인코딩 (썸네일 등 이미 전처리된 이미지는 생략)
+            processed_media_type = None
+            if not preprocessed:
+                image_bytes, processed_media_type = preprocess_image_for_vision(image_bytes)
+            
+            # 같은(또는 거의 같은) 이미지를 이미 분석했다면 API 호출 없이 재사용
+            # (업로드/URL/저장된 썸네일 경로가 같은 키를 쓰도록 전처리 결과 기준으로 지문 계산)
+            fingerprint = vision_cache_service.fingerprint(image_bytes, prompt)
+            cached_analysis = vision_cache_service.lookup(fingerprint)
+            if cached_analysis is not None:
+                print(f"⚡ 비전 분석 캐시 적중: {fingerprint['sha'][:12]}")
+                return cached_analysis
+            
             # 이미지를 base64로 인코딩
             image_base64 = base64.b64encode(image_bytes).decode('utf-8')
             
             # 파일 타입 자동 감지
-            media_type = self._detect_media_type(image_bytes, filename, content_type)
+            media_type = processed_media_type or self._detect_media_type(image_bytes, filename, content_type)
             
             print(f"🔍 이미지 전송: {len(image_bytes)} bytes, 타입: {media_type}")
             
@@ -190,6 +244,7 @@ class ClaudeVisionService:
                 # JSON 파싱
                 import json
                 parsed_data = json.loads(json_text)
+                vision_cache_service.store(fingerprint, parsed_data)
                 return parsed_data
                 
             except json.JSONDecodeError as e:
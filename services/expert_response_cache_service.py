@@ -0,0 +1,96 @@
+import hashlib
+import json
+import logging
+import random
+import re
+from typing import Optional
+
+from services.async_redis_service import async_redis_service
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class ExpertResponseCacheService:
+    """착장 내용 + 전문가 타입 + 정규화된 검색 의도 기준 전문가 답변 캐시 (키마다 여러 답변을 모아 돌아가며 사용)"""
+    
+    def __init__(self):
+        self.prefix = "expert_response"
+        self.stats_key = f"{self.prefix}:stats"
+        self.enabled = settings.EXPERT_RESPONSE_CACHE_ENABLED
+        self.ttl = settings.EXPERT_RESPONSE_CACHE_TTL
+        self.variant_pool_size = max(1, settings.EXPERT_RESPONSE_CACHE_VARIANTS)
+    
+    def intent_signature(self, user_input: str) -> Optional[str]:
+        """사용자 입력을 검색 조건 + 조건 키워드를 뺀 나머지 문장으로 정규화한 서명 (검색 조건이 없으면 None → 캐시하지 않음)"""
+        from services.outfit_matcher_service import (
+            outfit_matcher_service, SEARCH_SITUATION_MATCHER, SEARCH_ITEM_MATCHER, SEARCH_STYLING_MATCHER
+        )
+        from services.fashion_vocabulary import COLOR_KEYWORD_MATCHER
+        
+        criteria = outfit_matcher_service._extract_search_criteria(user_input)
+        if not any(criteria.values()):
+            # "다른거는?", "가격대는?"처럼 조건이 없는 질문은 서로 다른 질문이라 답변을 모으면 안 됨
+            return None
+        
+        # 조건 키워드와 공백/문장부호를 뺀 나머지 문장 ("키 작은데", "가격대" 같은 추가 질문 구분)
+        remaining = user_input.lower()
+        for matcher in (SEARCH_SITUATION_MATCHER, SEARCH_ITEM_MATCHER, COLOR_KEYWORD_MATCHER, SEARCH_STYLING_MATCHER):
+            for keyword, _ in sorted(matcher.find_all(remaining), key=lambda entry: -len(entry[0])):
+                remaining = remaining.replace(keyword, " ")
+        remaining = re.sub(r"[\W_]+", "", remaining)
+        
+        normalized = "|".join(f"{field}={','.join(sorted(set(criteria.get(field, []))))}" for field in ("situations", "items", "colors", "styling"))
+        return hashlib.sha1(f"{normalized}|rest={remaining}".encode("utf-8")).hexdigest()[:16]
+    
+    def document_version(self, json_data: dict) -> str:
+        """착장 문서 내용 해시 (situations 수정/재분석 후에는 다른 키가 되어 이전 답변을 쓰지 않음)"""
+        return hashlib.sha1(json.dumps(json_data, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+    
+    def cache_key(self, outfit_filename: str, expert_type: str, intent_signature: str, document_version: str) -> str:
+        return f"{self.prefix}:{outfit_filename}:{document_version}:{expert_type}:{intent_signature}"
+    
+    async def get(self, cache_key: str) -> Optional[str]:
+        """답변 풀이 다 채워졌으면 그중 하나를 무작위로 반환 (아직 모으는 중이면 None → LLM 호출)"""
+        if not self.enabled:
+            return None
+        
+        try:
+            results = await async_redis_service.execute_pipeline([("lrange", cache_key, 0, -1)])
+            variants = results[0] if results else []
+            hit = len(variants) >= self.variant_pool_size
+            await async_redis_service.execute_pipeline([("hincrby", self.stats_key, "hits" if hit else "misses", 1)])
+            return random.choice(variants) if hit else None
+        except Exception as e:
+            logger.error(f"전문가 답변 캐시 조회 실패: {e}")
+            return None
+    
+    async def put(self, cache_key: str, response: str) -> bool:
+        """답변 풀에 추가 (최근 variant_pool_size개만 유지, TTL 갱신)"""
+        if not self.enabled or not response:
+            return False
+        
+        results = await async_redis_service.execute_pipeline([
+            ("rpush", cache_key, response),
+            ("ltrim", cache_key, -self.variant_pool_size, -1),
+            ("expire", cache_key, self.ttl),
+            ("hincrby", self.stats_key, "stores", 1)
+        ], transaction=True)
+        return results is not None
+    
+    async def get_stats(self) -> dict:
+        """적중률 (전체 워커 합산)"""
+        results = await async_redis_service.execute_pipeline([("hgetall", self.stats_key)])
+        counters = {field: int(value) for field, value in (results[0] if results else {}).items()}
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "enabled": self.enabled,
+            "variant_pool_size": self.variant_pool_size,
+            "ttl": self.ttl,
+            "hits": hits,
+            "misses": misses,
+            "stores": counters.get("stores", 0),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0
+        }
+
+# 전역 인스턴스
+expert_response_cache_service = ExpertResponseCacheService()
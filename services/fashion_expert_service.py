@@ -2,19 +2,239 @@ import asyncio
 import openai
 import logging
 import anthropic
+import httpx
 import json
 import os
 from typing import List, Dict, Optional
 from config import settings
 from models.fashion_models import FashionExpertType, ExpertAnalysisRequest
+from services.keyword_matcher import KeywordAutomaton
+from services.expert_response_cache_service import expert_response_cache_service
+from services.async_redis_service import async_redis_service
 
 
 logger = logging.getLogger(__name__)
 
+# Claude 호출용 공유 HTTP 커넥션 풀과 동시 호출 제한 (서비스 인스턴스 간 공유, 워커 프로세스당 하나)
+_llm_http_client: Optional[httpx.AsyncClient] = None
+_llm_limiter: Optional[asyncio.Semaphore] = None
+
+def _get_llm_http_client() -> httpx.AsyncClient:
+    """Claude API용 공유 비동기 HTTP 클라이언트 (keep-alive 커넥션 재사용)"""
+    global _llm_http_client
+    if _llm_http_client is None:
+        _llm_http_client = anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+    return _llm_http_client
+
+def _get_llm_limiter() -> asyncio.Semaphore:
+    """Claude API 동시 호출 수 제한 (스트리밍은 응답이 끝날 때까지 슬롯 점유)"""
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = asyncio.Semaphore(settings.LLM_MAX_CONCURRENT_REQUESTS)
+    return _llm_limiter
+
+async def close_llm_http_client():
+    """공유 HTTP 커넥션 풀 정리 (서버 종료 시)"""
+    global _llm_http_client
+    if _llm_http_client is not None:
+        await _llm_http_client.aclose()
+        _llm_http_client = None
+
+# 프롬프트 캐시 토큰 통계 (Redis 해시)
+PROMPT_CACHE_STATS_KEY = "llm_prompt_cache:stats"
+
+# 공통 규칙 블록 토큰 수 (서버 시작 시 messages.count_tokens로 측정, 최소 캐시 길이 미만이면 cache_control 생략)
+_prompt_cache_prefix_tokens: Optional[int] = None
+_prompt_cache_prefix_cacheable: Optional[bool] = None  # 측정 전이면 None
+
+# 전문가 답변용 공통 규칙 (착장/전문가/사용자 입력과 무관한 정적 프롬프트, 프롬프트 캐시 대상 - 바뀌면 캐시가 새로 만들어짐)
+JSON_RESPONSE_RULES_PROMPT = """당신은 남성 패션 전문가입니다. 아래 규칙을 지켜 답변하고, 맡은 역할과 옷 조합 정보, 사용자 입력은 규칙 뒤에 주어집니다.
+
+**🚨 응답 시작 강제 규칙 (절대 위반 금지):**
+- 첫 문장은 무조건 구체적인 옷 조합으로 시작해야 함
+- "[상의 색상] [상의]에 [하의 색상] [하의]가 잘 어울려" 같은 형태로 시작
+- "이 옷 조합 좋아", "그 옷 조합 좋아", "저 옷 조합 좋아" 같은 주관적 표현 절대 금지
+- 주관적 판단, 감탄사, 추상적 설명 절대 금지
+- 바로 구체적인 옷 조합 분석으로 시작해야 함
+
+**🔥 핵심 원칙: 첫 문장은 반드시 구체적인 옷 조합으로 시작!**
+- 첫 문장은 무조건 "[상의 색상] [상의]에 [하의 색상] [하의]가 잘 어울려" 같은 형태로 시작
+- 주관적 판단, 감탄사, 추상적 설명 절대 금지
+- 바로 구체적인 옷 조합 분석으로 시작해야 함
+
+**🚨 절대 금지: 첫 문장에서 주관적 뉘앙스 표현**
+- "이 조합 좋아", "그 조합 좋아", "저 조합 좋아" (가장 중요한 금지)
+- "이 조합이 딱이네", "그 옷 조합이 딱이야", "진짜 좋아", "너무 좋아", "완전 좋아"
+- "그 옷 조합 괜찮아", "이 옷 조합 괜찮아", "저 옷 조합 괜찮아"
+- "야", "어", "오" 같은 감탄사 (특히 "야"는 절대 금지)
+- "이 옷 조합", "이런 조합", "그 옷 조합" 같은 주관적 표현
+- "피부톤이랑 잘 어울리는 색이라" 같은 막연한 설명
+- "세련되면서도 깔끔한 느낌 나" 같은 주관적 판단
+- "정말 멋질 거 같아" 같은 감탄 표현
+- "캐주얼하면서도 클래식한 스타일이 될 거야" 같은 추상적 표현
+- "자신감 있게 입고 나갈 수 있을 거 같네" 같은 주관적 판단
+- "피부톤에 따라 다르겠지만" 같은 조건부 설명
+- "대체로", "일반적으로", "보통" 같은 추상적 표현
+- 모든 감탄사나 주관적 판단으로 시작하는 문장
+- "이렇게 입으면" 같은 추상적 표현
+- "딱이야", "완벽해", "좋아", "괜찮아" 같은 감탄 표현
+- "딱일 거 같아", "좋을 거 같아" 같은 추측 표현
+- "~는 깔끔하고 세련된 느낌 주고", "~는 여름 분위기 물씬 나" 같은 막연한 설명
+- "~는 ~한 느낌", "~는 ~한 분위기" 같은 추상적 표현
+- "잘 어울려", "좋아 보여", "멋있어 보여" 같은 주관적 판단
+- "피부톤에 잘 맞는 중성적인 컬러라" 같은 막연한 설명
+- "편하게 입을 수 있을 거야" 같은 추상적 표현
+- "깔끔하고 세련된 느낌 낼 수 있어" 같은 주관적 판단
+- "편하면서도 깔끔한 느낌이 들 거야" 같은 막연한 설명
+- "피부톤에 잘 맞는 색감이라 화사해 보일 거고" 같은 주관적 판단
+- "캐주얼한 무드가 살아날 거 같아" 같은 추상적 표현
+- "소개팅 가는데 딱이네" 같은 주관적 판단
+
+**반말 대화 스타일 (무조건 반말 사용):**
+- 친구처럼 편안하고 자연스럽게 반말로 대화
+- "야", "어", "오" 같은 감탄사나 친근한 호칭으로 시작하지 않기
+- 하드코딩된 템플릿이나 고정된 문구 사용 금지
+- 다양한 표현과 어조 사용 (감탄, 걱정, 확신, 제안 등)
+- 상황에 따라 다른 반응 (칭찬, 조언, 질문 등)
+- 문장 구조를 다양하게 변화시키기
+- 자연스러운 연결어와 전환어 사용
+
+**중요한 규칙:**
+1. 반드시 아래의 구체적인 옷 조합 정보를 자연스럽게 문장에 포함시키기
+2. 여름 시즌에 맞는 시원한 소재의 옷들만 추천
+3. 하드코딩된 예시 문장을 그대로 사용하지 말고, 창의적이고 자연스러운 표현으로 응답하기
+4. "💡 스타일링:", "🎯 적합한 상황:", "✨ 스타일링:", "🎨 스타일리스트 조언:" 같은 고정된 접두사 사용 금지
+5. 스타일링 정보는 자연스럽게 문장에 녹여내기
+6. 무조건 반말로 응답하기 (존댓말 사용 금지)
+7. 간결하고 핵심적인 내용만 전달하기 (불필요한 설명 제거)
+8. 다양한 감정과 어조로 대화하기
+9. **절대 중요: 하나의 아이템당 하나의 색상만 추천하기 (여러 색상 나열 금지)**
+10. "카키, 화이트 재킷"이나 "브라운, 블루 슬랙스" 같은 여러 색상 나열 절대 금지
+11. 반드시 단일 색상으로만 추천: "카키 재킷", "브라운 슬랙스" 형태로만 사용
+12. "~, ~ 색상", "~나 ~ 색상" 같은 여러 색상 제시 절대 금지
+13. **넥타이 언급 절대 금지**: 넥타이, 타이 등 모든 관련 표현 사용 금지
+14. **"정장" 표현 금지**: "정장스러운", "정장적인", "정장느낌" 등 모든 정장 관련 표현 대신 "포멀한" 사용
+15. **체크무늬/패턴 언급 절대 금지**: 체크무늬, 체크, 체크 패턴 등 모든 관련 표현 사용 금지, 단색만 추천
+16. **남성 패션에 부적절한 표현 금지**: "여성스러운", "여성적인", "귀여운" 등의 표현 대신 "세련된", "우아한", "깔끔한" 사용
+17. **같은 색 상하의 조합 절대 금지**: 상의와 하의가 같은 색인 조합 금지 (예: 블랙 셔츠 + 블랙 바지), 반드시 다른 색 조합만 추천
+18. **중복 문장 절대 금지**: 같은 문장이나 비슷한 내용을 반복하지 말고, 한 번만 명확하게 표현
+19. **핏 정보 필수**: 모든 옷에 핏 정보 포함, 핏 정보가 없으면 와이드핏으로 추천 (예: "화이트 와이드 셔츠", "블랙 와이드 슬랙스")
+20. **주머니 관련 표현 절대 금지**: "주머니에 손 넣어서", "포켓에 손 넣고" 등 주머니/포켓 활용 언급 금지
+"""
+
+# 응답 필터용 키워드 매처 (import 시 한 번 구성)
+# 여름에 부적합한 긴 옷 → 여름에 적합한 대체 아이템
+SUMMER_ALTERNATIVES = {
+    "긴팔": "반팔",
+    "롱슬리브": "반팔", 
+    "긴바지": "반바지",
+    "롱팬츠": "반바지",
+    "코트": "반팔",
+    "패딩": "반팔",
+    "니트": "반팔",
+    "스웨터": "반팔",
+    "가디건": "반팔",
+    "블레이저": "반팔"
+}
+SUMMER_INAPPROPRIATE_MATCHER = KeywordAutomaton(list(SUMMER_ALTERNATIVES))
+
+# 소개팅/비즈니스 상황 판단 및 부적절 아이템
+FORMAL_OCCASION_MATCHER = KeywordAutomaton(["소개팅", "데이트", "면접", "출근", "비즈니스", "회사", "미팅", "회의", "오피스"])
+JACKET_MATCHER = KeywordAutomaton(["자켓", "재킷", "블레이저", "블레이져", "재킷"])
+SHORTS_MATCHER = KeywordAutomaton(["반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"])
+INAPPROPRIATE_SHOES_MATCHER = KeywordAutomaton(["덩크", "스니커즈", "운동화", "캔버스", "컨버스"])
+
+# 캐주얼한 아이템 → 포멀한 대체 아이템
+CASUAL_TO_FORMAL = {
+    "티셔츠": ["반팔 셔츠", "반팔 폴로", "반팔 니트"],
+    "그래픽": ["단색", "스트라이프", "체크"],
+    "오버사이즈": ["레귤러핏", "슬림핏"],
+    "와이드": ["레귤러핏", "슬림핏"],
+    "맨투맨": ["반팔 셔츠"],
+    "후드티": ["반팔 셔츠"],
+    "크롭": ["반팔 셔츠"]
+}
+CASUAL_ITEM_MATCHER = KeywordAutomaton(list(CASUAL_TO_FORMAL))
+
+# 중복 제거 대상 색상명
+REPEATED_COLOR_MATCHER = KeywordAutomaton(['화이트', '블랙', '네이비', '베이지', '그레이', '브라운', '카키', '블루', '그린', '옐로우', '핑크', '퍼플'])
+
+# 불필요한 표현 치환 어휘 (어휘 중 하나라도 있을 때만 치환 수행)
+CHECK_PATTERN_MATCHER = KeywordAutomaton(["체크", "깅엄체크", "타탄체크", "윈도체크"])
+SHORTS_EXPRESSION_MATCHER = KeywordAutomaton(["쇼츠", "반바지", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"])
+FORMAL_EXPRESSION_MATCHER = KeywordAutomaton(["정장"])
+INAPPROPRIATE_EXPRESSION_MATCHER = KeywordAutomaton(["여성스러운", "여성적인", "여자같은", "귀여운 느낌", "귀엽게"])
+
+# 핏 정보 추가 대상 "색상 아이템" 조합
+FIT_CLOTHING_ITEMS = ['셔츠', '티셔츠', '폴로', '니트', '스웨터', '블라우스', '가디건', '반팔', '긴팔', 
+                      '슬랙스', '팬츠', '바지', '치노', '데님', '트라우저', '반바지', 
+                      '재킷', '자켓', '코트', '블레이저']
+FIT_COLORS = ['화이트', '블랙', '네이비', '베이지', '그레이', '브라운', '카키', '블루', '그린']
+COLOR_ITEM_PAIR_MATCHER = KeywordAutomaton({
+    (color, item): [f"{color} {item}"] for color in FIT_COLORS for item in FIT_CLOTHING_ITEMS
+})
+
+# 여성 전용 아이템 목록
+FEMALE_ONLY_MATCHER = KeywordAutomaton([
+    "스커트", "드레스", "블라우스", "미디", "미니", "맥시", "원피스",
+    "플리츠", "주름", "리본", "레이스", "프릴", "볼륨", "플레어",
+    "A라인", "H라인", "X라인", "Y라인", "I라인", "O라인",
+    "펌프스", "힐", "웨지", "플랫폼", "스틸레토", "메리제인",
+    "크롭", "캐미솔", "탑", "튜브탑", "할리톱", "오프숄더",
+    "원숄더", "스트랩리스", "백리스", "키홀", "컷아웃", "하프팬츠", "스키니", "숏팬츠"
+])
+
+# 어려운 용어 → 쉬운 용어 매핑
+DIFFICULT_TERMS = {
+    "코듀로이": "면",
+    "덴임": "면",
+    "린넨": "면",
+    "캐시미어": "니트",
+    "알파카": "니트",
+    "모헤어": "니트",
+    "실크": "면",
+    "레이온": "면",
+    "폴리에스터": "면",
+    "스팽덱스": "면",
+    "엘라스테인": "면",
+    "바시티": "면",
+    "옥스포드": "면",
+    "팝린": "면",
+    "트위드": "면",
+    "헤링본": "면",
+    "체크": "무늬",
+    "스트라이프": "줄무늬",
+    "도트": "점무늬",
+    "플라워": "꽃무늬",
+    "지그재그": "지그재그무늬",
+    "하운드스투스": "무늬",
+    "윈도우펜": "무늬",
+    "글렌체크": "무늬",
+    "타탄": "무늬",
+    "플리츠": "주름",
+    "드레이프": "주름",
+    "실루엣": "형태",
+    "퍼스널 컬러": "나에게 맞는 색상",
+    "톤온톤": "같은 색상 계열",
+    "모노톤": "한 가지 색상",
+    "핏감": "핏"
+}
+DIFFICULT_TERM_MATCHER = KeywordAutomaton(list(DIFFICULT_TERMS))
+
 class SimpleFashionExpertService:
     def __init__(self, api_key: str):
         # self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=_get_llm_http_client(),
+            timeout=anthropic.Timeout(settings.LLM_REQUEST_TIMEOUT, connect=5.0)
+        )
+        self.limiter = _get_llm_limiter()
         # API 키 상태 확인
         print(f"🔍 CLAUDE_API_KEY 상태: {'설정됨' if api_key else '설정되지 않음'}")
         print(f"🔍 CLAUDE_API_KEY 길이: {len(api_key) if api_key else 0}")
@@ -889,9 +1109,20 @@ class SimpleFashionExpertService:
 
 
 
-    async def _generate_json_based_response(self, user_input: str, expert_type: FashionExpertType, json_data: dict = None) -> str:
+    async def _generate_json_based_response(self, user_input: str, expert_type: FashionExpertType, json_data: dict = None, outfit_filename: str = None) -> str:
         """JSON 데이터를 기반으로 LLM을 사용하여 자연스럽고 다양한 대화 스타일로 답변 생성"""
         
+        # 같은 착장 내용/전문가/검색 의도의 답변이 충분히 모였으면 LLM 호출 없이 재사용 (검색 조건이 없는 질문은 캐시하지 않음)
+        cache_key = None
+        intent_signature = expert_response_cache_service.intent_signature(user_input) if outfit_filename and json_data else None
+        if intent_signature:
+            document_version = expert_response_cache_service.document_version(json_data)
+            cache_key = expert_response_cache_service.cache_key(outfit_filename, expert_type.value, intent_signature, document_version)
+            cached_response = await expert_response_cache_service.get(cache_key)
+            if cached_response:
+                print(f"⚡ 전문가 답변 캐시 적중: {cache_key}")
+                return cached_response
+        
         # JSON 데이터가 없으면 기본 데이터 사용 (여름 시즌에 맞게, 다양한 색상 조합)
         if not json_data:
             import random
@@ -960,48 +1191,8 @@ class SimpleFashionExpertService:
         # 전문가 프로필 가져오기
         expert_profile = self.expert_profiles.get(expert_type, self.expert_profiles[FashionExpertType.STYLE_ANALYST])
         
-        # 시스템 프롬프트 구성 (구체적인 옷 조합 정보 강조)
-        system_prompt = f"""당신은 {expert_profile['role']}입니다. {expert_profile['focus']}
-
-**🚨 응답 시작 강제 규칙 (절대 위반 금지):**
-- 첫 문장은 무조건 구체적인 옷 조합으로 시작해야 함
-- "{json_data.get('top', {}).get('color', '')} {json_data.get('top', {}).get('item', '')}에 {json_data.get('bottom', {}).get('color', '')} {json_data.get('bottom', {}).get('item', '')}가 잘 어울려" 같은 형태로 시작
-- "이 옷 조합 좋아", "그 옷 조합 좋아", "저 옷 조합 좋아" 같은 주관적 표현 절대 금지
-- 주관적 판단, 감탄사, 추상적 설명 절대 금지
-- 바로 구체적인 옷 조합 분석으로 시작해야 함
-
-**🔥 핵심 원칙: 첫 문장은 반드시 구체적인 옷 조합으로 시작!**
-- 첫 문장은 무조건 "{json_data.get('top', {}).get('color', '')} {json_data.get('top', {}).get('item', '')}에 {json_data.get('bottom', {}).get('color', '')} {json_data.get('bottom', {}).get('item', '')}가 잘 어울려" 같은 형태로 시작
-- 주관적 판단, 감탄사, 추상적 설명 절대 금지
-- 바로 구체적인 옷 조합 분석으로 시작해야 함
-
-**🚨 절대 금지: 첫 문장에서 주관적 뉘앙스 표현**
-- "이 조합 좋아", "그 조합 좋아", "저 조합 좋아" (가장 중요한 금지)
-- "이 조합이 딱이네", "그 옷 조합이 딱이야", "진짜 좋아", "너무 좋아", "완전 좋아"
-- "그 옷 조합 괜찮아", "이 옷 조합 괜찮아", "저 옷 조합 괜찮아"
-- "야", "어", "오" 같은 감탄사 (특히 "야"는 절대 금지)
-- "이 옷 조합", "이런 조합", "그 옷 조합" 같은 주관적 표현
-- "피부톤이랑 잘 어울리는 색이라" 같은 막연한 설명
-- "세련되면서도 깔끔한 느낌 나" 같은 주관적 판단
-- "정말 멋질 거 같아" 같은 감탄 표현
-- "캐주얼하면서도 클래식한 스타일이 될 거야" 같은 추상적 표현
-- "자신감 있게 입고 나갈 수 있을 거 같네" 같은 주관적 판단
-- "피부톤에 따라 다르겠지만" 같은 조건부 설명
-- "대체로", "일반적으로", "보통" 같은 추상적 표현
-- 모든 감탄사나 주관적 판단으로 시작하는 문장
-- "이렇게 입으면" 같은 추상적 표현
-- "딱이야", "완벽해", "좋아", "괜찮아" 같은 감탄 표현
-- "딱일 거 같아", "좋을 거 같아" 같은 추측 표현
-- "~는 깔끔하고 세련된 느낌 주고", "~는 여름 분위기 물씬 나" 같은 막연한 설명
-- "~는 ~한 느낌", "~는 ~한 분위기" 같은 추상적 표현
-- "잘 어울려", "좋아 보여", "멋있어 보여" 같은 주관적 판단
-- "피부톤에 잘 맞는 중성적인 컬러라" 같은 막연한 설명
-- "편하게 입을 수 있을 거야" 같은 추상적 표현
-- "깔끔하고 세련된 느낌 낼 수 있어" 같은 주관적 판단
-- "편하면서도 깔끔한 느낌이 들 거야" 같은 막연한 설명
-- "피부톤에 잘 맞는 색감이라 화사해 보일 거고" 같은 주관적 판단
-- "캐주얼한 무드가 살아날 거 같아" 같은 추상적 표현
-- "소개팅 가는데 딱이네" 같은 주관적 판단
+        # 시스템 프롬프트 구성 (공통 규칙은 캐시되는 정적 블록, 역할/옷 조합/사용자 입력은 그 뒤 블록)
+        dynamic_prompt = f"""당신은 {expert_profile['role']}입니다. {expert_profile['focus']}
 
 **✅ 올바른 시작 예시 (반드시 이 형태로 시작):**
 - "{json_data.get('top', {}).get('color', '')} {json_data.get('top', {}).get('item', '')}랑 {json_data.get('bottom', {}).get('color', '')} {json_data.get('bottom', {}).get('item', '')}가 잘 어울려"
@@ -1014,41 +1205,11 @@ class SimpleFashionExpertService:
 - 신발: {json_data.get('shoes', {}).get('color', '')} {json_data.get('shoes', {}).get('item', '')}
 - 스타일링: {json_data.get('styling_methods', {}).get('styling_points', '')}
 
-**반말 대화 스타일 (무조건 반말 사용):**
-- 친구처럼 편안하고 자연스럽게 반말로 대화
-- "야", "어", "오" 같은 감탄사나 친근한 호칭으로 시작하지 않기
-- 하드코딩된 템플릿이나 고정된 문구 사용 금지
-- 다양한 표현과 어조 사용 (감탄, 걱정, 확신, 제안 등)
-- 상황에 따라 다른 반응 (칭찬, 조언, 질문 등)
-- 문장 구조를 다양하게 변화시키기
-- 자연스러운 연결어와 전환어 사용
-
-**중요한 규칙:**
-1. 반드시 위의 구체적인 옷 조합 정보를 자연스럽게 문장에 포함시키기
-2. 여름 시즌에 맞는 시원한 소재의 옷들만 추천
-3. 하드코딩된 예시 문장을 그대로 사용하지 말고, 창의적이고 자연스러운 표현으로 응답하기
-4. "💡 스타일링:", "🎯 적합한 상황:", "✨ 스타일링:", "🎨 스타일리스트 조언:" 같은 고정된 접두사 사용 금지
-5. 스타일링 정보는 자연스럽게 문장에 녹여내기
-6. 무조건 반말로 응답하기 (존댓말 사용 금지)
-7. 간결하고 핵심적인 내용만 전달하기 (불필요한 설명 제거)
-8. 다양한 감정과 어조로 대화하기
-9. **절대 중요: 하나의 아이템당 하나의 색상만 추천하기 (여러 색상 나열 금지)**
-10. "카키, 화이트 재킷"이나 "브라운, 블루 슬랙스" 같은 여러 색상 나열 절대 금지
-11. 반드시 단일 색상으로만 추천: "카키 재킷", "브라운 슬랙스" 형태로만 사용
-12. "~, ~ 색상", "~나 ~ 색상" 같은 여러 색상 제시 절대 금지
-13. **넥타이 언급 절대 금지**: 넥타이, 타이 등 모든 관련 표현 사용 금지
-14. **"정장" 표현 금지**: "정장스러운", "정장적인", "정장느낌" 등 모든 정장 관련 표현 대신 "포멀한" 사용
-15. **체크무늬/패턴 언급 절대 금지**: 체크무늬, 체크, 체크 패턴 등 모든 관련 표현 사용 금지, 단색만 추천
-16. **남성 패션에 부적절한 표현 금지**: "여성스러운", "여성적인", "귀여운" 등의 표현 대신 "세련된", "우아한", "깔끔한" 사용
-17. **같은 색 상하의 조합 절대 금지**: 상의와 하의가 같은 색인 조합 금지 (예: 블랙 셔츠 + 블랙 바지), 반드시 다른 색 조합만 추천
-18. **중복 문장 절대 금지**: 같은 문장이나 비슷한 내용을 반복하지 말고, 한 번만 명확하게 표현
-19. **핏 정보 필수**: 모든 옷에 핏 정보 포함, 핏 정보가 없으면 와이드핏으로 추천 (예: "화이트 와이드 셔츠", "블랙 와이드 슬랙스")
-20. **주머니 관련 표현 절대 금지**: "주머니에 손 넣어서", "포켓에 손 넣고" 등 주머니/포켓 활용 언급 금지
-
 **사용자 입력:**
 {user_input}
 
 위의 구체적인 옷 조합 정보를 바탕으로 간결하고 핵심적인 패션 조언을 제공해주세요. 반드시 응답 시작 부분에 추천하는 옷 조합을 명확하게 명시하고, 반말로 간결하게 응답해주세요."""
+        system_prompt = self._build_system_blocks(JSON_RESPONSE_RULES_PROMPT, dynamic_prompt=dynamic_prompt)
         
         # 사용자 프롬프트 (구체적인 옷 조합 강조)
         user_prompt = f"이 {json_data.get('top', {}).get('color', '')} {json_data.get('top', {}).get('item', '')} + {json_data.get('bottom', {}).get('color', '')} {json_data.get('bottom', {}).get('item', '')} 조합에 대해 {expert_profile['role']}의 관점에서 반말로 간결하게 조언해주세요. 반드시 첫 문장은 '{json_data.get('top', {}).get('color', '')} {json_data.get('top', {}).get('item', '')}에 {json_data.get('bottom', {}).get('color', '')} {json_data.get('bottom', {}).get('item', '')}가 잘 어울려' 같은 형태로 시작하고, 실제 옷 정보를 명확하게 언급해주세요."
@@ -1087,6 +1248,10 @@ class SimpleFashionExpertService:
             # 어려운 용어 제거 필터링
             response = self._remove_difficult_terms(response)
             
+            # 후처리까지 끝난 답변을 캐시 풀에 추가
+            if cache_key:
+                await expert_response_cache_service.put(cache_key, response)
+            
             return response
             
         except Exception as e:
@@ -1099,12 +1264,6 @@ class SimpleFashionExpertService:
         if self.current_season != "summer":
             return response
         
-        # 여름에 부적합한 긴 옷들 체크
-        summer_inappropriate_items = [
-            "긴팔", "롱슬리브", "긴바지", "롱팬츠", 
-            "코트", "패딩", "니트", "스웨터", "가디건", "블레이저"
-        ]
-        
         # JSON 데이터에서 아이템 확인
         top_item = json_data.get("top", {}).get("item", "").lower()
         bottom_item = json_data.get("bottom", {}).get("item", "").lower()
@@ -1133,28 +1292,13 @@ class SimpleFashionExpertService:
             response += random.choice(color_change_phrases)
         
         # 여름에 부적합한 아이템이 포함되어 있으면 수정
-        has_inappropriate_item = any(item in top_item for item in summer_inappropriate_items) or \
-                               any(item in bottom_item for item in summer_inappropriate_items)
+        has_inappropriate_item = SUMMER_INAPPROPRIATE_MATCHER.contains_any(top_item) or \
+                               SUMMER_INAPPROPRIATE_MATCHER.contains_any(bottom_item)
         
         if has_inappropriate_item:
-            # 여름에 적합한 대체 아이템으로 수정
-            summer_alternatives = {
-                "긴팔": "반팔",
-                "롱슬리브": "반팔", 
-                "긴바지": "반바지",
-                "롱팬츠": "반바지",
-                "코트": "반팔",
-                "패딩": "반팔",
-                "니트": "반팔",
-                "스웨터": "반팔",
-                "가디건": "반팔",
-                "블레이저": "반팔"
-            }
-            
             # 응답에서 부적합한 아이템을 여름에 적합한 아이템으로 교체
-            for inappropriate, appropriate in summer_alternatives.items():
-                if inappropriate in response:
-                    response = response.replace(inappropriate, appropriate)
+            for inappropriate in SUMMER_INAPPROPRIATE_MATCHER.keywords_in(response):
+                response = response.replace(inappropriate, SUMMER_ALTERNATIVES[inappropriate])
             
             # 여름 시즌 강조 문구 추가 (더 자연스럽게)
             summer_phrases = [
@@ -1171,8 +1315,7 @@ class SimpleFashionExpertService:
     def _filter_for_formal_occasion(self, response: str, json_data: dict, user_input: str) -> str:
         """소개팅/비즈니스 상황에서는 자켓+반바지 조합을 엄격하게 제외"""
         # 소개팅/비즈니스 상황 체크
-        formal_keywords = ["소개팅", "데이트", "면접", "출근", "비즈니스", "회사", "미팅", "회의", "오피스"]
-        is_formal_occasion = any(keyword in user_input.lower() for keyword in formal_keywords)
+        is_formal_occasion = FORMAL_OCCASION_MATCHER.contains_any(user_input.lower())
         
         if not is_formal_occasion:
             return response
@@ -1182,11 +1325,8 @@ class SimpleFashionExpertService:
         bottom_item = json_data.get("bottom", {}).get("item", "").lower()
         
         # 자켓+반바지 조합 체크
-        jacket_keywords = ["자켓", "재킷", "블레이저", "블레이져", "재킷"]
-        shorts_keywords = ["반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"]
-        
-        has_jacket = any(k in top_item for k in jacket_keywords)
-        has_shorts = any(k in bottom_item for k in shorts_keywords)
+        has_jacket = JACKET_MATCHER.contains_any(top_item)
+        has_shorts = SHORTS_MATCHER.contains_any(bottom_item)
         
         # 자켓이 있으면 완전히 제외 (여름 시즌 + 소개팅 부적절)
         if has_jacket:
@@ -1198,44 +1338,31 @@ class SimpleFashionExpertService:
         
         # 부적절한 신발 체크
         shoes_item = json_data.get("shoes", {}).get("item", "").lower()
-        inappropriate_shoes = ["덩크", "스니커즈", "운동화", "캔버스", "컨버스"]
-        has_inappropriate_shoes = any(k in shoes_item for k in inappropriate_shoes)
+        has_inappropriate_shoes = INAPPROPRIATE_SHOES_MATCHER.contains_any(shoes_item)
         
         if has_inappropriate_shoes:
             return "죄송해, 소개팅에는 운동화가 부적절해. 구두나 로퍼를 추천해줄게!"
         
-        # 캐주얼한 아이템들을 포멀한 아이템으로 교체
-        casual_to_formal = {
-            "티셔츠": ["반팔 셔츠", "반팔 폴로", "반팔 니트"],
-            "그래픽": ["단색", "스트라이프", "체크"],
-            "오버사이즈": ["레귤러핏", "슬림핏"],
-            "와이드": ["레귤러핏", "슬림핏"],
-            "맨투맨": ["반팔 셔츠"],
-            "후드티": ["반팔 셔츠"],
-            "크롭": ["반팔 셔츠"]
-        }
-        
-        # 캐주얼한 아이템이 있으면 포멀한 아이템으로 교체
-        for casual_item, formal_alternatives in casual_to_formal.items():
-            if casual_item in top_item:
-                import random
-                new_item = random.choice(formal_alternatives)
-                
-                # 응답에서 아이템 교체
-                if casual_item == "그래픽":
-                    response = response.replace("그래픽", new_item)
-                elif casual_item == "오버사이즈":
-                    response = response.replace("오버사이즈", new_item)
-                elif casual_item == "와이드":
-                    response = response.replace("와이드", new_item)
-                elif casual_item == "티셔츠":
-                    response = response.replace("티셔츠", new_item.split()[-1])
-                elif casual_item in ["맨투맨", "후드티", "크롭"]:
-                    response = response.replace(casual_item, new_item.split()[-1])
-                
-                # 교체 이유 설명 추가
-                response += f" 소개팅에는 {new_item}가 더 적합해!"
-                break  # 첫 번째 매칭되는 아이템만 교체
+        # 캐주얼한 아이템이 있으면 포멀한 아이템으로 교체 (첫 번째 매칭되는 아이템만)
+        casual_item = CASUAL_ITEM_MATCHER.first_in(top_item)
+        if casual_item:
+            import random
+            new_item = random.choice(CASUAL_TO_FORMAL[casual_item])
+            
+            # 응답에서 아이템 교체
+            if casual_item == "그래픽":
+                response = response.replace("그래픽", new_item)
+            elif casual_item == "오버사이즈":
+                response = response.replace("오버사이즈", new_item)
+            elif casual_item == "와이드":
+                response = response.replace("와이드", new_item)
+            elif casual_item == "티셔츠":
+                response = response.replace("티셔츠", new_item.split()[-1])
+            elif casual_item in ["맨투맨", "후드티", "크롭"]:
+                response = response.replace(casual_item, new_item.split()[-1])
+            
+            # 교체 이유 설명 추가
+            response += f" 소개팅에는 {new_item}가 더 적합해!"
         
         return response
 
@@ -1246,8 +1373,7 @@ class SimpleFashionExpertService:
         print(f"🔍 필터링 전: {response}")
         
         # 1단계: 색상 중복 제거 (예: "블랙 블랙" -> "블랙")
-        color_names = ['화이트', '블랙', '네이비', '베이지', '그레이', '브라운', '카키', '블루', '그린', '옐로우', '핑크', '퍼플']
-        for color in color_names:
+        for color in REPEATED_COLOR_MATCHER.keywords_in(response):
             # 같은 색상이 연속으로 반복되는 경우 제거
             response = re.sub(f'{color}\\s+{color}', color, response)
         
@@ -1441,10 +1567,11 @@ class SimpleFashionExpertService:
             '윈도체크': ''
         }
         
-        for old_term, new_term in check_pattern_replacements.items():
-            if old_term in response:
-                response = response.replace(old_term, new_term)
-                print(f"🔄 체크무늬 제거: '{old_term}' → '{new_term}'")
+        if CHECK_PATTERN_MATCHER.contains_any(response):
+            for old_term, new_term in check_pattern_replacements.items():
+                if old_term in response:
+                    response = response.replace(old_term, new_term)
+                    print(f"🔄 체크무늬 제거: '{old_term}' → '{new_term}'")
         
         # 3. 🔥 쇼츠 관련 표현을 와이드 슬랙스로 변경 (새로 추가)
         shorts_replacements = {
@@ -1463,10 +1590,11 @@ class SimpleFashionExpertService:
             '그레이 쇼츠': '그레이 와이드 슬랙스'
         }
         
-        for old_term, new_term in shorts_replacements.items():
-            if old_term in response:
-                response = response.replace(old_term, new_term)
-                print(f"🔄 쇼츠 변경: '{old_term}' → '{new_term}'")
+        if SHORTS_EXPRESSION_MATCHER.contains_any(response):
+            for old_term, new_term in shorts_replacements.items():
+                if old_term in response:
+                    response = response.replace(old_term, new_term)
+                    print(f"🔄 쇼츠 변경: '{old_term}' → '{new_term}'")
         
         # 4. 정장 관련 표현을 포멀한 표현으로 변경
         formal_replacements = {
@@ -1485,10 +1613,11 @@ class SimpleFashionExpertService:
             '정장분위기': '포멀한 분위기'
         }
         
-        for old_term, new_term in formal_replacements.items():
-            if old_term in response:
-                response = response.replace(old_term, new_term)
-                print(f"🔄 정장 표현 변경: '{old_term}' → '{new_term}'")
+        if FORMAL_EXPRESSION_MATCHER.contains_any(response):
+            for old_term, new_term in formal_replacements.items():
+                if old_term in response:
+                    response = response.replace(old_term, new_term)
+                    print(f"🔄 정장 표현 변경: '{old_term}' → '{new_term}'")
         
         # 5. 남성 패션에 부적절한 표현들 제거
         inappropriate_expressions = {
@@ -1501,10 +1630,11 @@ class SimpleFashionExpertService:
             '귀엽게': '깔끔하게'
         }
         
-        for old_term, new_term in inappropriate_expressions.items():
-            if old_term in response:
-                response = response.replace(old_term, new_term)
-                print(f"🔄 부적절한 표현 변경: '{old_term}' → '{new_term}'")
+        if INAPPROPRIATE_EXPRESSION_MATCHER.contains_any(response):
+            for old_term, new_term in inappropriate_expressions.items():
+                if old_term in response:
+                    response = response.replace(old_term, new_term)
+                    print(f"🔄 부적절한 표현 변경: '{old_term}' → '{new_term}'")
         
         # 6. 주머니 관련 표현 제거
         pocket_expressions = [
@@ -1608,47 +1738,12 @@ class SimpleFashionExpertService:
         
         print(f"📚 어려운 용어 제거 전: {response}")
         
-        # 어려운 용어 → 쉬운 용어 매핑
-        difficult_terms = {
-            "코듀로이": "면",
-            "덴임": "면",
-            "린넨": "면",
-            "캐시미어": "니트",
-            "알파카": "니트",
-            "모헤어": "니트",
-            "실크": "면",
-            "레이온": "면",
-            "폴리에스터": "면",
-            "스팽덱스": "면",
-            "엘라스테인": "면",
-            "바시티": "면",
-            "옥스포드": "면",
-            "팝린": "면",
-            "트위드": "면",
-            "헤링본": "면",
-            "체크": "무늬",
-            "스트라이프": "줄무늬",
-            "도트": "점무늬",
-            "플라워": "꽃무늬",
-            "지그재그": "지그재그무늬",
-            "하운드스투스": "무늬",
-            "윈도우펜": "무늬",
-            "글렌체크": "무늬",
-            "타탄": "무늬",
-            "플리츠": "주름",
-            "드레이프": "주름",
-            "실루엣": "형태",
-            "퍼스널 컬러": "나에게 맞는 색상",
-            "톤온톤": "같은 색상 계열",
-            "모노톤": "한 가지 색상",
-            "핏감": "핏"
-        }
-        
         original_response = response
         
-        # 어려운 용어를 쉬운 용어로 변경
-        for difficult, easy in difficult_terms.items():
-            response = response.replace(difficult, easy)
+        # 어려운 용어를 쉬운 용어로 변경 (하나라도 포함된 경우에만 순서대로 치환)
+        if DIFFICULT_TERM_MATCHER.contains_any(response):
+            for difficult, easy in DIFFICULT_TERMS.items():
+                response = response.replace(difficult, easy)
         
         if original_response != response:
             print(f"✅ 어려운 용어 제거 완료: {response[:100]}...")
@@ -1680,42 +1775,24 @@ class SimpleFashionExpertService:
             response += '.'
         
         # 2. 핏 정보 추가 (색상 다음에 바로 옷이 나오면 와이드 핏 추가)
-        # 단순하고 확실한 방법으로 교체
-        clothing_items = ['셔츠', '티셔츠', '폴로', '니트', '스웨터', '블라우스', '가디건', '반팔', '긴팔', 
-                         '슬랙스', '팬츠', '바지', '치노', '데님', '트라우저', '반바지', 
-                         '재킷', '자켓', '코트', '블레이저']
-        
-        colors = ['화이트', '블랙', '네이비', '베이지', '그레이', '브라운', '카키', '블루', '그린']
-        
-        for color in colors:
-            for item in clothing_items:
-                # "색상 아이템" -> "색상 와이드 아이템" (해당 패턴에 핏 정보가 없는 경우만)
-                pattern = f"{color} {item}"
-                replacement = f"{color} 와이드 {item}"
-                
-                # 해당 패턴이 있고, 그 앞뒤에 핏 정보가 없는지 확인
-                if pattern in response:
-                    # 해당 패턴 주변에 핏 정보가 있는지 체크
-                    pattern_with_fit = f"{color} (와이드|슬림|레귤러|오버|타이트) {item}"
-                    if not re.search(pattern_with_fit, response):
-                        response = response.replace(pattern, replacement)
-                        print(f"🔄 핏 정보 추가: '{pattern}' -> '{replacement}'")
+        # 응답에 있는 "색상 아이템" 조합만 확인
+        for pattern, (color, item) in COLOR_ITEM_PAIR_MATCHER.find_all(response):
+            # "색상 아이템" -> "색상 와이드 아이템" (해당 패턴에 핏 정보가 없는 경우만)
+            replacement = f"{color} 와이드 {item}"
+            
+            # 해당 패턴이 있고, 그 앞뒤에 핏 정보가 없는지 확인
+            if pattern in response:
+                # 해당 패턴 주변에 핏 정보가 있는지 체크
+                pattern_with_fit = f"{color} (와이드|슬림|레귤러|오버|타이트) {item}"
+                if not re.search(pattern_with_fit, response):
+                    response = response.replace(pattern, replacement)
+                    print(f"🔄 핏 정보 추가: '{pattern}' -> '{replacement}'")
         
         print(f"✅ 중복 제거 및 핏 추가 완료: {response}")
         return response
 
     def _filter_female_only_items(self, response: str, json_data: dict) -> str:
         """여성 전용 아이템이 포함된 응답 필터링"""
-        # 여성 전용 아이템 목록
-        female_only_items = [
-            "스커트", "드레스", "블라우스", "미디", "미니", "맥시", "원피스",
-            "플리츠", "주름", "리본", "레이스", "프릴", "볼륨", "플레어",
-            "A라인", "H라인", "X라인", "Y라인", "I라인", "O라인",
-            "펌프스", "힐", "웨지", "플랫폼", "스틸레토", "메리제인",
-            "크롭", "캐미솔", "탑", "튜브탑", "할리톱", "오프숄더",
-            "원숄더", "스트랩리스", "백리스", "키홀", "컷아웃", "하프팬츠", "스키니", "숏팬츠"
-        ]
-        
         # JSON 데이터에서 여성 전용 아이템 체크
         for category, item_info in json_data.items():
             if isinstance(item_info, dict):
@@ -1725,7 +1802,7 @@ class SimpleFashionExpertService:
                 
                 all_item_text = f"{item_name} {item_style} {item_fit}".lower().replace(" ", "")
                 
-                for female_item in female_only_items:
+                for female_item in FEMALE_ONLY_MATCHER.keywords_in(all_item_text):
                     if female_item in all_item_text:
                         print(f"🚫 여성 전용 아이템 발견: {female_item} in {category}")
                         # 여성 전용 아이템을 남성용으로 대체
@@ -1906,8 +1983,8 @@ class SimpleFashionExpertService:
         
         return response
 
-    async def get_single_expert_analysis(self, request: ExpertAnalysisRequest):
-        """단일 전문가 분석"""
+    async def get_single_expert_analysis(self, request: ExpertAnalysisRequest, outfit_filename: str = None):
+        """단일 전문가 분석 (outfit_filename이 있으면 전문가 답변 캐시 사용)"""
         expert_profile = self.expert_profiles[request.expert_type]
         
         # print(f"\n🚀 전문가 분석 시작: {request.expert_type.value}")
@@ -1920,7 +1997,8 @@ class SimpleFashionExpertService:
             json_based_response = await self._generate_json_based_response(
                 request.user_input, 
                 request.expert_type,
-                request.json_data
+                request.json_data,
+                outfit_filename=outfit_filename
             )
             return {
                 "expert_type": request.expert_type.value,
@@ -1991,42 +2069,92 @@ class SimpleFashionExpertService:
         
         return synthesis
     
-    async def _call_openai_async(self, system_prompt: str, user_prompt: str) -> str:
-        """비동기 OpenAI 호출"""
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self._call_openai_sync,
-            system_prompt,
-            user_prompt
-        )
-        return response
+    async def measure_prompt_cache_prefix(self) -> Optional[int]:
+        """공통 규칙 블록의 토큰 수를 messages.count_tokens로 측정 (최소 캐시 길이 미만이면 이후 요청에서 cache_control 생략)"""
+        global _prompt_cache_prefix_tokens, _prompt_cache_prefix_cacheable
+        if not settings.PROMPT_CACHE_ENABLED:
+            return None
+        
+        try:
+            messages = [{"role": "user", "content": "안녕"}]
+            with_rules = await self.client.messages.count_tokens(
+                model=settings.LLM_MODEL_NAME,
+                system=[{"type": "text", "text": JSON_RESPONSE_RULES_PROMPT}],
+                messages=messages
+            )
+            without_rules = await self.client.messages.count_tokens(model=settings.LLM_MODEL_NAME, messages=messages)
+            _prompt_cache_prefix_tokens = with_rules.input_tokens - without_rules.input_tokens
+            _prompt_cache_prefix_cacheable = _prompt_cache_prefix_tokens >= settings.PROMPT_CACHE_MIN_TOKENS
+            status = "캐시 가능" if _prompt_cache_prefix_cacheable else "최소 길이 미만 → cache_control 생략"
+            print(f"🧮 공통 규칙 프롬프트 {_prompt_cache_prefix_tokens} 토큰 (최소 {settings.PROMPT_CACHE_MIN_TOKENS}, {status})")
+            return _prompt_cache_prefix_tokens
+        except Exception as e:
+            logger.error(f"프롬프트 캐시 길이 측정 실패: {e}")
+            return None
     
-    def _call_openai_sync(self, system_prompt: str, user_prompt: str) -> str:
-        # """동기 OpenAI 호출"""
-        # response = self.client.chat.completions.create(
-        #     model=settings.LLM_MODEL_NAME,
-        #     messages=[
-        #         {"role": "system", "content": system_prompt},
-        #         {"role": "user", "content": user_prompt}
-        #     ],
-        #     max_tokens=settings.LLM_MAX_TOKENS,
-        #     temperature=settings.LLM_TEMPERATURE
-        # )
-        # content = response.choices[0].message.content
-        # if content is None:
-        #     return "응답을 생성할 수 없습니다."
-        # return content 
-        """Claude API 호출로 변경"""
-        response = self.client.messages.create(
-            model=settings.LLM_MODEL_NAME,
-            max_tokens=settings.LLM_MAX_TOKENS,
-            temperature=settings.LLM_TEMPERATURE,
-            system=system_prompt,  # Claude는 system 파라미터 사용
-            messages=[
-                {"role": "user", "content": user_prompt}
-            ]
-        )
+    def _build_system_blocks(self, *static_prompts: str, dynamic_prompt: str = None) -> list:
+        """system 블록 구성 (정적 프롬프트마다 cache_control 지정, 요청마다 바뀌는 내용은 캐시 구간 뒤에 붙임)"""
+        blocks = []
+        for static_prompt in static_prompts:
+            block = {"type": "text", "text": static_prompt}
+            if settings.PROMPT_CACHE_ENABLED and _prompt_cache_prefix_cacheable is not False:
+                block["cache_control"] = {"type": "ephemeral"}
+            blocks.append(block)
+        if dynamic_prompt:
+            blocks.append({"type": "text", "text": dynamic_prompt})
+        return blocks
+    
+    async def _record_prompt_cache_usage(self, usage):
+        """응답 usage의 캐시 읽기/쓰기 토큰 수 누적 (전체 워커 합산, 실패해도 응답에는 영향 없음)"""
+        if usage is None:
+            return
+        
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_creation_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+        commands = [
+            ("hincrby", PROMPT_CACHE_STATS_KEY, "requests", 1),
+            ("hincrby", PROMPT_CACHE_STATS_KEY, "input_tokens", getattr(usage, "input_tokens", None) or 0),
+            ("hincrby", PROMPT_CACHE_STATS_KEY, "output_tokens", getattr(usage, "output_tokens", None) or 0),
+            ("hincrby", PROMPT_CACHE_STATS_KEY, "cache_read_input_tokens", cache_read_tokens),
+            ("hincrby", PROMPT_CACHE_STATS_KEY, "cache_creation_input_tokens", cache_creation_tokens)
+        ]
+        if cache_read_tokens:
+            commands.append(("hincrby", PROMPT_CACHE_STATS_KEY, "cache_hit_requests", 1))
+        await async_redis_service.execute_pipeline(commands)
+    
+    async def get_prompt_cache_stats(self) -> dict:
+        """프롬프트 캐시 토큰 통계 (입력 토큰 중 캐시에서 읽은 비율 포함)"""
+        results = await async_redis_service.execute_pipeline([("hgetall", PROMPT_CACHE_STATS_KEY)])
+        counters = {field: int(value) for field, value in (results[0] if results else {}).items()}
+        cache_read_tokens = counters.get("cache_read_input_tokens", 0)
+        total_input_tokens = counters.get("input_tokens", 0) + counters.get("cache_creation_input_tokens", 0) + cache_read_tokens
+        return {
+            "enabled": settings.PROMPT_CACHE_ENABLED,
+            "prefix_tokens": _prompt_cache_prefix_tokens,
+            "min_cacheable_tokens": settings.PROMPT_CACHE_MIN_TOKENS,
+            "prefix_cacheable": _prompt_cache_prefix_cacheable,
+            "requests": counters.get("requests", 0),
+            "cache_hit_requests": counters.get("cache_hit_requests", 0),
+            "input_tokens": counters.get("input_tokens", 0),
+            "output_tokens": counters.get("output_tokens", 0),
+            "cache_read_input_tokens": cache_read_tokens,
+            "cache_creation_input_tokens": counters.get("cache_creation_input_tokens", 0),
+            "cached_input_ratio": round(cache_read_tokens / total_input_tokens, 4) if total_input_tokens else 0.0
+        }
+    
+    async def _call_openai_async(self, system_prompt: str | list, user_prompt: str) -> str:
+        """비동기 Claude 호출 (AsyncAnthropic, 동시 호출 제한 적용, system은 문자열 또는 캐시 블록 목록)"""
+        async with self.limiter:
+            response = await self.client.messages.create(
+                model=settings.LLM_MODEL_NAME,
+                max_tokens=settings.LLM_MAX_TOKENS,
+                temperature=settings.LLM_TEMPERATURE,
+                system=system_prompt,  # Claude는 system 파라미터 사용
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
+        await self._record_prompt_cache_usage(response.usage)
         content = response.content[0].text  # Claude 응답 구조
         if content is None:
             return "응답을 생성할 수 없습니다."
@@ -2354,12 +2482,13 @@ class SimpleFashionExpertService:
         
         # JSON 데이터 기반 응답 시도 (새로운 방식)
         if request.json_data:
-            async for chunk in self._generate_json_based_response_stream(
+            chunks = self._generate_json_based_response_stream(
                 request.user_input, 
                 request.expert_type,
                 request.json_data
-            ):
-                yield chunk
+            )
+            async for frame in self._paced_frames(self._coalesce_stream(chunks), request.typing_delay_ms):
+                yield frame
             return
         
         # 참고 데이터 기반 직접 응답 시도
@@ -2368,12 +2497,88 @@ class SimpleFashionExpertService:
             request.expert_type
         )
         
-        # 참고 데이터 응답을 스트리밍으로 변환
-        for i in range(0, len(reference_based_response), 10):  # 10글자씩 청크
-            chunk = reference_based_response[i:i+10]
-            if chunk:
+        # 이미 완성된 응답이므로 바로 전송 (타이핑 효과 요청 시에만 나눠서 전송)
+        if request.typing_delay_ms:
+            async for frame in self._paced_frames(self._split_text(reference_based_response), request.typing_delay_ms):
+                yield frame
+        elif reference_based_response:
+            yield reference_based_response
+    
+    async def _split_text(self, text: str):
+        """완성된 텍스트를 타이핑 효과용 청크로 분할"""
+        chunk_size = max(1, settings.STREAM_TYPING_CHUNK_CHARS)
+        for i in range(0, len(text), chunk_size):
+            yield text[i:i + chunk_size]
+    
+    async def _paced_frames(self, frames, typing_delay_ms: Optional[int]):
+        """요청에 typing_delay_ms가 있을 때만 프레임 사이에 지연 추가 (기본은 도착 즉시 전송)"""
+        delay = (typing_delay_ms or 0) / 1000
+        first = True
+        async for frame in frames:
+            if delay > 0 and not first:
+                await asyncio.sleep(delay)
+            first = False
+            yield frame
+    
+    async def _coalesce_stream(self, chunks):
+        """토큰을 바이트 수/시간 창 기준으로 프레임으로 묶어 전송 (설정이 0이면 토큰 도착 즉시 전송)"""
+        max_bytes = settings.STREAM_COALESCE_BYTES
+        window = settings.STREAM_COALESCE_WINDOW_MS / 1000
+        
+        if max_bytes <= 0 and window <= 0:
+            async for chunk in chunks:
                 yield chunk
-                await asyncio.sleep(0.05)  # 50ms 딜레이로 자연스러운 타이핑 효과
+            return
+        
+        # 업스트림을 별도 태스크로 읽어 큐에 적재 (시간 창이 끝나면 다음 토큰을 기다리지 않고 전송)
+        queue: asyncio.Queue = asyncio.Queue()
+        end_of_stream = object()
+        
+        async def pump():
+            try:
+                async for chunk in chunks:
+                    await queue.put(chunk)
+            finally:
+                await queue.put(end_of_stream)
+        
+        pump_task = asyncio.create_task(pump())
+        loop = asyncio.get_running_loop()
+        buffer = []
+        buffered_bytes = 0
+        deadline = None
+        
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                try:
+                    chunk = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    chunk = None
+                
+                if chunk is end_of_stream:
+                    break
+                
+                if chunk:
+                    buffer.append(chunk)
+                    buffered_bytes += len(chunk.encode("utf-8"))
+                    if deadline is None and window > 0:
+                        deadline = loop.time() + window
+                
+                window_elapsed = deadline is not None and loop.time() >= deadline
+                if buffer and ((max_bytes > 0 and buffered_bytes >= max_bytes) or window_elapsed):
+                    yield "".join(buffer)
+                    buffer = []
+                    buffered_bytes = 0
+                    deadline = None
+            
+            if buffer:
+                yield "".join(buffer)
+            
+            # 업스트림 예외는 그대로 전달
+            await pump_task
+        finally:
+            if not pump_task.done():
+                pump_task.cancel()
     
     async def _generate_json_based_response_stream(self, user_input: str, expert_type: FashionExpertType, json_data: dict):
         """JSON 데이터 기반 스트리밍 응답 생성"""
@@ -2406,25 +2611,23 @@ class SimpleFashionExpertService:
             logger.error(error_msg)
             yield error_msg
     
-    async def _call_claude_stream(self, system_prompt: str, user_prompt: str):
+    async def _call_claude_stream(self, system_prompt: str | list, user_prompt: str):
         """Claude API 스트리밍 호출"""
         try:
-            # Claude API 스트리밍 호출 (anthropic 라이브러리 사용)
-            stream = self.client.messages.create(
-                model=settings.LLM_MODEL_NAME,
-                max_tokens=1000,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-                stream=True
-            )
-            
-            for chunk in stream:
-                if chunk.type == "content_block_delta":
-                    if chunk.delta.type == "text_delta":
-                        text_chunk = chunk.delta.text
+            # Claude API 스트리밍 호출 (AsyncAnthropic, 토큰 수신 대기 중에도 이벤트 루프를 블로킹하지 않음)
+            async with self.limiter:
+                async with self.client.messages.stream(
+                    model=settings.LLM_MODEL_NAME,
+                    max_tokens=1000,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": user_prompt}]
+                ) as stream:
+                    async for text_chunk in stream.text_stream:
                         if text_chunk:
                             yield text_chunk
-                            await asyncio.sleep(0.02)  # 20ms 딜레이로 자연스러운 타이핑 효과
+                    
+                    final_message = await stream.get_final_message()
+            await self._record_prompt_cache_usage(final_message.usage)
                             
         except Exception as e:
             error_msg = f"Claude API 스트리밍 호출 실패: {str(e)}"
@@ -1,33 +1,146 @@
 import json
 import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Optional
 from datetime import datetime
 from services.redis_service import redis_service
 from services.s3_service import s3_service
+from services.metrics import LatencyHistogram
+from services.fashion_vocabulary import COLOR_TERM_MATCHER, ITEM_TERM_MATCHER, FASHION_KEYWORD_MATCHER
+from services.fashion_memory_index import FashionBitmapIndex
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+class IndexGeneration:
+    """인덱스 세대별 Redis 키 구성 (0세대는 기존 키 구성, 이후 세대는 fashion_index:v{n} 아래에 구축)"""
+    
+    INDEX_TYPES = ["situation", "item", "color", "styling", "color_term", "item_term"]
+    
+    def __init__(self, number: int):
+        self.number = number
+        
+        if number == 0:
+            self.index_prefix = "fashion_index"
+            self.metadata_prefix = "fashion_metadata"
+            self.document_prefix = "fashion_document"  # 점수 계산용 전체 문서
+        else:
+            self.index_prefix = f"fashion_index:v{number}"
+            self.metadata_prefix = f"{self.index_prefix}:metadata"
+            self.document_prefix = f"{self.index_prefix}:document"
+        
+        self.all_files_key = f"{self.index_prefix}:all"  # 인덱싱된 전체 파일 Set
+        self.registry_prefix = f"{self.index_prefix}:registry"  # 타입별 인덱스 값 목록 Set
+        self.schema_version_key = f"{self.index_prefix}:schema_version"
+        self.etags_key = f"{self.index_prefix}:etags"  # 파일별 S3 ETag/LastModified Hash (증분 업데이트용)
+        
+        # 인덱스 변경 기록 (인메모리 스냅샷 증분 갱신용)
+        self.version_key = f"{self.index_prefix}:version"
+        self.changelog_key = f"{self.index_prefix}:changelog"
+        self.snapshot_id_key = f"{self.index_prefix}:snapshot_id"
+        
+        # 정방향 인덱스 (파일 → 인덱스 키 Set, 갱신/삭제 시 이전 인덱스 키와 비교용)
+        self.forward_prefix = f"{self.index_prefix}:doc"
+    
+    def key_patterns(self) -> List[str]:
+        """세대에 속한 키를 찾는 SCAN 패턴 (0세대는 다른 세대/포인터 키와 겹치지 않도록 타입별로 나열)"""
+        if self.number > 0:
+            return [f"{self.index_prefix}:*"]
+        
+        patterns = [f"{self.index_prefix}:{index_type}:*" for index_type in self.INDEX_TYPES + ["registry", "doc"]]
+        patterns.extend([f"{self.metadata_prefix}:*", f"{self.document_prefix}:*"])
+        return patterns
+    
+    def fixed_keys(self) -> List[str]:
+        """SCAN 패턴 외에 세대에 속한 단일 키"""
+        if self.number > 0:
+            return []
+        return [self.all_files_key, self.schema_version_key, self.etags_key, self.version_key, self.changelog_key, self.snapshot_id_key]
+
 class FashionIndexService:
     """패션 데이터 인덱싱 및 빠른 검색을 위한 서비스"""
     
+    # 인덱스 키 구성이 바뀌면 올림 (서버 시작 시 버전이 다르면 전체 재구축)
+    INDEX_SCHEMA_VERSION = 2
+    
     def __init__(self):
-        self.index_prefix = "fashion_index"
-        self.metadata_prefix = "fashion_metadata"
+        self.metadata_fetch_latency = LatencyHistogram()  # get_metadata_many 호출별 지연시간
+        self.index_types = IndexGeneration.INDEX_TYPES
+        
+        # 인덱스 세대 (전체 재구축은 새 세대에 구축한 뒤 포인터 키를 바꿔 전환, 이전 세대는 지연 후 정리)
+        self.current_generation_key = "fashion_index:current"
+        self.generation_seq_key = "fashion_index:generation_seq"
+        self.retired_generations_key = "fashion_index:retired"
+        self.retired_replay_key = "fashion_index:retired_replay"  # 이전 세대별 현재 세대에 다시 반영한 변경 로그 버전 (Hash)
+        self.rebuild_lock_key = "fashion_index:rebuild_lock"  # 전체 재구축은 전체 워커에서 한 번에 하나만 실행
+        self.rebuild_lock_ttl_ms = 60000  # 구축 중 1/3 주기로 연장 (워커가 죽으면 만료 후 다음 재구축 가능)
+        self.generation_cache_seconds = settings.FASHION_INDEX_GENERATION_CACHE_SECONDS
+        self.gc_delay_seconds = settings.FASHION_INDEX_GC_DELAY_SECONDS
+        self._generation = IndexGeneration(0)
+        self._generation_checked_at = 0.0
+        self._gc_lock = threading.Lock()
+        
+        self.changelog_max_entries = 10000
+        self.changelog_overlap = 100  # INCR와 ZADD 사이 다른 워커의 기록 순서 역전 대비, 최근 버전은 다시 반영
         
+        # 인덱스 구축: S3 조회/파싱/키워드 추출 워커 수, 한 번의 MULTI로 기록할 파일 수
+        self.build_workers = settings.INDEX_BUILD_WORKERS
+        self.build_batch_size = settings.INDEX_BUILD_BATCH_SIZE
+        
+        # 인메모리 비트맵 스냅샷 (설정으로 활성화)
+        self.memory_index = FashionBitmapIndex() if settings.FASHION_INDEX_IN_MEMORY else None
+        self.memory_refresh_interval = settings.FASHION_INDEX_MEMORY_REFRESH_SECONDS
+        self._memory_lock = threading.Lock()
+        self._memory_stop = threading.Event()
+        self._memory_thread = None
+        
+        # 부분 매칭(soft match) 시 조건 종류별 가중치
+        self.facet_weights = {
+            "situation": 3,
+            "item": 2,
+            "color": 2,
+            "styling": 1
+        }
+    
     def build_indexes(self, force_rebuild: bool = False) -> Dict[str, int]:
         """S3의 모든 JSON 파일을 분석하여 인덱스 구축"""
         print("🔍 패션 인덱스 구축 시작...")
         
         if force_rebuild:
-            print("🔄 강제 재구축 모드: 기존 인덱스 완전 삭제")
-            self._clear_indexes()
+            print("🔄 강제 재구축 모드: 새 인덱스 세대에 구축 후 전환 (기존 인덱스는 전환 후 정리)")
             return self._build_all_indexes()
         else:
             print("🔄 증분 업데이트 모드: 새로운 파일만 인덱싱")
             return self._build_incremental_indexes()
     
     def _build_all_indexes(self) -> Dict[str, int]:
-        """전체 인덱스 재구축"""
+        """전체 인덱스 재구축 (전체 워커에서 한 번에 하나만, 이미 진행 중이면 already_running)"""
+        token = uuid.uuid4().hex
+        if not redis_service.acquire_lock(self.rebuild_lock_key, token, self.rebuild_lock_ttl_ms):
+            print("⏳ 다른 요청/워커에서 전체 재구축 진행 중 - 건너뜀")
+            return {"total": 0, "indexed": 0, "already_running": True}
+        
+        stop_event = threading.Event()
+        threading.Thread(target=self._keep_rebuild_lock, args=(token, stop_event), daemon=True, name="index-rebuild-lock").start()
+        try:
+            return self._rebuild_into_new_generation()
+        finally:
+            stop_event.set()
+            redis_service.release_lock(self.rebuild_lock_key, token)
+    
+    def _keep_rebuild_lock(self, token: str, stop_event: threading.Event):
+        """재구축이 끝날 때까지 락 만료 시간 연장"""
+        while not stop_event.wait(self.rebuild_lock_ttl_ms / 3000):
+            if not redis_service.renew_lock(self.rebuild_lock_key, token, self.rebuild_lock_ttl_ms):
+                print("⚠️ 전체 재구축 락 연장 실패")
+                return
+    
+    def _rebuild_into_new_generation(self) -> Dict[str, int]:
+        """새 세대에 구축하는 동안 요청은 현재 세대를 계속 사용, 구축 후 포인터 전환"""
+        generation = None
         try:
             # S3에서 모든 JSON 파일 가져오기
             json_files = s3_service.list_json_files()
@@ -35,152 +148,340 @@ class FashionIndexService:
                 print("❌ S3에 JSON 파일이 없습니다!")
                 return {"total": 0, "indexed": 0}
             
-            indexed_count = 0
+            previous = self.current_generation(refresh=True)
+            generation = self._allocate_generation(previous)
+            # 구축 중 이전 세대에 반영되는 변경은 전환 후 새 세대에 다시 반영
+            replay_from = self._changelog_version(previous)
+            print(f"🆕 새 인덱스 세대 v{generation.number}에 구축 (현재 v{previous.number})")
+            
             total_count = len(json_files)
+            build_stats = self._run_build(json_files, "전체 인덱싱", generation=generation)
             
-            for file_info in json_files:
-                try:
-                    # JSON 내용 가져오기
-                    json_content = s3_service.get_json_content(file_info['filename'])
-                    
-                    # 인덱스 구축
-                    self._index_file(file_info['filename'], json_content, file_info['s3_url'])
-                    indexed_count += 1
-                    
-                    if indexed_count % 10 == 0:
-                        print(f"   📊 진행률: {indexed_count}/{total_count}")
-                        
-                except Exception as e:
-                    print(f"❌ 파일 인덱싱 실패: {file_info['filename']} - {e}")
-                    continue
+            # 하나도 기록하지 못했으면 전환하지 않고 새 세대 정리
+            if build_stats["written"] == 0:
+                print(f"❌ 새 인덱스 세대 구축 실패 - 현재 세대 v{previous.number} 유지")
+                self._drop_generation(generation)
+                return {"total": total_count, "indexed": 0, "generation": previous.number, **self._throughput(build_stats)}
             
-            print(f"✅ 전체 인덱스 구축 완료: {indexed_count}/{total_count}개 파일")
-            return {"total": total_count, "indexed": indexed_count}
+            redis_service.set(generation.schema_version_key, str(self.INDEX_SCHEMA_VERSION), expire_time=0)
+            activated = self._activate_generation(generation, previous, replay_from)
+            if activated is None:
+                print(f"❌ 인덱스 세대 전환 실패 - 현재 세대 v{previous.number} 유지")
+                self._drop_generation(generation)
+                return {"total": total_count, "indexed": 0, "generation": previous.number, **self._throughput(build_stats)}
             
+            previous, replay_from = activated
+            replayed_count = self._replay_generation_changes(previous, replay_from)
+            print(f"✅ 전체 인덱스 구축 완료: {build_stats['written']}/{total_count}개 파일 (v{previous.number} → v{generation.number})")
+            return {
+                "total": total_count,
+                "indexed": build_stats["written"],
+                "replayed": replayed_count,
+                "generation": generation.number,
+                **self._throughput(build_stats)
+            }
+        
         except Exception as e:
             print(f"❌ 전체 인덱스 구축 실패: {e}")
             logger.error(f"전체 인덱스 구축 실패: {e}")
+            # 전환 전에 실패했으면 새 세대 키가 남지 않도록 정리
+            if generation is not None and self.current_generation(refresh=True).number != generation.number:
+                self._drop_generation(generation)
             return {"total": 0, "indexed": 0}
     
     def _build_incremental_indexes(self) -> Dict[str, int]:
-        """증분 인덱스 업데이트 (새로운 파일만)"""
+        """증분 인덱스 업데이트 (S3 목록의 ETag와 저장된 ETag를 비교해 변경분만 조회)"""
+        generation = self.current_generation()
         try:
-            # S3에서 모든 JSON 파일 가져오기
+            # S3에서 모든 JSON 파일 목록 가져오기 (ETag/LastModified 포함, 내용은 조회하지 않음)
             s3_files = s3_service.list_json_files()
             if not s3_files:
                 print("❌ S3에 JSON 파일이 없습니다!")
                 return {"total": 0, "indexed": 0, "updated": 0}
             
-            # Redis에 이미 인덱싱된 파일들 확인
-            existing_metadata_keys = redis_service.keys(f"{self.metadata_prefix}:*")
-            existing_files = set()
-            for key in existing_metadata_keys:
-                filename = key.replace(f"{self.metadata_prefix}:", "")
-                existing_files.add(filename)
+            # Redis에 이미 인덱싱된 파일들 확인 (전체 파일 Set 기준)
+            self._ensure_all_files_set(generation)
+            self._ensure_index_registries(generation)
+            existing_files = redis_service.smembers(generation.all_files_key)
             
             print(f"📊 기존 인덱싱된 파일: {len(existing_files)}개")
+            
+            # 처음 구축하는 경우 현재 스키마로 만들어지므로 버전 기록
+            if not existing_files:
+                redis_service.set(generation.schema_version_key, str(self.INDEX_SCHEMA_VERSION), expire_time=0)
             print(f"📊 S3 전체 파일: {len(s3_files)}개")
             
-            # 새로운 파일들 찾기
+            # 목록 manifest와 저장된 ETag 비교 (ETag가 없는 기존 인덱스는 한 번 다시 조회해 기록)
+            stored_sources = redis_service.hgetall(generation.etags_key)
+            new_file_infos = []
+            changed_file_infos = []
+            for file_info in s3_files:
+                if file_info['filename'] not in existing_files:
+                    new_file_infos.append(file_info)
+                elif not self._is_source_current(stored_sources.get(file_info['filename']), file_info):
+                    changed_file_infos.append(file_info)
+            
+            # S3에서 삭제된 파일
             s3_filenames = {file_info['filename'] for file_info in s3_files}
-            new_files = s3_filenames - existing_files
-            updated_files = set()
+            deleted_files = sorted(existing_files - s3_filenames)
             
-            print(f"🆕 새로 추가된 파일: {len(new_files)}개")
+            print(f"🆕 새로 추가된 파일: {len(new_file_infos)}개")
+            print(f"✏️ 변경된 파일: {len(changed_file_infos)}개")
+            print(f"🗑️ 삭제된 파일: {len(deleted_files)}개")
             
-            # 새로운 파일들 인덱싱
-            indexed_count = 0
-            for file_info in s3_files:
-                if file_info['filename'] in new_files:
-                    try:
-                        # JSON 내용 가져오기
-                        json_content = s3_service.get_json_content(file_info['filename'])
-                        
-                        # 인덱스 구축
-                        self._index_file(file_info['filename'], json_content, file_info['s3_url'])
-                        indexed_count += 1
-                        
-                        if indexed_count % 5 == 0:
-                            print(f"   📊 새 파일 인덱싱 진행률: {indexed_count}/{len(new_files)}")
-                            
-                    except Exception as e:
-                        print(f"❌ 새 파일 인덱싱 실패: {file_info['filename']} - {e}")
-                        continue
+            # 새 파일/변경된 파일만 S3에서 조회해 인덱싱
+            new_stats = self._run_build(new_file_infos, "새 파일 인덱싱", generation=generation)
+            update_stats = self._run_build(changed_file_infos, "변경 파일 인덱싱", generation=generation)
+            removed_count = self._remove_files(deleted_files, generation)
             
-            # 기존 파일들의 업데이트 확인 (타임스탬프 비교)
-            for file_info in s3_files:
-                if file_info['filename'] in existing_files:
-                    try:
-                        # 기존 메타데이터 조회
-                        existing_metadata = redis_service.get_json(f"{self.metadata_prefix}:{file_info['filename']}")
-                        if existing_metadata:
-                            existing_timestamp = existing_metadata.get('timestamp', '')
-                            
-                            # S3 파일의 최신 타임스탬프 확인
-                            json_content = s3_service.get_json_content(file_info['filename'])
-                            s3_timestamp = json_content.get('analysis_timestamp', '')
-                            
-                            # 타임스탬프가 다르면 업데이트
-                            if existing_timestamp != s3_timestamp:
-                                self._index_file(file_info['filename'], json_content, file_info['s3_url'])
-                                updated_files.add(file_info['filename'])
-                                
-                    except Exception as e:
-                        print(f"❌ 파일 업데이트 확인 실패: {file_info['filename']} - {e}")
-                        continue
+            build_stats = {key: new_stats[key] + update_stats[key] for key in new_stats}
             
             print(f"✅ 증분 인덱스 업데이트 완료:")
-            print(f"   - 새로 인덱싱된 파일: {len(new_files)}개")
-            print(f"   - 업데이트된 파일: {len(updated_files)}개")
-            print(f"   - 총 처리된 파일: {len(new_files) + len(updated_files)}개")
+            print(f"   - 새로 인덱싱된 파일: {new_stats['written']}개")
+            print(f"   - 업데이트된 파일: {update_stats['written']}개")
+            print(f"   - 삭제된 파일: {removed_count}개")
+            print(f"   - 총 처리된 파일: {build_stats['written'] + removed_count}개")
             
             return {
                 "total": len(s3_files),
-                "indexed": len(new_files),
-                "updated": len(updated_files),
-                "existing": len(existing_files)
+                "indexed": new_stats["written"],
+                "updated": update_stats["written"],
+                "removed": removed_count,
+                "unchanged": len(s3_files) - len(new_file_infos) - len(changed_file_infos),
+                "existing": len(existing_files),
+                **self._throughput(build_stats)
             }
-            
+        
         except Exception as e:
             print(f"❌ 증분 인덱스 업데이트 실패: {e}")
             logger.error(f"증분 인덱스 업데이트 실패: {e}")
             return {"total": 0, "indexed": 0, "updated": 0}
     
-    def _index_file(self, filename: str, content: dict, s3_url: str):
-        """단일 파일을 인덱싱"""
+    def _source_of(self, file_info: dict) -> Optional[str]:
+        """S3 목록 항목/조회 결과의 ETag/LastModified를 저장용 문자열로 변환 (ETag가 없으면 None)"""
+        if not file_info.get('etag'):
+            return None
+        return json.dumps({"etag": file_info['etag'], "last_modified": file_info.get('last_modified', '')})
+    
+    def _is_source_current(self, stored_source: Optional[str], file_info: dict) -> bool:
+        """저장된 ETag/LastModified가 현재 S3 목록 항목과 같은지 확인"""
+        if not stored_source or not file_info.get('etag'):
+            return False
+        
         try:
-            extracted_items = content.get('extracted_items', {})
-            situations = content.get('situations', [])
-            
-            # 메타데이터 저장
-            metadata = {
-                "filename": filename,
-                "s3_url": s3_url,
-                "situations": situations,
-                "items": self._extract_item_summary(extracted_items),
-                "styling_methods": extracted_items.get('styling_methods', {}),
-                "timestamp": content.get('analysis_timestamp', ''),
-                "updated_at": content.get('updated_at', '')
-            }
-            
-            # Redis에 메타데이터 저장 (TTL 없이 영구 저장)
-            redis_service.set_json(f"{self.metadata_prefix}:{filename}", metadata, expire_time=0)
+            source = json.loads(stored_source)
+        except (TypeError, ValueError):
+            return False
+        return source.get('etag') == file_info['etag'] and source.get('last_modified') == file_info.get('last_modified', '')
+    
+    def _run_build(self, file_infos: List[dict], label: str, generation: Optional[IndexGeneration] = None) -> dict:
+        """파일들을 배치 단위로 조회/준비 후 기록 (다음 배치의 S3 조회·파싱을 현재 배치의 Redis 기록과 겹쳐 실행)"""
+        generation = generation or self.current_generation()
+        build_stats = {"processed": 0, "written": 0, "failed": 0, "failed_files": [], "missing_files": [], "redis_ops": 0, "elapsed": 0.0}
+        if not file_infos:
+            return build_stats
+        
+        start_time = time.time()
+        batches = [file_infos[i:i + self.build_batch_size] for i in range(0, len(file_infos), self.build_batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=self.build_workers, thread_name_prefix="index-build") as executor:
+            pending = [executor.submit(self._prepare_file_from_s3, file_info) for file_info in batches[0]]
             
-            # 상황별 인덱스
-            for situation in situations:
-                self._add_to_index(f"situation:{situation}", filename)
+            for position in range(len(batches)):
+                current = pending
+                # 다음 배치를 미리 워커 풀에 넣어 두고 현재 배치를 기록
+                if position + 1 < len(batches):
+                    pending = [executor.submit(self._prepare_file_from_s3, file_info) for file_info in batches[position + 1]]
+                
+                records = []
+                for file_info, future in zip(batches[position], current):
+                    try:
+                        records.append(future.result())
+                    except Exception as e:
+                        if s3_service.is_missing_error(e):
+                            # 목록 조회/이벤트 발행 이후 S3에서 삭제된 파일 (호출자가 제거로 처리)
+                            build_stats["missing_files"].append(file_info['filename'])
+                            continue
+                        print(f"❌ 파일 인덱싱 실패: {file_info['filename']} - {e}")
+                        build_stats["failed"] += 1
+                        build_stats["failed_files"].append(file_info['filename'])
+                build_stats["processed"] += len(current)
+                
+                if records:
+                    redis_ops = self._write_records(records, generation)
+                    if redis_ops:
+                        build_stats["written"] += len(records)
+                        build_stats["redis_ops"] += redis_ops
+                    else:
+                        build_stats["failed"] += len(records)
+                        build_stats["failed_files"].extend(record["filename"] for record in records)
+                
+                print(f"   📊 {label} 진행률: {build_stats['processed']}/{len(file_infos)}")
+        
+        build_stats["elapsed"] = time.time() - start_time
+        return build_stats
+    
+    def _throughput(self, build_stats: dict) -> dict:
+        """구축 통계를 처리량 정보로 변환 (출력 포함)"""
+        elapsed = build_stats["elapsed"]
+        throughput = {
+            "failed": build_stats["failed"],
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(build_stats["processed"] / elapsed, 1) if elapsed > 0 else 0.0,
+            "redis_ops": build_stats["redis_ops"],
+            "redis_ops_per_second": round(build_stats["redis_ops"] / elapsed, 1) if elapsed > 0 else 0.0
+        }
+        print(f"⚡ 처리량: {throughput['files_per_second']} files/s, {throughput['redis_ops_per_second']} Redis ops/s "
+              f"({build_stats['processed']}개 파일, Redis 명령 {build_stats['redis_ops']}개, {elapsed:.2f}초)")
+        return throughput
+    
+    def _prepare_file_from_s3(self, file_info: dict) -> dict:
+        """S3에서 JSON을 조회해 인덱스 기록 준비 (워커 풀에서 실행)"""
+        # 목록의 ETag와 다른 캐시 내용은 쓰지 않고 S3에서 재검증 (다른 워커/업로더가 바꾼 파일을 이전 내용으로 인덱싱하지 않도록)
+        json_content, source = s3_service.get_json_content_with_source(file_info['filename'], expected_etag=file_info.get('etag'))
+        record = self._prepare_file(file_info['filename'], json_content, file_info['s3_url'])
+        # 다음 증분 업데이트에서 변경 여부를 목록만으로 판단하도록 실제로 조회한 내용의 ETag/LastModified 저장
+        record["source"] = self._source_of(source)
+        return record
+    
+    def reindex_file(self, filename: str, content: Optional[dict] = None) -> bool:
+        """단일 파일 재인덱싱 (이전 인덱스 키와 비교해 빠진 키만 SREM, 새로 생긴 키만 SADD)"""
+        try:
+            if content is None:
+                content = s3_service.get_json_content(filename)
+            s3_url = s3_service.get_image_url(f"{s3_service.bucket_json_prefix}/{filename}.json")
             
-            # 아이템별 인덱스
-            self._index_items(filename, extracted_items)
+            return self._write_records([self._prepare_file(filename, content, s3_url)]) > 0
+        except Exception as e:
+            print(f"❌ 파일 재인덱싱 실패: {filename} - {e}")
+            logger.error(f"파일 재인덱싱 실패: {filename} - {e}")
+            return False
+    
+    def remove_file(self, filename: str) -> bool:
+        """단일 파일을 모든 인덱스/메타데이터/전체 문서에서 제거"""
+        try:
+            return self._remove_files([filename]) == 1
+        except Exception as e:
+            print(f"❌ 파일 인덱스 제거 실패: {filename} - {e}")
+            logger.error(f"파일 인덱스 제거 실패: {filename} - {e}")
+            return False
+    
+    def apply_changes(self, upserts: List[str], deletes: List[str]) -> dict:
+        """변경 이벤트 일괄 반영 (upsert는 S3에서 다시 조회해 재인덱싱, delete는 인덱스에서 제거), 반영하지 못한 파일은 failed_files"""
+        generation = self.current_generation(refresh=True)
+        file_infos = [
+            {"filename": filename, "s3_url": s3_service.get_image_url(f"{s3_service.bucket_json_prefix}/{filename}.json")}
+            for filename in upserts
+        ]
+        
+        build_stats = self._run_build(file_infos, "변경 이벤트 반영", generation=generation)
+        # upsert 이후 S3에서 삭제된 파일은 재시도해도 실패하므로 제거로 반영
+        deletes = list(deletes) + build_stats["missing_files"]
+        removed_count = self._remove_files(deletes, generation)
+        failed_files = list(build_stats["failed_files"])
+        if removed_count < len(deletes):
+            # 제거는 배치 단위로 실패하므로 다시 실행해도 안전한 삭제 전체를 실패로 처리
+            failed_files.extend(deletes)
+        return {"indexed": build_stats["written"], "failed": build_stats["failed"], "removed": removed_count, "failed_files": failed_files}
+    
+    def _prepare_file(self, filename: str, content: dict, s3_url: str) -> dict:
+        """단일 파일의 메타데이터/전체 문서/인덱스 키 계산 (Redis 기록 없음)"""
+        extracted_items = content.get('extracted_items', {})
+        
+        metadata = {
+            "filename": filename,
+            "s3_url": s3_url,
+            "situations": content.get('situations', []),
+            "items": self._extract_item_summary(extracted_items),
+            "styling_methods": extracted_items.get('styling_methods', {}),
+            "timestamp": content.get('analysis_timestamp', ''),
+            "updated_at": content.get('updated_at', '')
+        }
+        
+        return {
+            "filename": filename,
+            "metadata": metadata,
+            # 점수 계산에 필요한 전체 문서 (요청 경로에서 S3 조회 제거)
+            "document": self._build_document(content),
+            # 상황/아이템/색상/스타일링 인덱스
+            "posting_keys": self._compute_posting_keys(content)
+        }
+    
+    def _write_records(self, records: List[dict], generation: Optional[IndexGeneration] = None) -> int:
+        """준비된 기록들을 MULTI 한 번으로 저장 후 변경 기록, 실행한 Redis 명령 수 반환 (실패 시 0)"""
+        generation = generation or self.current_generation()
+        filenames = [record["filename"] for record in records]
+        commands = []
+        
+        def build_commands():
+            # 이전 인덱스 키를 읽은 뒤 같은 파일을 다른 워커가 기록하면 다시 읽어 차이 계산 (오래된 인덱스 키가 남지 않도록)
+            commands[:] = self._index_commands(records, self._stored_posting_keys(filenames, generation), generation)
+            return commands
+        
+        if redis_service.watched_transaction(self._posting_watch_keys(filenames, generation), build_commands) is None:
+            print(f"❌ 인덱스 배치 기록 실패: {len(records)}개 파일")
+            return 0
+        
+        # 인메모리 스냅샷이 증분 반영할 수 있도록 변경 기록
+        self._record_changes(filenames, generation)
+        return len(filenames) + len(commands) + 4  # 정방향 인덱스 SMEMBERS + 기록 + SET NX/INCRBY/ZADD/ZREMRANGEBYRANK
+    
+    def _index_commands(self, records: List[dict], stored_keys: Dict[str, Set[str]], generation: Optional[IndexGeneration] = None) -> list:
+        """기록들을 파이프라인 명령으로 변환 (이전 인덱스 키와의 차이만 SREM/SADD, 같은 키의 명령은 하나로 묶음)"""
+        generation = generation or self.current_generation()
+        commands = []
+        postings = {}
+        stale_postings = {}
+        
+        for record in records:
+            filename = record["filename"]
+            posting_keys = record["posting_keys"]
+            previous_keys = stored_keys.get(filename, set())
             
-            # 색상별 인덱스
-            self._index_colors(filename, extracted_items)
+            # 메타데이터/전체 문서 (TTL 없이 영구 저장)
+            commands.append(("set", f"{generation.metadata_prefix}:{filename}", json.dumps(record["metadata"], ensure_ascii=False)))
+            commands.append(("set", f"{generation.document_prefix}:{filename}", json.dumps(record["document"], ensure_ascii=False)))
+            if record.get("source"):
+                commands.append(("hset", generation.etags_key, filename, record["source"]))
             
-            # 스타일링 방법별 인덱스
-            self._index_styling_methods(filename, extracted_items)
+            # 정방향 인덱스 교체
+            commands.append(("delete", f"{generation.forward_prefix}:{filename}"))
+            if posting_keys:
+                commands.append(("sadd", f"{generation.forward_prefix}:{filename}", *posting_keys))
             
-        except Exception as e:
-            print(f"❌ 파일 인덱싱 중 에러: {filename} - {e}")
+            for index_key in posting_keys - previous_keys:
+                postings.setdefault(index_key, []).append(filename)
+            for index_key in previous_keys - posting_keys:
+                stale_postings.setdefault(index_key, []).append(filename)
+        
+        # 더 이상 해당하지 않는 인덱스에서 제거
+        for index_key, filenames in stale_postings.items():
+            commands.append(("srem", f"{generation.index_prefix}:{index_key}", *filenames))
+        
+        # 전체 파일 Set (랜덤 선택용)
+        commands.append(("sadd", generation.all_files_key, *[record["filename"] for record in records]))
+        
+        registry_values = {}
+        for index_key, filenames in postings.items():
+            commands.append(("sadd", f"{generation.index_prefix}:{index_key}", *filenames))
+            index_type, _, index_value = index_key.partition(":")
+            if index_value:
+                registry_values.setdefault(index_type, set()).add(index_value)
+        
+        # 타입별 레지스트리에도 인덱스 값 등록
+        for index_type, values in registry_values.items():
+            commands.append(("sadd", f"{generation.registry_prefix}:{index_type}", *values))
+        
+        return commands
+    
+    def _build_document(self, content: dict) -> dict:
+        """점수 계산/응답 생성에 필요한 필드만 남긴 전체 문서"""
+        return {
+            "extracted_items": content.get('extracted_items', {}),
+            "situations": content.get('situations', []),
+            "analysis_timestamp": content.get('analysis_timestamp', ''),
+            "updated_at": content.get('updated_at', '')
+        }
     
     def _extract_item_summary(self, extracted_items: dict) -> dict:
         """아이템 요약 정보 추출"""
@@ -197,8 +498,20 @@ class FashionIndexService:
         
         return summary
     
-    def _index_items(self, filename: str, extracted_items: dict):
-        """아이템별 인덱스 구축"""
+    def _compute_posting_keys(self, content: dict) -> Set[str]:
+        """문서가 속하는 인덱스 키 목록 계산 (prefix 제외, 예: 'color:블랙')"""
+        extracted_items = content.get('extracted_items', {})
+        
+        posting_keys = {f"situation:{situation}" for situation in content.get('situations', [])}
+        posting_keys.update(self._item_index_keys(extracted_items))
+        posting_keys.update(self._color_index_keys(extracted_items))
+        posting_keys.update(self._styling_index_keys(extracted_items))
+        return posting_keys
+    
+    def _item_index_keys(self, extracted_items: dict) -> Set[str]:
+        """아이템별 인덱스 키"""
+        index_keys = set()
+        
         for category, item_info in extracted_items.items():
             if isinstance(item_info, dict):
                 item_name = item_info.get('item', '').lower()
@@ -206,10 +519,16 @@ class FashionIndexService:
                     # 아이템명에서 키워드 추출
                     keywords = self._extract_keywords(item_name)
                     for keyword in keywords:
-                        self._add_to_index(f"item:{keyword}", filename)
+                        index_keys.add(f"item:{keyword}")
+                    
+                    # 요청 경로의 부분 일치 검색용: 아이템명에 포함된 어휘를 미리 펼쳐 둠
+                    for term in ITEM_TERM_MATCHER.keywords_in(item_name):
+                        index_keys.add(f"item_term:{term}")
+        
+        return index_keys
     
-    def _index_colors(self, filename: str, extracted_items: dict):
-        """색상별 인덱스 구축"""
+    def _color_index_keys(self, extracted_items: dict) -> Set[str]:
+        """색상별 인덱스 키"""
         colors = set()
         
         for category, item_info in extracted_items.items():
@@ -218,216 +537,430 @@ class FashionIndexService:
                 if color:
                     colors.add(color)
         
-        for color in colors:
-            self._add_to_index(f"color:{color}", filename)
+        index_keys = {f"color:{color}" for color in colors}
+        
+        # 요청 경로의 부분 일치 검색용: 색상값에 포함된 어휘(동의어 포함)를 미리 펼쳐 둠
+        index_keys.update(f"color_term:{term}" for color in colors for term in COLOR_TERM_MATCHER.keywords_in(color))
+        return index_keys
     
-    def _index_styling_methods(self, filename: str, extracted_items: dict):
-        """스타일링 방법별 인덱스 구축"""
+    def _styling_index_keys(self, extracted_items: dict) -> Set[str]:
+        """스타일링 방법별 인덱스 키"""
+        index_keys = set()
         styling_methods = extracted_items.get('styling_methods', {})
         
         for method_key, method_value in styling_methods.items():
             if isinstance(method_value, str) and method_value:
                 keywords = self._extract_keywords(method_value.lower())
                 for keyword in keywords:
-                    self._add_to_index(f"styling:{keyword}", filename)
+                    index_keys.add(f"styling:{keyword}")
+        
+        return index_keys
     
     def _extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 키워드 추출"""
         # 간단한 키워드 추출 (실제로는 더 정교한 NLP 사용 가능)
-        keywords = []
-        
-        # 일반적인 패션 키워드들
-        fashion_keywords = [
-            "니트", "데님", "가죽", "면", "실크", "울", "폴리에스터",
-            "긴팔", "반팔", "와이드", "스키니", "레귤러", "오버핏", "슬림",
-            "블랙", "화이트", "그레이", "브라운", "네이비", "베이지",
-            "티셔츠", "셔츠", "니트", "스웨터", "후드티", "맨투맨",
-            "슬랙스", "청바지", "팬츠", "반바지", "스커트",
-            "스니커즈", "로퍼", "옥스포드", "부츠", "샌들",
-            "넣기", "턱", "핏", "실루엣", "밸런스"
-        ]
+        return FASHION_KEYWORD_MATCHER.keywords_in(text)
+    
+    def _remove_files(self, filenames: List[str], generation: Optional[IndexGeneration] = None) -> int:
+        """인덱스에서 파일들 제거 (정방향 인덱스의 모든 인덱스 키에서 SREM, 메타데이터/전체 문서 삭제), 제거한 파일 수 반환"""
+        generation = generation or self.current_generation()
+        if not filenames:
+            return 0
         
-        for keyword in fashion_keywords:
-            if keyword in text:
-                keywords.append(keyword)
+        removed_count = 0
+        for position in range(0, len(filenames), self.build_batch_size):
+            batch = filenames[position:position + self.build_batch_size]
+            
+            def build_commands(batch=batch):
+                # 이전 인덱스 키를 읽은 뒤 같은 파일을 다른 워커가 기록하면 다시 읽어 그 키까지 제거
+                postings = {}
+                for filename, posting_keys in self._stored_posting_keys(batch, generation).items():
+                    for index_key in posting_keys:
+                        postings.setdefault(index_key, []).append(filename)
+                
+                commands = [("srem", generation.all_files_key, *batch), ("hdel", generation.etags_key, *batch)]
+                commands.extend(("srem", f"{generation.index_prefix}:{index_key}", *members) for index_key, members in postings.items())
+                commands.append(("delete", *[
+                    f"{prefix}:{filename}"
+                    for filename in batch
+                    for prefix in (generation.metadata_prefix, generation.document_prefix, generation.forward_prefix)
+                ]))
+                return commands
+            
+            if redis_service.watched_transaction(self._posting_watch_keys(batch, generation), build_commands) is None:
+                print(f"❌ 인덱스 파일 제거 실패: {len(batch)}개 파일")
+                continue
+            
+            # 인메모리 스냅샷에서도 제거되도록 변경 기록 (전체 문서가 없으면 제거로 처리됨)
+            self._record_changes(batch, generation)
+            removed_count += len(batch)
         
-        return keywords
+        return removed_count
     
-    def _add_to_index(self, index_key: str, filename: str):
-        """인덱스에 파일 추가"""
-        try:
-            redis_key = f"{self.index_prefix}:{index_key}"
-            redis_service.sadd(redis_key, filename)
-        except Exception as e:
-            print(f"❌ 인덱스 추가 실패: {index_key} - {e}")
+    def _posting_watch_keys(self, filenames: List[str], generation: IndexGeneration) -> List[str]:
+        """이전 인덱스 키 계산에 쓰는 키 (정방향 인덱스, 정방향 인덱스가 없을 때 쓰는 전체 문서) - 기록/제거 시 WATCH"""
+        return [f"{prefix}:{filename}" for filename in filenames for prefix in (generation.forward_prefix, generation.document_prefix)]
+    
+    def _stored_posting_keys(self, filenames: List[str], generation: IndexGeneration) -> Dict[str, Set[str]]:
+        """파일별로 현재 기록된 인덱스 키 (정방향 인덱스 기준, 없으면 저장된 전체 문서/메타데이터로 계산)"""
+        results = redis_service.execute_pipeline([("smembers", f"{generation.forward_prefix}:{filename}") for filename in filenames])
+        if results is None:
+            results = [set()] * len(filenames)
+        
+        stored_keys = {}
+        missing = []
+        for filename, posting_keys in zip(filenames, results):
+            if posting_keys:
+                stored_keys[filename] = set(posting_keys)
+            else:
+                missing.append(filename)
+        
+        # 정방향 인덱스 이전에 인덱싱된 파일
+        if missing:
+            documents = self.get_documents_many(missing, generation)
+            metadata_list = redis_service.mget_json([f"{generation.metadata_prefix}:{filename}" for filename in missing])
+            for filename, metadata in zip(missing, metadata_list):
+                content = documents.get(filename)
+                if content is None and metadata:
+                    # 전체 문서가 없는 기존 인덱스는 메타데이터 요약으로 인덱스 키 계산
+                    content = {
+                        "extracted_items": {**metadata.get('items', {}), "styling_methods": metadata.get('styling_methods', {})},
+                        "situations": metadata.get('situations', [])
+                    }
+                if content:
+                    stored_keys[filename] = self._compute_posting_keys(content)
+        
+        return stored_keys
+    
+    def current_generation(self, refresh: bool = False) -> IndexGeneration:
+        """요청이 사용할 현재 인덱스 세대 (포인터 키는 짧게 캐시, 포인터가 없으면 기존 키 구성인 0세대)"""
+        if refresh or time.time() - self._generation_checked_at >= self.generation_cache_seconds:
+            value = redis_service.get(self.current_generation_key)
+            number = int(value) if value and value.isdigit() else 0
+            if number != self._generation.number:
+                self._generation = IndexGeneration(number)
+            self._generation_checked_at = time.time()
+        
+        return self._generation
+    
+    def metadata_key(self, filename: str) -> str:
+        """현재 세대의 파일 메타데이터 Redis 키 (다른 모듈에서 메타데이터를 직접 조회할 때 사용)"""
+        return f"{self.current_generation().metadata_prefix}:{filename}"
     
-    def _clear_indexes(self):
-        """기존 인덱스 초기화"""
+    def _allocate_generation(self, previous: IndexGeneration) -> IndexGeneration:
+        """새 인덱스 세대 번호 발급 (현재 세대보다 항상 큼)"""
+        number = redis_service.incr(self.generation_seq_key)
+        if number <= previous.number:
+            # 세대 카운터가 유실된 경우 현재 세대 다음 번호부터 다시 시작
+            number = previous.number + 1
+            redis_service.set(self.generation_seq_key, str(number), expire_time=0)
+        return IndexGeneration(number)
+    
+    def _activate_generation(self, generation: IndexGeneration, previous: IndexGeneration, replay_from: int) -> Optional[tuple]:
+        """포인터 키를 WATCH한 채 새 세대로 원자적으로 전환하고 포인터가 실제로 가리키던 세대를 정리 대상으로 등록, (정리 대상 세대, 변경 반영 시작 버전) 반환 (실패 시 None, 전환하지 않음)"""
+        retired = {}
+        
+        def build_commands():
+            value = redis_service.get(self.current_generation_key)
+            current = IndexGeneration(int(value) if value and value.isdigit() else 0)
+            # 구축 중 포인터가 바뀌었으면 그 세대의 변경은 처음부터 다시 반영
+            retired["generation"] = current
+            retired["replay_from"] = replay_from if current.number == previous.number else 0
+            return [
+                ("set", self.current_generation_key, str(generation.number)),
+                ("sadd", self.retired_generations_key, str(current.number)),
+                ("hset", self.retired_replay_key, str(current.number), str(retired["replay_from"]))
+            ]
+        
+        if redis_service.watched_transaction([self.current_generation_key], build_commands) is None:
+            return None
+        
+        self._generation = generation
+        self._generation_checked_at = time.time()
+        print(f"🔀 인덱스 세대 전환: v{retired['generation'].number} → v{generation.number}")
+        
+        self.schedule_generation_gc()
+        return retired["generation"], retired["replay_from"]
+    
+    def _changelog_version(self, generation: IndexGeneration) -> int:
+        """세대의 현재 변경 로그 버전"""
+        value = redis_service.get(generation.version_key)
+        return int(value) if value and value.isdigit() else 0
+    
+    def _replay_generation_changes(self, previous: IndexGeneration, since_version: int) -> int:
+        """이전 세대에 since_version 이후 기록된 변경(재구축 중 반영, 전환 직후 포인터 캐시가 남은 워커의 반영)을 현재 세대에 다시 반영, 반영한 파일 수 반환"""
         try:
-            # 인덱스 키들 찾기
-            pattern = f"{self.index_prefix}:*"
-            keys = redis_service.keys(pattern)
-            
-            if keys:
-                redis_service.delete(*keys)
-                print(f"🗑️ 기존 인덱스 {len(keys)}개 삭제")
+            version = self._changelog_version(previous)
+            since = max(since_version - self.changelog_overlap, 0)
+            changed_files, log_size, oldest_version = redis_service.get_changelog_since(previous.changelog_key, since)
             
-            # 메타데이터 키들 찾기
-            pattern = f"{self.metadata_prefix}:*"
-            keys = redis_service.keys(pattern)
+            if log_size >= self.changelog_max_entries and oldest_version > since + 1:
+                # 변경 로그가 잘려 놓친 변경이 있을 수 있으면 S3 목록 기준 증분 업데이트로 맞춤
+                print(f"⚠️ 이전 세대 v{previous.number} 변경 로그 유실 - 증분 업데이트로 반영")
+                result = self._build_incremental_indexes()
+                replayed_count = result.get("indexed", 0) + result.get("updated", 0) + result.get("removed", 0)
+            elif changed_files:
+                # 이전 세대에 전체 문서가 남아 있으면 갱신, 없으면 삭제된 파일
+                documents = self.get_documents_many(changed_files, previous)
+                result = self.apply_changes(
+                    [filename for filename in changed_files if filename in documents],
+                    [filename for filename in changed_files if filename not in documents]
+                )
+                replayed_count = result["indexed"] + result["removed"]
+                print(f"🔁 이전 세대 v{previous.number} 변경 {len(changed_files)}개 파일 현재 세대에 반영")
+            else:
+                replayed_count = 0
             
-            if keys:
-                redis_service.delete(*keys)
-                print(f"🗑️ 기존 메타데이터 {len(keys)}개 삭제")
+            redis_service.execute_pipeline([("hset", self.retired_replay_key, str(previous.number), str(version))])
+            return replayed_count
+        except Exception as e:
+            print(f"❌ 이전 세대 변경 반영 실패: v{previous.number} - {e}")
+            logger.error(f"이전 세대 변경 반영 실패: v{previous.number} - {e}")
+            return 0
+    
+    def schedule_generation_gc(self):
+        """이전 세대 정리를 백그라운드 스레드에서 실행 (다른 워커의 포인터 캐시와 진행 중 요청이 끝날 때까지 대기 후)"""
+        def collect():
+            time.sleep(self.gc_delay_seconds)
+            self.collect_retired_generations()
+        
+        threading.Thread(target=collect, daemon=True, name="index-generation-gc").start()
+    
+    def collect_retired_generations(self) -> int:
+        """정리 대상으로 등록된 이전 세대의 키를 모두 삭제, 삭제한 키 수 반환"""
+        # 같은 프로세스에서 정리가 겹치지 않도록 (다른 워커와 겹쳐도 UNLINK는 안전)
+        if not self._gc_lock.acquire(blocking=False):
+            return 0
+        
+        try:
+            deleted_count = 0
+            current = self.current_generation(refresh=True)
+            replay_versions = redis_service.hgetall(self.retired_replay_key)
+            for value in redis_service.smembers(self.retired_generations_key):
+                if not value.isdigit() or int(value) == current.number:
+                    redis_service.execute_pipeline([("srem", self.retired_generations_key, value), ("hdel", self.retired_replay_key, value)])
+                    continue
+                
+                # 전환 직후 이전 세대에 기록된 변경까지 현재 세대에 반영한 뒤 삭제
+                retired = IndexGeneration(int(value))
+                if (replay_versions.get(value) or "").isdigit():
+                    self._replay_generation_changes(retired, int(replay_versions[value]))
                 
+                deleted_count += self._drop_generation(retired)
+                redis_service.execute_pipeline([("srem", self.retired_generations_key, value), ("hdel", self.retired_replay_key, value)])
+            return deleted_count
         except Exception as e:
-            print(f"❌ 인덱스 초기화 실패: {e}")
+            print(f"❌ 이전 인덱스 세대 정리 실패: {e}")
+            logger.error(f"이전 인덱스 세대 정리 실패: {e}")
+            return 0
+        finally:
+            self._gc_lock.release()
+    
+    def _drop_generation(self, generation: IndexGeneration) -> int:
+        """세대의 모든 키를 SCAN으로 순회하며 배치 단위 UNLINK (메모리 해제는 Redis 백그라운드에서 수행)"""
+        deleted_count = 0
+        for pattern in generation.key_patterns():
+            batch = []
+            for key in redis_service.scan_iter(pattern):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted_count += redis_service.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted_count += redis_service.unlink(*batch)
+        
+        fixed_keys = generation.fixed_keys()
+        if fixed_keys:
+            deleted_count += redis_service.unlink(*fixed_keys)
+        
+        print(f"🗑️ 인덱스 세대 v{generation.number} 정리: {deleted_count}개 키 삭제")
+        return deleted_count
     
     def search_by_situation(self, situation: str, limit: int = 20) -> List[dict]:
         """상황별 검색"""
+        generation = self.current_generation()
         try:
             index_key = f"situation:{situation.lower()}"
-            filenames = redis_service.smembers(f"{self.index_prefix}:{index_key}")
-            
-            results = []
-            for filename in list(filenames)[:limit]:
-                metadata = self._get_metadata(filename)
-                if metadata:
-                    results.append(metadata)
+            filenames = redis_service.smembers(f"{generation.index_prefix}:{index_key}")
             
-            return results
+            return self.get_metadata_many(list(filenames)[:limit], generation)
         except Exception as e:
             print(f"❌ 상황별 검색 실패: {e}")
             return []
     
     def search_by_item(self, item_keyword: str, limit: int = 20) -> List[dict]:
         """아이템별 검색"""
+        generation = self.current_generation()
         try:
             index_key = f"item:{item_keyword.lower()}"
-            filenames = redis_service.smembers(f"{self.index_prefix}:{index_key}")
+            filenames = redis_service.smembers(f"{generation.index_prefix}:{index_key}")
             
-            results = []
-            for filename in list(filenames)[:limit]:
-                metadata = self._get_metadata(filename)
-                if metadata:
-                    results.append(metadata)
-            
-            return results
+            return self.get_metadata_many(list(filenames)[:limit], generation)
         except Exception as e:
             print(f"❌ 아이템별 검색 실패: {e}")
             return []
     
     def search_by_color(self, color: str, limit: int = 20) -> List[dict]:
         """색상별 검색"""
+        generation = self.current_generation()
         try:
             index_key = f"color:{color.lower()}"
-            filenames = redis_service.smembers(f"{self.index_prefix}:{index_key}")
-            
-            results = []
-            for filename in list(filenames)[:limit]:
-                metadata = self._get_metadata(filename)
-                if metadata:
-                    results.append(metadata)
+            filenames = redis_service.smembers(f"{generation.index_prefix}:{index_key}")
             
-            return results
+            return self.get_metadata_many(list(filenames)[:limit], generation)
         except Exception as e:
             print(f"❌ 색상별 검색 실패: {e}")
             return []
     
     def search_by_styling(self, styling_keyword: str, limit: int = 20) -> List[dict]:
         """스타일링 방법별 검색"""
+        generation = self.current_generation()
         try:
             index_key = f"styling:{styling_keyword.lower()}"
-            filenames = redis_service.smembers(f"{self.index_prefix}:{index_key}")
-            
-            results = []
-            for filename in list(filenames)[:limit]:
-                metadata = self._get_metadata(filename)
-                if metadata:
-                    results.append(metadata)
+            filenames = redis_service.smembers(f"{generation.index_prefix}:{index_key}")
             
-            return results
+            return self.get_metadata_many(list(filenames)[:limit], generation)
         except Exception as e:
             print(f"❌ 스타일링별 검색 실패: {e}")
             return []
     
     def advanced_search(self, criteria: dict, limit: int = 20) -> List[dict]:
-        """고급 검색 (여러 조건 조합)"""
+        """고급 검색 (여러 조건 조합, 집합 연산은 인메모리 스냅샷 또는 Redis 서버에서 수행)"""
+        generation = self.current_generation()
         try:
-            all_filenames = set()
-            first_search = True
-            
-            # 각 조건별로 검색
-            if 'situations' in criteria and criteria['situations']:
-                for situation in criteria['situations']:
-                    filenames = redis_service.smembers(f"{self.index_prefix}:situation:{situation.lower()}")
-                    if first_search:
-                        all_filenames = set(filenames)
-                        first_search = False
-                    else:
-                        all_filenames = all_filenames.intersection(set(filenames))
-            
-            if 'items' in criteria and criteria['items']:
-                for item in criteria['items']:
-                    filenames = redis_service.smembers(f"{self.index_prefix}:item:{item.lower()}")
-                    if first_search:
-                        all_filenames = set(filenames)
-                        first_search = False
-                    else:
-                        all_filenames = all_filenames.intersection(set(filenames))
-            
-            if 'colors' in criteria and criteria['colors']:
-                for color in criteria['colors']:
-                    filenames = redis_service.smembers(f"{self.index_prefix}:color:{color.lower()}")
-                    if first_search:
-                        all_filenames = set(filenames)
-                        first_search = False
-                    else:
-                        all_filenames = all_filenames.intersection(set(filenames))
-            
-            if 'styling' in criteria and criteria['styling']:
-                for styling in criteria['styling']:
-                    filenames = redis_service.smembers(f"{self.index_prefix}:styling:{styling.lower()}")
-                    if first_search:
-                        all_filenames = set(filenames)
-                        first_search = False
+            index_keys = self._get_criteria_index_keys(criteria)
+            memory_index = self.get_memory_index()
+            filenames = []
+            
+            if index_keys:
+                # 모든 조건의 교집합
+                if memory_index:
+                    bits = memory_index.intersect(key for _, key in index_keys)
+                    total, filenames = bits.bit_count(), memory_index.sample(bits, limit)
+                else:
+                    # SINTERSTORE → SRANDMEMBER, limit개만 전송
+                    total, filenames = redis_service.sinter_sample(
+                        [f"{generation.index_prefix}:{key}" for _, key in index_keys], limit
+                    )
+                print(f"🔍 교집합 검색: {total}개 중 {len(filenames)}개 선택")
+                
+                # 교집합이 없으면 조건별 가중치 합으로 부분 매칭
+                if not filenames:
+                    weighted_keys = {}
+                    for facet, key in index_keys:
+                        weighted_keys[key] = weighted_keys.get(key, 0) + self.facet_weights[facet]
+                    
+                    if memory_index:
+                        ranked = memory_index.weighted_top(weighted_keys, limit)
                     else:
-                        all_filenames = all_filenames.intersection(set(filenames))
+                        # ZUNIONSTORE
+                        ranked = redis_service.zunion_top(
+                            {f"{generation.index_prefix}:{key}": weight for key, weight in weighted_keys.items()}, limit
+                        )
+                    filenames = [filename for filename, _ in ranked]
+                    if filenames:
+                        print(f"🔍 부분 매칭 검색: {len(filenames)}개 (최고 가중치: {ranked[0][1]})")
             
             # 검색 조건이 없거나 결과가 없는 경우, 전체 파일에서 랜덤 선택
-            if not all_filenames:
+            if not filenames:
                 print("⚠️ 검색 조건에 맞는 파일이 없어 전체 파일에서 선택")
-                # 전체 메타데이터에서 랜덤 선택
-                all_metadata_keys = redis_service.keys(f"{self.metadata_prefix}:*")
-                if all_metadata_keys:
-                    import random
-                    selected_keys = random.sample(all_metadata_keys, min(limit, len(all_metadata_keys)))
-                    all_filenames = {key.replace(f"{self.metadata_prefix}:", "") for key in selected_keys}
+                if memory_index:
+                    filenames = memory_index.sample_all(limit)
+                else:
+                    filenames = redis_service.srandmember(generation.all_files_key, limit)
+                    if not filenames and self._ensure_all_files_set(generation):
+                        filenames = redis_service.srandmember(generation.all_files_key, limit)
             
             # 결과 반환
-            results = []
-            for filename in list(all_filenames)[:limit]:
-                metadata = self._get_metadata(filename)
-                if metadata:
-                    results.append(metadata)
-            
-            return results
-            
+            return self.get_metadata_many(filenames, generation)
+        
         except Exception as e:
             print(f"❌ 고급 검색 실패: {e}")
             return []
     
+    def _get_criteria_index_keys(self, criteria: dict) -> List[tuple]:
+        """검색 조건을 (조건 종류, 인덱스 키) 목록으로 변환 (인덱스 키는 prefix 제외)"""
+        facets = [
+            ("situations", "situation"),
+            ("items", "item"),
+            ("colors", "color"),
+            ("styling", "styling")
+        ]
+        
+        index_keys = []
+        for criteria_field, facet in facets:
+            for value in criteria.get(criteria_field) or []:
+                index_keys.append((facet, f"{facet}:{value.lower()}"))
+        
+        return index_keys
+    
+    def _ensure_all_files_set(self, generation: Optional[IndexGeneration] = None) -> bool:
+        """전체 파일 Set이 비어 있으면 메타데이터 키로부터 채움 (기존 인덱스 호환)"""
+        generation = generation or self.current_generation()
+        try:
+            if redis_service.scard(generation.all_files_key) > 0:
+                return False
+            
+            filenames = [
+                key.replace(f"{generation.metadata_prefix}:", "", 1)
+                for key in redis_service.scan_iter(f"{generation.metadata_prefix}:*")
+            ]
+            if not filenames:
+                return False
+            
+            redis_service.sadd(generation.all_files_key, *filenames)
+            print(f"✅ 전체 파일 Set 복구: {len(filenames)}개")
+            return True
+        except Exception as e:
+            print(f"❌ 전체 파일 Set 복구 실패: {e}")
+            return False
+    
     def _get_metadata(self, filename: str) -> Optional[dict]:
         """파일 메타데이터 조회"""
+        generation = self.current_generation()
         try:
-            metadata = redis_service.get_json(f"{self.metadata_prefix}:{filename}")
+            metadata = redis_service.get_json(f"{generation.metadata_prefix}:{filename}")
             return metadata
         except Exception as e:
             print(f"❌ 메타데이터 조회 실패: {filename} - {e}")
             return None
     
+    def get_metadata_many(self, filenames: List[str], generation: Optional[IndexGeneration] = None) -> List[dict]:
+        """여러 파일 메타데이터를 MGET 한 번으로 조회 (순서 유지, 없는 파일 제외)"""
+        generation = generation or self.current_generation()
+        if not filenames:
+            return []
+        
+        try:
+            with self.metadata_fetch_latency.time():
+                redis_keys = [f"{generation.metadata_prefix}:{filename}" for filename in filenames]
+                metadata_list = redis_service.mget_json(redis_keys)
+            return [metadata for metadata in metadata_list if metadata]
+        except Exception as e:
+            print(f"❌ 메타데이터 일괄 조회 실패: {e}")
+            return []
+    
+    def get_documents_many(self, filenames: List[str], generation: Optional[IndexGeneration] = None) -> Dict[str, dict]:
+        """여러 파일의 전체 문서를 MGET 한 번으로 조회 (없는 파일은 결과에서 제외)"""
+        generation = generation or self.current_generation()
+        if not filenames:
+            return {}
+        
+        try:
+            redis_keys = [f"{generation.document_prefix}:{filename}" for filename in filenames]
+            documents = redis_service.mget_json(redis_keys)
+            return {
+                filename: document
+                for filename, document in zip(filenames, documents)
+                if document
+            }
+        except Exception as e:
+            print(f"❌ 전체 문서 일괄 조회 실패: {e}")
+            return {}
+    
     def get_index_stats(self) -> dict:
         """인덱스 통계 정보"""
+        generation = self.current_generation()
         try:
             stats = {
                 "total_files": 0,
@@ -437,24 +970,186 @@ class FashionIndexService:
                 "styling_indexes": 0
             }
             
+            # 현재 인덱스 세대
+            stats["generation"] = generation.number
+            
             # 전체 파일 수
-            pattern = f"{self.metadata_prefix}:*"
-            keys = redis_service.keys(pattern)
-            stats["total_files"] = len(keys)
+            stats["total_files"] = redis_service.scard(generation.all_files_key)
             
-            # 각 인덱스 타입별 개수
-            index_types = ["situation", "item", "color", "styling"]
-            for index_type in index_types:
-                pattern = f"{self.index_prefix}:{index_type}:*"
-                keys = redis_service.keys(pattern)
-                stats[f"{index_type}_indexes"] = len(keys)
+            # 각 인덱스 타입별 개수 (레지스트리 기준)
+            for index_type in self.index_types:
+                stats[f"{index_type}_indexes"] = redis_service.scard(f"{generation.registry_prefix}:{index_type}")
             
-            return stats
+            # 인메모리 스냅샷
+            if self.memory_index is not None:
+                stats["memory_index"] = self.memory_index.stats()
             
+            # 메타데이터 일괄 조회 지연시간
+            stats["metadata_fetch_latency"] = self.metadata_fetch_latency.snapshot()
+            
+            return stats
+        
         except Exception as e:
             print(f"❌ 인덱스 통계 조회 실패: {e}")
             return {}
     
+    def _get_index_counts(self, generation: Optional[IndexGeneration] = None) -> tuple:
+        """(인덱싱된 파일 수, 인덱스 키 수)를 전체 파일 Set과 레지스트리로 조회"""
+        generation = generation or self.current_generation()
+        metadata_count = redis_service.scard(generation.all_files_key)
+        index_count = sum(
+            redis_service.scard(f"{generation.registry_prefix}:{index_type}")
+            for index_type in self.index_types
+        )
+        return metadata_count, index_count
+    
+    def _ensure_index_registries(self, generation: Optional[IndexGeneration] = None) -> bool:
+        """레지스트리가 비어 있으면 기존 인덱스 키를 SCAN해서 채움 (기존 인덱스 호환)"""
+        generation = generation or self.current_generation()
+        try:
+            if any(redis_service.scard(f"{generation.registry_prefix}:{index_type}") > 0 for index_type in self.index_types):
+                return False
+            
+            registered_count = 0
+            for index_type in self.index_types:
+                prefix = f"{generation.index_prefix}:{index_type}:"
+                values = [key[len(prefix):] for key in redis_service.scan_iter(f"{prefix}*")]
+                if values:
+                    redis_service.sadd(f"{generation.registry_prefix}:{index_type}", *values)
+                    registered_count += len(values)
+            
+            if registered_count:
+                print(f"✅ 인덱스 레지스트리 복구: {registered_count}개")
+            return registered_count > 0
+        except Exception as e:
+            print(f"❌ 인덱스 레지스트리 복구 실패: {e}")
+            return False
+    
+    def search_by_color_and_item(self, color_candidates: List[str], item_candidates: List[str]) -> Set[str]:
+        """색상 후보 중 하나와 아이템 후보 중 하나를 모두 포함하는 파일 (색상 합집합 ∩ 아이템 합집합)"""
+        generation = self.current_generation()
+        try:
+            color_keys = [f"color_term:{c.lower()}" for c in color_candidates]
+            item_keys = [f"item_term:{i.lower()}" for i in item_candidates]
+            
+            memory_index = self.get_memory_index()
+            if memory_index:
+                if not color_keys or not item_keys:
+                    return set()
+                return set(memory_index.filenames(memory_index.union(color_keys) & memory_index.union(item_keys)))
+            
+            return redis_service.sunion_inter([
+                [f"{generation.index_prefix}:{key}" for key in color_keys],
+                [f"{generation.index_prefix}:{key}" for key in item_keys]
+            ])
+        except Exception as e:
+            print(f"❌ 색상+아이템 검색 실패: {e}")
+            return set()
+    
+    def _record_changes(self, filenames: List[str], generation: Optional[IndexGeneration] = None):
+        """파일 인덱스 변경 기록 (버전 증가 + 변경 로그, 여러 파일을 한 번에)"""
+        generation = generation or self.current_generation()
+        try:
+            # 인덱스 세대 식별자가 없으면 생성 (전체 재구축 후 새 세대 시작)
+            redis_service.set(generation.snapshot_id_key, uuid.uuid4().hex, nx=True)
+            redis_service.append_changelog_many(generation.version_key, generation.changelog_key, filenames, self.changelog_max_entries)
+        except Exception as e:
+            print(f"❌ 인덱스 변경 기록 실패: {len(filenames)}개 파일 - {e}")
+    
+    def get_memory_index(self) -> Optional[FashionBitmapIndex]:
+        """현재 인메모리 스냅샷 반환 (갱신은 백그라운드 스레드에서만, 비활성화 또는 미로드 시 None → Redis 경로 사용)"""
+        if self.memory_index is None:
+            return None
+        
+        return self.memory_index if self.memory_index.snapshot_id else None
+    
+    def start_memory_refresh(self):
+        """인메모리 스냅샷 로드/갱신 스레드 시작 (세대 전환 후 전체 로드도 요청 경로가 아닌 이 스레드에서 수행)"""
+        if self.memory_index is None or self._memory_thread is not None:
+            return
+        
+        def refresh_loop():
+            while not self._memory_stop.is_set():
+                self.refresh_memory_index()
+                self._memory_stop.wait(self.memory_refresh_interval)
+        
+        self._memory_stop.clear()
+        self._memory_thread = threading.Thread(target=refresh_loop, daemon=True, name="index-memory-refresh")
+        self._memory_thread.start()
+    
+    def stop_memory_refresh(self):
+        """인메모리 스냅샷 갱신 스레드 종료"""
+        self._memory_stop.set()
+        self._memory_thread = None
+    
+    def refresh_memory_index(self):
+        """Redis 인덱스 버전을 확인해 인메모리 스냅샷을 전체 로드 또는 증분 갱신"""
+        if self.memory_index is None:
+            return
+        
+        # 다른 스레드가 갱신 중이면 기존 스냅샷 사용
+        if not self._memory_lock.acquire(blocking=False):
+            return
+        
+        try:
+            generation = self.current_generation()
+            snapshot_id, version = redis_service.mget([generation.snapshot_id_key, generation.version_key])
+            version = int(version or 0)
+            if not snapshot_id:
+                return
+            
+            current = self.memory_index
+            if snapshot_id != current.snapshot_id or version < current.version:
+                self._load_memory_index(snapshot_id, version, generation)
+                return
+            
+            if version == current.version:
+                return
+            
+            since = max(current.version - self.changelog_overlap, 0)
+            changed_files, log_size, oldest_version = redis_service.get_changelog_since(generation.changelog_key, since)
+            
+            # 변경 로그가 잘려 나가 놓친 변경이 있을 수 있으면 전체 로드
+            if log_size >= self.changelog_max_entries and oldest_version > since + 1:
+                self._load_memory_index(snapshot_id, version, generation)
+                return
+            
+            documents = self.get_documents_many(changed_files, generation)
+            for filename in changed_files:
+                if filename in documents:
+                    current.upsert(filename, self._compute_posting_keys(documents[filename]))
+                else:
+                    current.remove(filename)
+            current.version = version
+            print(f"🔄 인메모리 인덱스 증분 갱신: {len(changed_files)}개 파일 (v{version})")
+        
+        except Exception as e:
+            print(f"❌ 인메모리 인덱스 갱신 실패: {e}")
+            logger.error(f"인메모리 인덱스 갱신 실패: {e}")
+        finally:
+            self._memory_lock.release()
+    
+    def _load_memory_index(self, snapshot_id: str, version: int, generation: IndexGeneration):
+        """Redis에 저장된 전체 문서로 인메모리 스냅샷 전체 로드 후 교체"""
+        start_time = time.time()
+        snapshot = FashionBitmapIndex()
+        
+        filenames = sorted(redis_service.smembers(generation.all_files_key))
+        documents = self.get_documents_many(filenames, generation)
+        for filename in filenames:
+            if filename in documents:
+                snapshot.upsert(filename, self._compute_posting_keys(documents[filename]))
+        
+        snapshot.snapshot_id = snapshot_id
+        snapshot.version = version
+        self.memory_index = snapshot
+        print(f"✅ 인메모리 인덱스 로드 완료: {len(snapshot)}개 파일, {time.time() - start_time:.2f}초 (v{version})")
+    
+    def _is_schema_current(self, generation: Optional[IndexGeneration] = None) -> bool:
+        """저장된 인덱스 스키마 버전이 현재 코드와 같은지 확인"""
+        generation = generation or self.current_generation()
+        return redis_service.get(generation.schema_version_key) == str(self.INDEX_SCHEMA_VERSION)
+    
     def _check_and_recover_indexes(self):
         """서버 시작 시 인덱스 존재 여부 확인 및 자동 복구"""
         try:
@@ -471,41 +1166,54 @@ class FashionIndexService:
                 print(f"❌ Redis 연결 실패: {e}")
                 return
             
+            # 이전 실행에서 정리하지 못한 인덱스 세대가 있으면 백그라운드 정리
+            if redis_service.scard(self.retired_generations_key) > 0:
+                self.schedule_generation_gc()
+            
+            # 레지스트리 이전에 구축된 인덱스 호환 (시작 시 1회 SCAN)
+            self._ensure_all_files_set()
+            self._ensure_index_registries()
+            
             # 인덱스 존재 여부 확인
-            metadata_keys = redis_service.keys(f"{self.metadata_prefix}:*")
-            index_keys = redis_service.keys(f"{self.index_prefix}:*")
+            metadata_count, index_count = self._get_index_counts()
             
             print(f"🔍 인덱스 상태 확인:")
-            print(f"   - 메타데이터: {len(metadata_keys)}개")
-            print(f"   - 인덱스 키: {len(index_keys)}개")
+            print(f"   - 메타데이터: {metadata_count}개")
+            print(f"   - 인덱스 키: {index_count}개")
             
             # 복구 조건 확인
             needs_recovery = False
             
-            if len(metadata_keys) == 0 and len(index_keys) == 0:
+            if metadata_count == 0 and index_count == 0:
                 print("🆕 처음 실행 - 인덱스 구축 시작")
                 needs_recovery = True
-            elif len(metadata_keys) == 0 and len(index_keys) > 0:
+            elif metadata_count == 0 and index_count > 0:
                 print("⚠️ 메타데이터 없음, 인덱스만 존재 - 전체 재구축 필요")
                 needs_recovery = True
-            elif len(index_keys) < len(metadata_keys) * 0.3:
+            elif index_count < metadata_count * 0.3:
                 print("⚠️ 인덱스 심각 부족 - 복구 필요")
                 needs_recovery = True
-            elif len(metadata_keys) > 0 and len(index_keys) == 0:
+            elif metadata_count > 0 and index_count == 0:
                 print("⚠️ 메타데이터 존재하지만 인덱스 없음 - 복구 필요")
                 needs_recovery = True
             
+            # 인덱스 키 구성이 바뀐 경우 증분 업데이트로는 기존 파일이 반영되지 않으므로 전체 재구축
+            needs_full_rebuild = metadata_count > 0 and not self._is_schema_current()
+            if needs_full_rebuild:
+                print(f"⚠️ 인덱스 스키마 버전 불일치 (현재 v{self.INDEX_SCHEMA_VERSION}) - 전체 재구축 필요")
+                needs_recovery = True
+            
             if needs_recovery:
                 print("🔄 인덱스 자동 복구 시작")
                 try:
-                    result = self.build_indexes(force_rebuild=False)
+                    result = self.build_indexes(force_rebuild=needs_full_rebuild)
                     print(f"✅ 자동 인덱스 복구 완료: {result}")
                 except Exception as e:
                     print(f"❌ 자동 인덱스 복구 실패: {e}")
                     logger.error(f"자동 인덱스 복구 실패: {e}")
             else:
                 print("✅ 인덱스 정상 - 복구 불필요")
-                
+        
         except Exception as e:
             print(f"❌ 인덱스 상태 확인 실패: {e}")
             logger.error(f"인덱스 상태 확인 실패: {e}")
@@ -513,19 +1221,18 @@ class FashionIndexService:
     def is_index_healthy(self) -> bool:
         """인덱스 상태가 정상인지 확인"""
         try:
-            metadata_keys = redis_service.keys(f"{self.metadata_prefix}:*")
-            index_keys = redis_service.keys(f"{self.index_prefix}:*")
+            metadata_count, index_count = self._get_index_counts()
             
             # 메타데이터가 있는데 인덱스가 50% 미만이면 비정상
-            if len(metadata_keys) > 0 and len(index_keys) < len(metadata_keys) * 0.5:
+            if metadata_count > 0 and index_count < metadata_count * 0.5:
                 return False
             
             # 메타데이터가 20개 이상인데 인덱스가 10개 미만이면 비정상
-            if len(metadata_keys) > 20 and len(index_keys) < 10:
+            if metadata_count > 20 and index_count < 10:
                 return False
-                
-            return True
             
+            return True
+        
         except Exception as e:
             print(f"❌ 인덱스 상태 확인 실패: {e}")
             return False
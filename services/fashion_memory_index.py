@@ -0,0 +1,117 @@
+import random
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+class FashionBitmapIndex:
+    """프로세스 내 역색인 스냅샷 (파일별 정수 ID + 인덱스 키별 int 비트맵)"""
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.snapshot_id: Optional[str] = None  # Redis 인덱스 세대 식별자 (재구축 시 변경)
+        self.version = 0  # 마지막으로 반영한 Redis 인덱스 버전
+        self.clear()
+    
+    def clear(self):
+        """스냅샷 초기화"""
+        with self._lock:
+            self._ids: Dict[str, int] = {}
+            self._filenames: List[str] = []
+            self._file_keys: Dict[int, Set[str]] = {}  # 파일 ID → 포함된 인덱스 키
+            self._postings: Dict[str, int] = {}  # 인덱스 키 → 파일 ID 비트맵
+            self._all_bits = 0
+    
+    def __len__(self) -> int:
+        return self._all_bits.bit_count()
+    
+    def upsert(self, filename: str, index_keys: Iterable[str]):
+        """파일의 인덱스 키를 교체 (새 파일이면 다음 ID 할당)"""
+        with self._lock:
+            file_id = self._ids.get(filename)
+            if file_id is None:
+                file_id = len(self._filenames)
+                self._ids[filename] = file_id
+                self._filenames.append(filename)
+            
+            bit = 1 << file_id
+            new_keys = set(index_keys)
+            old_keys = self._file_keys.get(file_id, set())
+            
+            for key in old_keys - new_keys:
+                self._postings[key] &= ~bit
+                if not self._postings[key]:
+                    del self._postings[key]
+            for key in new_keys - old_keys:
+                self._postings[key] = self._postings.get(key, 0) | bit
+            
+            self._file_keys[file_id] = new_keys
+            self._all_bits |= bit
+    
+    def remove(self, filename: str):
+        """파일을 스냅샷에서 제거 (ID는 재사용하지 않음)"""
+        with self._lock:
+            file_id = self._ids.get(filename)
+            if file_id is None:
+                return
+            self.upsert(filename, ())
+            self._all_bits &= ~(1 << file_id)
+    
+    def posting(self, index_key: str) -> int:
+        """인덱스 키의 비트맵 (없으면 0)"""
+        return self._postings.get(index_key, 0)
+    
+    def intersect(self, index_keys: Iterable[str]) -> int:
+        """인덱스 키들의 교집합 비트맵"""
+        bits = None
+        for key in index_keys:
+            bits = self.posting(key) if bits is None else bits & self.posting(key)
+            if not bits:
+                return 0
+        return bits or 0
+    
+    def union(self, index_keys: Iterable[str]) -> int:
+        """인덱스 키들의 합집합 비트맵"""
+        bits = 0
+        for key in index_keys:
+            bits |= self.posting(key)
+        return bits
+    
+    def filenames(self, bits: int) -> List[str]:
+        """비트맵을 파일명 목록으로 변환"""
+        result = []
+        while bits:
+            low_bit = bits & -bits
+            result.append(self._filenames[low_bit.bit_length() - 1])
+            bits ^= low_bit
+        return result
+    
+    def sample(self, bits: int, limit: int) -> List[str]:
+        """비트맵에서 최대 limit개 파일을 랜덤 선택"""
+        filenames = self.filenames(bits)
+        if len(filenames) <= limit:
+            return filenames
+        return random.sample(filenames, limit)
+    
+    def sample_all(self, limit: int) -> List[str]:
+        """전체 파일에서 최대 limit개 랜덤 선택"""
+        return self.sample(self._all_bits, limit)
+    
+    def weighted_top(self, weighted_keys: Dict[str, float], limit: int) -> List[tuple]:
+        """인덱스 키 가중치 합이 높은 순으로 최대 limit개 (파일명, 점수) 반환"""
+        candidate_bits = self.union(weighted_keys)
+        scored = []
+        for filename in self.filenames(candidate_bits):
+            bit = 1 << self._ids[filename]
+            score = sum(weight for key, weight in weighted_keys.items() if self.posting(key) & bit)
+            scored.append((filename, score))
+        
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+    
+    def stats(self) -> dict:
+        """스냅샷 통계"""
+        return {
+            "snapshot_id": self.snapshot_id,
+            "version": self.version,
+            "files": len(self),
+            "index_keys": len(self._postings)
+        }
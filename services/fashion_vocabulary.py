@@ -0,0 +1,113 @@
+"""패션 검색 어휘 (색상/아이템 키워드, 색상 동의어)"""
+from services.keyword_matcher import KeywordAutomaton
+
+# 사용자 입력에서 인식하는 색상 키워드
+COLOR_KEYWORDS = [
+    "블랙", "화이트", "그레이", "브라운", "네이비", "베이지",
+    "검정", "흰색", "회색", "갈색", "남색",
+    "검은", "검은색", "하얀", "하얀색", "흰", "흰색",
+    "파란", "파란색", "파랑", "하늘색", "스카이블루",
+    "빨간", "빨간색", "빨강", "레드", "빨강색",
+    "주황", "주황색", "오렌지",
+    "노란", "노란색", "노랑", "옐로우", "노랑색",
+    "초록", "초록색", "녹색", "그린",
+    "보라", "보라색", "퍼플", "보랑",
+    "분홍", "분홍색", "핑크",
+    "베이지색", "카키", "카키색",
+    "네이비블루", "다크블루", "라이트블루",
+    "다크그레이", "라이트그레이", "실버",
+    "골드", "골든", "금색"
+]
+
+# 상의/하의 중심 아이템 키워드
+ITEM_KEYWORDS = [
+    # 상의
+    "티셔츠", "반팔티", "긴팔티", "셔츠", "폴로셔츠", "니트", "스웨터",
+    "맨투맨", "후드티", "카디건", "가디건", "베스트", "조끼",
+    "블라우스", "헨리넥", "터틀넥", "목폴라", "블레이저", "자켓", "재킷",
+
+    # 하의
+    "슬랙스", "치노팬츠", "청바지", "데님", "데님팬츠", "팬츠", "바지",
+    "와이드팬츠", "스트레이트팬츠", "테이퍼드팬츠", "스키니진",
+    "카고팬츠", "조거팬츠", "스웨트팬츠",
+    "반바지", "쇼츠", "숏팬츠", "하프팬츠",
+    "스커트"
+]
+
+# 영어 색상 키워드를 한글 색상 키워드로 매핑 (Redis 인덱스는 한글로 저장되어 있음)
+COLOR_MAPPING = {
+    "블랙": ["검정", "검은", "블랙"],
+    "화이트": ["흰색", "하얀", "화이트"],
+    "그레이": ["회색", "그레이"],
+    "브라운": ["갈색", "브라운"],
+    "네이비": ["남색", "네이비"],
+    "베이지": ["베이지"],
+    "레드": ["빨간", "빨강", "레드"],
+    "오렌지": ["주황", "오렌지"],
+    "옐로우": ["노란", "노랑", "옐로우"],
+    "그린": ["초록", "녹색", "그린"],
+    "퍼플": ["보라", "퍼플"],
+    "핑크": ["분홍", "핑크"],
+    "스카이블루": ["하늘색", "파란", "파랑", "스카이블루"],
+    "다크블루": ["남색", "다크블루"],
+    "라이트블루": ["하늘색", "라이트블루"],
+    "다크그레이": ["회색", "다크그레이"],
+    "라이트그레이": ["회색", "라이트그레이"],
+    "실버": ["회색", "실버"],
+    "골드": ["금색", "골드"],
+    "골든": ["금색", "골든"],
+    "카키": ["카키"]
+}
+
+# 인덱스/검색 키워드 추출용 일반 패션 키워드
+FASHION_KEYWORDS = [
+    "니트", "데님", "가죽", "면", "실크", "울", "폴리에스터",
+    "긴팔", "반팔", "와이드", "스키니", "레귤러", "오버핏", "슬림",
+    "블랙", "화이트", "그레이", "브라운", "네이비", "베이지",
+    "티셔츠", "셔츠", "니트", "스웨터", "후드티", "맨투맨",
+    "슬랙스", "청바지", "팬츠", "반바지", "스커트",
+    "스니커즈", "로퍼", "옥스포드", "부츠", "샌들",
+    "넣기", "턱", "핏", "실루엣", "밸런스"
+]
+
+# 인덱스 구축 시 색상값에서 찾는 전체 색상 어휘 (입력 키워드 + 동의어)
+COLOR_TERMS = sorted({
+    term.lower()
+    for term in COLOR_KEYWORDS + list(COLOR_MAPPING) + [kor for kors in COLOR_MAPPING.values() for kor in kors]
+})
+
+# 인덱스 구축 시 아이템명에서 찾는 전체 아이템 어휘
+ITEM_TERMS = sorted({term.lower() for term in ITEM_KEYWORDS})
+
+
+# 어휘별 키워드 매처 (import 시 한 번 구성)
+COLOR_KEYWORD_MATCHER = KeywordAutomaton([c.lower() for c in COLOR_KEYWORDS])
+COLOR_MAPPING_MATCHER = KeywordAutomaton({eng_color: [eng_color.lower()] for eng_color in COLOR_MAPPING})
+ITEM_KEYWORD_MATCHER = KeywordAutomaton([i.lower() for i in ITEM_KEYWORDS])
+COLOR_TERM_MATCHER = KeywordAutomaton(COLOR_TERMS)
+ITEM_TERM_MATCHER = KeywordAutomaton(ITEM_TERMS)
+FASHION_KEYWORD_MATCHER = KeywordAutomaton(FASHION_KEYWORDS)
+
+
+def extract_color_candidates(user_input_lower: str) -> list:
+    """사용자 입력에서 색상 후보 추출 (영어 색상은 한글 동의어로 확장)"""
+    color_candidates = COLOR_KEYWORD_MATCHER.keywords_in(user_input_lower)
+    
+    # 영어 키워드를 한글 키워드로 확장
+    expanded_color_candidates = set(color_candidates)
+    for eng_color in COLOR_MAPPING_MATCHER.categories_in(user_input_lower):
+        expanded_color_candidates.update(COLOR_MAPPING[eng_color])
+        expanded_color_candidates.add(eng_color)  # 원본도 유지
+    
+    return list(expanded_color_candidates)
+
+
+def extract_item_candidates(user_input_lower: str) -> list:
+    """사용자 입력에서 아이템 후보 추출"""
+    item_candidates = ITEM_KEYWORD_MATCHER.keywords_in(user_input_lower)
+    
+    # "셔츠" 입력 시 "티셔츠" 제외하는 로직
+    if "셔츠" in item_candidates and "티셔츠" in item_candidates:
+        item_candidates.remove("티셔츠")
+    
+    return item_candidates
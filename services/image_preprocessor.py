@@ -0,0 +1,66 @@
+import io
+import logging
+from typing import Optional, Tuple
+
+from config import settings
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow가 없으면 원본 그대로 전송
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# 출력 포맷별 MIME 타입 / 확장자
+FORMAT_MEDIA_TYPES = {"JPEG": "image/jpeg", "WEBP": "image/webp"}
+FORMAT_EXTENSIONS = {"JPEG": "jpg", "WEBP": "webp"}
+
+# 이미 충분히 작은 JPEG/WebP는 다시 인코딩하지 않음 (저장된 썸네일 재사용 시 화질 손실 누적 방지)
+PASSTHROUGH_MAX_BYTES = 400 * 1024
+
+def output_format() -> str:
+    """설정된 출력 포맷 (JPEG/WEBP 외에는 JPEG)"""
+    image_format = settings.VISION_IMAGE_FORMAT.upper()
+    return image_format if image_format in FORMAT_MEDIA_TYPES else "JPEG"
+
+def preprocess_image_for_vision(image_bytes: bytes) -> Tuple[bytes, Optional[str]]:
+    """비전 API 전송 전 EXIF 회전 보정 → 최대 변 길이로 축소 → JPEG/WebP 재인코딩 ((바이트, MIME 타입), 실패 시 (원본, None))"""
+    if not settings.VISION_PREPROCESS_ENABLED or Image is None:
+        return image_bytes, None
+    
+    try:
+        image_format = output_format()
+        max_edge = settings.VISION_IMAGE_MAX_EDGE
+        
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            orientation = image.getexif().get(0x0112, 1)  # EXIF Orientation
+            if (image.format == image_format and orientation == 1 and max(image.size) <= max_edge
+                    and len(image_bytes) <= PASSTHROUGH_MAX_BYTES):
+                return image_bytes, FORMAT_MEDIA_TYPES[image_format]
+            
+            original_size = image.size
+            if image.format == "JPEG":
+                image.draft("RGB", (max_edge, max_edge))  # JPEG은 축소 디코딩으로 디코딩 시간/메모리 절감
+            
+            image = ImageOps.exif_transpose(image)
+            if image.mode in ("RGBA", "LA", "P"):
+                # 투명 배경은 흰색으로 합성
+                image = image.convert("RGBA")
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+            
+            image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+            
+            output = io.BytesIO()
+            image.save(output, format=image_format, quality=settings.VISION_IMAGE_QUALITY)
+            processed_bytes = output.getvalue()
+        
+        print(f"🗜️ 이미지 전처리: {original_size[0]}x{original_size[1]} {len(image_bytes)} bytes → {image.size[0]}x{image.size[1]} {len(processed_bytes)} bytes")
+        return processed_bytes, FORMAT_MEDIA_TYPES[image_format]
+    
+    except Exception as e:
+        logger.error(f"이미지 전처리 실패 (원본 전송): {e}")
+        return image_bytes, None
@@ -0,0 +1,232 @@
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime
+
+from services.redis_service import redis_service
+from services.async_redis_service import async_redis_service
+from services.fashion_index_service import fashion_index_service
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class IndexWorkerService:
+    """인덱스 변경 이벤트 큐(Redis Stream)와 리더 워커 한 곳에서만 실행되는 백그라운드 소비자"""
+    
+    def __init__(self):
+        self.stream_key = "fashion_index:changes"
+        self.dead_letter_key = "fashion_index:changes:dead"  # 재시도 횟수를 넘긴 이벤트 (수동 확인용)
+        self.group_name = "index-worker"
+        self.consumer_name = "leader"  # 리더가 바뀌어도 이전 리더가 처리하지 못한 이벤트를 이어서 읽도록 고정
+        self.leader_key = "fashion_index:worker_leader"
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        
+        self.enabled = settings.INDEX_WORKER_ENABLED
+        self.stream_max_length = settings.INDEX_QUEUE_MAX_LENGTH
+        self.max_lag = settings.INDEX_QUEUE_MAX_LAG
+        self.batch_size = settings.INDEX_WORKER_BATCH_SIZE
+        self.leader_ttl_ms = settings.INDEX_WORKER_LEADER_TTL_MS
+        self.max_attempts = settings.INDEX_WORKER_MAX_ATTEMPTS
+        self.block_ms = 1000  # 동기 Redis 소켓 타임아웃(5초)보다 짧게
+        
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._threads = []
+        self.stats = {
+            "enqueued": 0,
+            "enqueue_failed": 0,
+            "batches": 0,
+            "events": 0,
+            "indexed": 0,
+            "removed": 0,
+            "failed": 0,
+            "requeued": 0,
+            "dead_lettered": 0,
+            "catch_ups": 0,
+            "last_batch_at": None
+        }
+    
+    def _event(self, op: str, filename: str, source: str, attempts: int = 0) -> dict:
+        """Stream에 기록할 변경 이벤트 (attempts: 반영 실패로 다시 넣은 횟수)"""
+        return {"op": op, "filename": filename, "source": source, "attempts": str(attempts), "created_at": datetime.now().isoformat()}
+    
+    def enqueue(self, op: str, filename: str, source: str) -> bool:
+        """변경 이벤트 추가 (op: upsert/delete), 워커 비활성화 또는 실패 시 False → 호출 측에서 직접 반영"""
+        if not self.enabled:
+            return False
+        
+        entry_id = redis_service.xadd(self.stream_key, self._event(op, filename, source), self.stream_max_length)
+        self.stats["enqueued" if entry_id else "enqueue_failed"] += 1
+        return entry_id is not None
+    
+    async def enqueue_async(self, op: str, filename: str, source: str) -> bool:
+        """변경 이벤트 추가 (요청 경로용 비동기 버전)"""
+        if not self.enabled:
+            return False
+        
+        entry_id = await async_redis_service.xadd(self.stream_key, self._event(op, filename, source), self.stream_max_length)
+        self.stats["enqueued" if entry_id else "enqueue_failed"] += 1
+        return entry_id is not None
+    
+    def start(self):
+        """리더 선출/이벤트 소비 스레드 시작 (모든 워커에서 호출, 실제 소비는 리더만)"""
+        if not self.enabled or self._threads:
+            return
+        
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._heartbeat_loop, daemon=True, name="index-worker-heartbeat"),
+            threading.Thread(target=self._consume_loop, daemon=True, name="index-worker")
+        ]
+        for thread in self._threads:
+            thread.start()
+        print(f"🚀 인덱스 워커 시작: {self.worker_id}")
+    
+    def stop(self):
+        """스레드 종료 및 리더 락 반납 (다른 워커가 바로 이어받도록)"""
+        self._stop.set()
+        if self.is_leader:
+            redis_service.release_lock(self.leader_key, self.worker_id)
+            self.is_leader = False
+        self._threads = []
+    
+    def _heartbeat_loop(self):
+        """리더 락 획득/연장 (처리가 오래 걸려도 락이 만료되지 않도록 소비 스레드와 분리)"""
+        interval = self.leader_ttl_ms / 3000
+        while not self._stop.is_set():
+            try:
+                if self.is_leader:
+                    if not redis_service.renew_lock(self.leader_key, self.worker_id, self.leader_ttl_ms):
+                        print(f"⚠️ 인덱스 워커 리더 상실: {self.worker_id}")
+                        self.is_leader = False
+                elif redis_service.acquire_lock(self.leader_key, self.worker_id, self.leader_ttl_ms):
+                    print(f"👑 인덱스 워커 리더 선출: {self.worker_id}")
+                    self.is_leader = True
+            except Exception as e:
+                logger.error(f"인덱스 워커 리더 확인 실패: {e}")
+                self.is_leader = False
+            self._stop.wait(interval)
+    
+    def _consume_loop(self):
+        """리더인 동안 이벤트를 배치 단위로 읽어 인덱스에 반영"""
+        leading = False
+        read_id = "0"
+        
+        while not self._stop.is_set():
+            if not self.is_leader:
+                leading = False
+                self._stop.wait(0.5)
+                continue
+            
+            try:
+                if not leading:
+                    # 리더가 된 직후: 인덱스 상태 확인/복구는 리더 한 곳에서만 수행
+                    leading = True
+                    read_id = "0"  # 이전 리더가 ACK하지 못한 이벤트부터
+                    redis_service.ensure_stream_group(self.stream_key, self.group_name)
+                    fashion_index_service._check_and_recover_indexes()
+                
+                # 밀린 이벤트가 너무 많으면 개별 반영 대신 증분 빌드로 한 번에 따라잡음
+                if redis_service.xlen(self.stream_key) > self.max_lag:
+                    self._catch_up()
+                    read_id = "0"
+                    continue
+                
+                entries = redis_service.xreadgroup(self.stream_key, self.group_name, self.consumer_name, read_id, self.batch_size, self.block_ms)
+                if entries is None:
+                    # 그룹이 없어졌거나 Redis 오류 → 그룹 재생성 후 재시도
+                    redis_service.ensure_stream_group(self.stream_key, self.group_name)
+                    self._stop.wait(1)
+                    continue
+                
+                if not entries:
+                    # 미처리 이벤트를 다 읽었으면 새 이벤트 대기
+                    read_id = ">"
+                    continue
+                
+                if not self._apply(entries):
+                    # 일부 반영 실패 (다시 넣은 이벤트가 바로 재시도되지 않도록 잠시 대기)
+                    self._stop.wait(1)
+            
+            except Exception as e:
+                print(f"❌ 인덱스 워커 처리 실패: {e}")
+                logger.error(f"인덱스 워커 처리 실패: {e}")
+                read_id = "0"  # ACK하지 못한 배치부터 다시 읽기
+                self._stop.wait(1)
+    
+    def _apply(self, entries: list) -> bool:
+        """이벤트 배치를 파일별 마지막 이벤트로 합쳐 반영 후 ACK + 삭제 (실패한 파일은 재시도 횟수를 올려 다시 넣거나 dead-letter로), 모두 반영했으면 True"""
+        latest_events = {}
+        entry_ids = {}
+        for entry_id, fields in entries:
+            filename = fields.get("filename")
+            if filename:
+                latest_events[filename] = fields
+                entry_ids.setdefault(filename, []).append(entry_id)
+        
+        upserts = [filename for filename, fields in latest_events.items() if fields.get("op", "upsert") == "upsert"]
+        deletes = [filename for filename, fields in latest_events.items() if fields.get("op") == "delete"]
+        result = fashion_index_service.apply_changes(upserts, deletes)
+        failed_files = set(result["failed_files"])
+        
+        # 반영한 이벤트와 다시 넣은(또는 dead-letter로 옮긴) 이벤트만 ACK, 다시 넣지 못한 이벤트는 pending으로 남겨 재시도
+        ack_ids = [entry_id for entry_id, fields in entries if fields.get("filename") not in failed_files]
+        for filename in failed_files:
+            if self._requeue(latest_events[filename]):
+                ack_ids.extend(entry_ids[filename])
+        redis_service.xack_delete(self.stream_key, self.group_name, ack_ids)
+        
+        self.stats["batches"] += 1
+        self.stats["events"] += len(entries)
+        self.stats["indexed"] += result["indexed"]
+        self.stats["removed"] += result["removed"]
+        self.stats["failed"] += len(failed_files)
+        self.stats["last_batch_at"] = datetime.now().isoformat()
+        print(f"🔄 인덱스 변경 반영: 이벤트 {len(entries)}개 → 인덱싱 {result['indexed']}개, 제거 {result['removed']}개, 실패 {len(failed_files)}개")
+        return not failed_files
+    
+    def _requeue(self, fields: dict) -> bool:
+        """반영 실패 이벤트를 재시도 횟수를 올려 Stream 끝에 다시 추가 (횟수 초과 시 dead-letter Stream으로), 기록 성공 여부 반환"""
+        attempts = int(fields.get("attempts") or 0) + 1
+        event = self._event(fields.get("op", "upsert"), fields["filename"], fields.get("source", ""), attempts)
+        
+        if attempts >= self.max_attempts:
+            entry_id = redis_service.xadd(self.dead_letter_key, event, self.stream_max_length)
+            if entry_id:
+                self.stats["dead_lettered"] += 1
+                print(f"☠️ 인덱스 변경 이벤트 dead-letter 이동: {fields['filename']} ({attempts}회 실패)")
+        else:
+            entry_id = redis_service.xadd(self.stream_key, event, self.stream_max_length)
+            if entry_id:
+                self.stats["requeued"] += 1
+        return entry_id is not None
+    
+    def _catch_up(self):
+        """밀린 이벤트를 버리고 증분 빌드(ETag 비교)로 한 번에 반영"""
+        lag = redis_service.xlen(self.stream_key)
+        print(f"⚠️ 인덱스 변경 이벤트 {lag}개 밀림 (기준 {self.max_lag}개) - 증분 빌드로 따라잡기")
+        
+        # Stream을 비운 뒤 빌드: 비운 이후 들어온 이벤트는 새 그룹에서 그대로 처리되고, 이전 이벤트는 빌드가 S3 목록으로 반영
+        redis_service.delete(self.stream_key)
+        redis_service.ensure_stream_group(self.stream_key, self.group_name)
+        fashion_index_service.build_indexes(force_rebuild=False)
+        
+        self.stats["catch_ups"] += 1
+    
+    def get_status(self) -> dict:
+        """워커 상태 및 처리 지연 (lag = 아직 처리하지 않은 이벤트 수)"""
+        return {
+            "worker_id": self.worker_id,
+            "enabled": self.enabled,
+            "is_leader": self.is_leader,
+            "leader": redis_service.get(self.leader_key),
+            "lag": redis_service.xlen(self.stream_key),
+            "dead_letters": redis_service.xlen(self.dead_letter_key),
+            "max_lag": self.max_lag,
+            **self.stats
+        }
+
+# 전역 인스턴스
+index_worker_service = IndexWorkerService()
@@ -0,0 +1,98 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple, Union
+
+class KeywordAutomaton:
+    """여러 키워드를 텍스트 한 번 순회로 찾는 Aho-Corasick 매처 (결과는 어휘 순서 유지)"""
+    
+    def __init__(self, vocabulary: Union[Iterable[str], Dict[str, Iterable[str]]]):
+        # 어휘: 키워드 목록 또는 {카테고리: 키워드 목록}
+        if isinstance(vocabulary, dict):
+            entries = [(keyword, category) for category, keywords in vocabulary.items() for keyword in keywords]
+        else:
+            entries = [(keyword, None) for keyword in vocabulary]
+        
+        self.entries: List[Tuple[str, str]] = entries
+        
+        # 같은 키워드가 어휘에 여러 번 있으면 모든 위치를 결과에 포함 (기존 in 스캔과 동일)
+        self._positions: Dict[str, List[int]] = {}
+        for position, (keyword, _) in enumerate(entries):
+            if keyword:
+                self._positions.setdefault(keyword, []).append(position)
+        
+        self._build(list(self._positions))
+    
+    def _build(self, keywords: List[str]):
+        """트라이 + 실패 링크 구성"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword)
+        
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def _iter_matches(self, text: str):
+        """텍스트를 한 번 순회하며 발견된 키워드를 차례로 반환"""
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for keyword in self._output[state]:
+                yield keyword
+    
+    def find_all(self, text: str) -> List[Tuple[str, str]]:
+        """텍스트에 포함된 (키워드, 카테고리) 목록 (어휘 순서)"""
+        if not text:
+            return []
+        
+        positions = set()
+        for keyword in self._iter_matches(text):
+            positions.update(self._positions[keyword])
+        return [self.entries[position] for position in sorted(positions)]
+    
+    def keywords_in(self, text: str) -> List[str]:
+        """텍스트에 포함된 키워드 목록 (어휘 순서)"""
+        return [keyword for keyword, _ in self.find_all(text)]
+    
+    def categories_in(self, text: str) -> List[str]:
+        """텍스트에 키워드가 하나라도 포함된 카테고리 목록 (어휘 순서, 중복 제거)"""
+        categories = []
+        for _, category in self.find_all(text):
+            if category not in categories:
+                categories.append(category)
+        return categories
+    
+    def first_in(self, text: str):
+        """텍스트에 포함된 키워드 중 어휘 순서상 첫 번째 (없으면 None)"""
+        matches = self.find_all(text)
+        return matches[0][0] if matches else None
+    
+    def contains_any(self, text: str) -> bool:
+        """텍스트에 키워드가 하나라도 포함되는지 여부"""
+        if not text:
+            return False
+        
+        for _ in self._iter_matches(text):
+            return True
+        return False
@@ -0,0 +1,58 @@
+import threading
+import time
+from contextlib import contextmanager
+
+class LatencyHistogram:
+    """호출 지연시간 히스토그램 (밀리초 버킷, 스레드 안전)"""
+    
+    DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+    
+    def __init__(self, buckets_ms: tuple = None):
+        self.buckets_ms = tuple(buckets_ms or self.DEFAULT_BUCKETS_MS)
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.buckets_ms) + 1)  # 마지막 칸은 +Inf
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+    
+    def observe(self, seconds: float):
+        """지연시간 기록 (초 단위 입력)"""
+        elapsed_ms = seconds * 1000
+        index = len(self.buckets_ms)
+        for i, bound in enumerate(self.buckets_ms):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+    
+    @contextmanager
+    def time(self):
+        """with 블록 실행 시간을 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+    
+    def snapshot(self) -> dict:
+        """현재까지의 통계 반환"""
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            sum_ms = self._sum_ms
+            max_ms = self._max_ms
+        
+        buckets = {f"<={bound}ms": counts[i] for i, bound in enumerate(self.buckets_ms)}
+        buckets["+Inf"] = counts[-1]
+        
+        return {
+            "count": count,
+            "avg_ms": round(sum_ms / count, 3) if count else 0.0,
+            "max_ms": round(max_ms, 3),
+            "buckets": buckets
+        }
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -5,6 +6,8 @@ from datetime import datetime
 from services.claude_vision_service import claude_vision_service
 from services.fashion_expert_service import get_fashion_expert_service
 from services.s3_service import s3_service
+from services.fashion_index_service import fashion_index_service
+from services.index_worker_service import index_worker_service
 from services.utils import save_outfit_analysis_to_json, analyze_situations_from_outfit
 
 logger = logging.getLogger(__name__)
@@ -16,8 +19,8 @@ class OutfitAnalyzerService:
         self.claude_vision_service = claude_vision_service
         self.s3_service = s3_service
         
-    async def analyze_outfit_from_url(self, image_url: str, room_id: Optional[str] = None, prompt: Optional[str] = None) -> Dict[str, Any]:
-        """S3 이미지 링크 기반 착장 분석"""
+    async def analyze_outfit_from_url(self, image_url: str, room_id: Optional[str] = None, prompt: Optional[str] = None, s3_key: Optional[str] = None) -> Dict[str, Any]:
+        """S3 이미지 링크 기반 착장 분석 (s3_key를 알면 공개 URL 대신 S3 클라이언트로 조회)"""
         
         print(f"🔍 analyze_outfit_from_url 호출됨 (S3 링크)")
         print(f"🔍 claude_vision_service 상태: {self.claude_vision_service is not None}")
@@ -29,9 +32,12 @@ class OutfitAnalyzerService:
         
         try:
             # S3 이미지 링크 분석
-            image_analysis = self.claude_vision_service.analyze_outfit_from_url(
+            # 동기 클라이언트 호출은 스레드에서 실행 (배치 분석 동시 실행 시 이벤트 루프 블로킹 방지)
+            image_analysis = await asyncio.to_thread(
+                self.claude_vision_service.analyze_outfit_from_url,
                 image_url=image_url,
-                prompt=prompt
+                prompt=prompt,
+                s3_key=s3_key
             )
             print("✅ Claude API 호출 완료")
             
@@ -68,6 +74,10 @@ class OutfitAnalyzerService:
                         # S3에 JSON 업로드
                         s3_json_url = self.s3_service.upload_json(json_data, image_filename)
                         print(f"✅ S3 JSON 업로드 완료: {s3_json_url}")
+                        
+                        # 인덱스 워커가 반영하도록 변경 이벤트 추가 (큐에 넣지 못하면 바로 인덱싱)
+                        if not await index_worker_service.enqueue_async("upsert", image_filename, "analysis"):
+                            fashion_index_service.reindex_file(image_filename, json_data)
                     else:
                         print(f"ℹ️ JSON 파일이 이미 존재합니다: {image_filename}")
                         
@@ -101,7 +111,8 @@ class OutfitAnalyzerService:
         
         try:
             # 이미지 바이트 분석
-            image_analysis = self.claude_vision_service.analyze_outfit(
+            image_analysis = await asyncio.to_thread(
+                self.claude_vision_service.analyze_outfit,
                 image_bytes=image_bytes,
                 filename=filename
             )
@@ -140,6 +151,10 @@ class OutfitAnalyzerService:
                         # S3에 JSON 업로드
                         s3_json_url = self.s3_service.upload_json(json_data, image_filename)
                         print(f"✅ S3 JSON 업로드 완료: {s3_json_url}")
+                        
+                        # 인덱스 워커가 반영하도록 변경 이벤트 추가 (큐에 넣지 못하면 바로 인덱싱)
+                        if not await index_worker_service.enqueue_async("upsert", image_filename, "analysis"):
+                            fashion_index_service.reindex_file(image_filename, json_data)
                     else:
                         print(f"ℹ️ JSON 파일이 이미 존재합니다: {image_filename}")
                         
@@ -1,11 +1,43 @@
 from services.s3_service import s3_service
+from services.async_s3_service import async_s3_service
 from services.score_calculator_service import ScoreCalculator
 from services.fashion_index_service import fashion_index_service
+from services.fashion_vocabulary import COLOR_KEYWORD_MATCHER, FASHION_KEYWORD_MATCHER
+from services.keyword_matcher import KeywordAutomaton
+import asyncio
 import logging
 import random
 
 logger = logging.getLogger(__name__)
 
+# 검색 조건 추출용 키워드 매처 (import 시 한 번 구성)
+# 상황별 키워드
+SEARCH_SITUATION_MATCHER = KeywordAutomaton({
+    "일상": ["일상", "평상시", "데일리", "일반", "보통"],
+    "캐주얼": ["캐주얼", "편안", "편한", "자유"],
+    "소개팅": ["소개팅", "데이트", "연애", "만남", "미팅", "첫만남"],
+    "면접": ["면접", "비즈니스", "업무", "회사", "직장", "오피스"],
+    "파티": ["파티", "이벤트", "축하", "기념", "특별", "클럽"],
+    "여행": ["여행", "아웃도어", "야외", "레저", "휴가", "액티비티"]
+})
+
+# 아이템 키워드
+SEARCH_ITEM_MATCHER = KeywordAutomaton([
+    "니트", "데님", "가죽", "면", "실크", "울",
+    "긴팔", "반팔", "와이드", "스키니", "레귤러", "오버핏",
+    "티셔츠", "셔츠", "스웨터", "후드티", "맨투맨",
+    "슬랙스", "청바지", "팬츠", "반바지",
+    "스니커즈", "로퍼", "옥스포드", "부츠", "샌들"
+])
+
+# 스타일링 키워드
+SEARCH_STYLING_MATCHER = KeywordAutomaton([
+    "넣기", "턱", "핏", "실루엣", "밸런스", "오버핏", "레귤러핏"
+])
+
+# 모호한 입력 키워드들
+AMBIGUOUS_INPUT_MATCHER = KeywordAutomaton(["다른", "다른거", "다른거는", "또", "또다른", "추천", "추천해", "보여줘", "보여줘요"])
+
 class OutfitMatcherService:
     """S3에서 매칭되는 착장을 찾는 서비스 (인덱스 기반 최적화)"""
     
@@ -13,7 +45,18 @@ class OutfitMatcherService:
         self.score_calculator = ScoreCalculator()
         self.use_index = True  # 인덱스 사용 여부
     
-    def find_matching_outfits_from_s3(self, user_input: str, expert_type: str, room_id: int = None) -> dict:
+    async def find_matching_outfits_from_s3_async(self, user_input: str, expert_type: str, room_id: int = None) -> dict:
+        """비동기 경로용 매칭: 최근 사용 착장은 비동기 Redis로 조회하고 나머지 동기 검색은 워커 스레드에서 실행"""
+        recent_outfits = None
+        if room_id:
+            from services.async_redis_service import async_redis_service
+            recent_outfits = await async_redis_service.get_recent_used_outfits(room_id, limit=5)
+        
+        return await asyncio.to_thread(
+            self.find_matching_outfits_from_s3, user_input, expert_type, room_id, recent_outfits
+        )
+    
+    def find_matching_outfits_from_s3(self, user_input: str, expert_type: str, room_id: int = None, recent_outfits: list = None) -> dict:
         """S3의 JSON 파일들에서 사용자 입력과 매칭되는 착장 찾기 (인덱스 기반 최적화)"""
         try:
             print(f"🔍 S3 매칭 시작: '{user_input}' (전문가: {expert_type}, room_id: {room_id})")
@@ -29,7 +72,7 @@ class OutfitMatcherService:
             # 인덱스 사용 여부 확인
             if self.use_index:
                 print("🚀 인덱스 기반 빠른 검색 사용")
-                return self._find_matching_with_index(user_input, expert_type, room_id)
+                return self._find_matching_with_index(user_input, expert_type, room_id, recent_outfits)
             else:
                 print("🐌 기존 방식 사용 (전체 스캔)")
                 return self._find_matching_with_full_scan(user_input, expert_type)
@@ -39,7 +82,7 @@ class OutfitMatcherService:
             logger.error(f"S3 매칭 실패: {e}")
             return None
     
-    def _find_matching_with_index(self, user_input: str, expert_type: str, room_id: int = None) -> dict:
+    def _find_matching_with_index(self, user_input: str, expert_type: str, room_id: int = None, recent_outfits: list = None) -> dict:
         """인덱스 기반 빠른 검색"""
         try:
             # 소개팅/비즈니스 등 격식 상황인지 판별
@@ -48,7 +91,7 @@ class OutfitMatcherService:
             shorts_keywords = ["반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"]
 
             # 사용자 입력에서 검색 조건 추출 (대화 컨텍스트 활용)
-            search_criteria = self._extract_search_criteria(user_input, room_id)
+            search_criteria = self._extract_search_criteria(user_input, room_id, recent_outfits)
             print(f"🔍 검색 조건: {search_criteria}")
             
             # 인덱스에서 후보 파일들 찾기
@@ -59,7 +102,7 @@ class OutfitMatcherService:
             all_files_pool = list(candidate_files)
             try:
                 if len(candidate_files) < 10:
-                    s3_all = s3_service.list_json_files() or []
+                    s3_all = s3_service.list_json_files(use_cache=True) or []
                     # 이미 포함된 파일 제외
                     existing = {f['filename'] for f in candidate_files}
                     extras = [f for f in s3_all if f.get('filename') not in existing]
@@ -83,13 +126,21 @@ class OutfitMatcherService:
             
             print(f"🔍 {total_candidates}개 후보 파일에 대해 점수 계산 시작...")
             
+            # 후보 전체 문서를 Redis에서 한 번에 조회
+            contents = self.load_outfit_contents([f['filename'] for f in candidate_files])
+            
+            # 문서가 있는 후보 전체를 한 번에 점수 계산
+            batch_scores = self.score_contents(user_input, contents, expert_type)
+            
             for i, file_info in enumerate(candidate_files):
                 try:
-                    # JSON 내용 가져오기
-                    json_content = s3_service.get_json_content(file_info['filename'])
+                    json_content = contents.get(file_info['filename'])
+                    if not json_content:
+                        print(f"❌ 후보 파일 내용 없음: {file_info['filename']}")
+                        continue
                     
-                    # 매칭 점수 계산
-                    match_score = self.score_calculator.calculate_match_score(user_input, json_content, expert_type)
+                    # 매칭 점수 (배치 계산 결과)
+                    match_score = batch_scores[file_info['filename']]
                     scored_candidates += 1
                     
                     # 점수 디버그 출력 (처음 5개만)
@@ -173,8 +224,8 @@ class OutfitMatcherService:
     def _find_matching_with_full_scan(self, user_input: str, expert_type: str) -> dict:
         """기존 방식: 전체 파일 스캔"""
         try:
-            # S3에서 모든 JSON 파일 가져오기
-            json_files = s3_service.list_json_files()
+            # S3에서 모든 JSON 파일 가져오기 (요청 경로이므로 캐시된 manifest 사용)
+            json_files = s3_service.list_json_files(use_cache=True)
             if not json_files:
                 print("❌ S3에 JSON 파일이 없습니다!")
                 return None
@@ -183,14 +234,19 @@ class OutfitMatcherService:
             
             matching_outfits = []
             
+            # 전체 문서를 Redis에서 한 번에 조회 (없는 파일만 S3 조회)
+            contents = self.load_outfit_contents([f['filename'] for f in json_files])
+            
+            # 문서가 있는 파일 전체를 한 번에 점수 계산
+            batch_scores = self.score_contents(user_input, contents, expert_type)
+            
             # 각 JSON 파일 분석
             for file_info in json_files:
                 try:
-                    # JSON 내용 가져오기
-                    json_content = s3_service.get_json_content(file_info['filename'])
+                    json_content = contents[file_info['filename']]
                     
-                    # 매칭 점수 계산
-                    match_score = self.score_calculator.calculate_match_score(user_input, json_content, expert_type)
+                    # 매칭 점수 (배치 계산 결과)
+                    match_score = batch_scores[file_info['filename']]
                     
                     if match_score > 0.02:
                         matching_outfits.append({
@@ -226,8 +282,8 @@ class OutfitMatcherService:
             print(f"❌ 전체 스캔 실패: {e}")
             return None
     
-    def _extract_search_criteria(self, user_input: str, room_id: int = None) -> dict:
-        """사용자 입력에서 검색 조건 추출 (대화 컨텍스트 활용)"""
+    def _extract_search_criteria(self, user_input: str, room_id: int = None, recent_outfits: list = None) -> dict:
+        """사용자 입력에서 검색 조건 추출 (대화 컨텍스트 활용, recent_outfits가 있으면 Redis 조회 생략)"""
         criteria = {
             'situations': [],
             'items': [],
@@ -237,79 +293,24 @@ class OutfitMatcherService:
         
         user_input_lower = user_input.lower()
         
-        # 상황별 키워드
-        situation_keywords = {
-            "일상": ["일상", "평상시", "데일리", "일반", "보통"],
-            "캐주얼": ["캐주얼", "편안", "편한", "자유"],
-            "소개팅": ["소개팅", "데이트", "연애", "만남", "미팅", "첫만남"],
-            "면접": ["면접", "비즈니스", "업무", "회사", "직장", "오피스"],
-            "파티": ["파티", "이벤트", "축하", "기념", "특별", "클럽"],
-            "여행": ["여행", "아웃도어", "야외", "레저", "휴가", "액티비티"]
-        }
-        
-        for situation, keywords in situation_keywords.items():
-            for keyword in keywords:
-                if keyword in user_input_lower:
-                    criteria['situations'].append(situation)
-                    break
-        
-        # 아이템 키워드
-        item_keywords = [
-            "니트", "데님", "가죽", "면", "실크", "울",
-            "긴팔", "반팔", "와이드", "스키니", "레귤러", "오버핏",
-            "티셔츠", "셔츠", "스웨터", "후드티", "맨투맨",
-            "슬랙스", "청바지", "팬츠", "반바지",
-            "스니커즈", "로퍼", "옥스포드", "부츠", "샌들"
-        ]
-        
-        for keyword in item_keywords:
-            if keyword in user_input_lower:
-                criteria['items'].append(keyword)
-        
-        # 색상 키워드
-        color_keywords = [
-            "블랙", "화이트", "그레이", "브라운", "네이비", "베이지",
-            "검정", "흰색", "회색", "갈색", "남색",
-            "검은", "검은색", "하얀", "하얀색", "흰", "흰색",
-            "파란", "파란색", "파랑", "하늘색", "스카이블루",
-            "빨간", "빨간색", "빨강", "레드", "빨강색",
-            "주황", "주황색", "오렌지",
-            "노란", "노란색", "노랑", "옐로우", "노랑색",
-            "초록", "초록색", "녹색", "그린",
-            "보라", "보라색", "퍼플", "보랑",
-            "분홍", "분홍색", "핑크",
-            "베이지색", "카키", "카키색",
-            "네이비블루", "다크블루", "라이트블루",
-            "다크그레이", "라이트그레이", "실버",
-            "골드", "골든", "금색"
-        ]
-        
-        for keyword in color_keywords:
-            if keyword in user_input_lower:
-                criteria['colors'].append(keyword)
-        
-        # 스타일링 키워드
-        styling_keywords = [
-            "넣기", "턱", "핏", "실루엣", "밸런스", "오버핏", "레귤러핏"
-        ]
-        
-        for keyword in styling_keywords:
-            if keyword in user_input_lower:
-                criteria['styling'].append(keyword)
+        # 상황/아이템/색상/스타일링 키워드를 각 어휘 매처로 한 번씩 찾기
+        criteria['situations'] = SEARCH_SITUATION_MATCHER.categories_in(user_input_lower)
+        criteria['items'] = SEARCH_ITEM_MATCHER.keywords_in(user_input_lower)
+        criteria['colors'] = COLOR_KEYWORD_MATCHER.keywords_in(user_input_lower)
+        criteria['styling'] = SEARCH_STYLING_MATCHER.keywords_in(user_input_lower)
         
         # 🔄 대화 컨텍스트 활용: 모호한 입력이나 검색 조건이 없고 room_id가 있는 경우
         print(f"🔍 검색 조건 추출 결과: {criteria}")
         print(f"🔍 검색 조건이 비어있는가? {not any(criteria.values())}")
         
-        # 모호한 입력 키워드들
-        ambiguous_keywords = ["다른", "다른거", "다른거는", "또", "또다른", "추천", "추천해", "보여줘", "보여줘요"]
-        is_ambiguous = any(keyword in user_input_lower for keyword in ambiguous_keywords)
+        # 모호한 입력 여부
+        is_ambiguous = AMBIGUOUS_INPUT_MATCHER.contains_any(user_input_lower)
         
         if room_id and (not any(criteria.values()) or is_ambiguous):
             print(f"🔄 대화 컨텍스트 활용: room_id={room_id}, 모호한 입력={is_ambiguous}")
             
             # 최근 사용된 착장들의 특성을 기반으로 검색 조건 생성
-            recent_criteria = self._get_context_from_recent_outfits(room_id)
+            recent_criteria = self._get_context_from_recent_outfits(room_id, recent_outfits)
             if recent_criteria:
                 print(f"📝 컨텍스트 기반 검색 조건: {recent_criteria}")
                 return recent_criteria
@@ -318,13 +319,13 @@ class OutfitMatcherService:
         
         return criteria
     
-    def _get_context_from_recent_outfits(self, room_id: int) -> dict:
+    def _get_context_from_recent_outfits(self, room_id: int, recent_outfits: list = None) -> dict:
         """최근 사용된 착장들의 특성을 기반으로 검색 조건 생성"""
         try:
-            from services.redis_service import redis_service
-            
-            # 최근 사용된 착장들 가져오기
-            recent_outfits = redis_service.get_recent_used_outfits(room_id, limit=5)
+            # 최근 사용된 착장들 가져오기 (비동기 경로에서 미리 조회한 목록이 있으면 사용)
+            if recent_outfits is None:
+                from services.redis_service import redis_service
+                recent_outfits = redis_service.get_recent_used_outfits(room_id, limit=5)
             if not recent_outfits:
                 print("⚠️ 최근 사용된 착장이 없음")
                 return {}
@@ -340,10 +341,12 @@ class OutfitMatcherService:
             # 가장 최근 착장의 상황을 우선적으로 사용
             primary_situations = []
             
+            # 최근 착장 전체 문서를 Redis에서 한 번에 조회
+            contents = self.load_outfit_contents(recent_outfits)
+            
             for i, filename in enumerate(recent_outfits):
                 try:
-                    # S3에서 착장 정보 가져오기
-                    json_content = s3_service.get_json_content(filename)
+                    json_content = contents.get(filename)
                     if not json_content:
                         continue
                     
@@ -400,26 +403,56 @@ class OutfitMatcherService:
             print(f"❌ 컨텍스트 기반 검색 조건 생성 실패: {e}")
             return {}
     
-    def _extract_keywords_from_text(self, text: str) -> list:
-        """텍스트에서 패션 키워드 추출"""
-        keywords = []
+    def load_outfit_contents(self, filenames: list) -> dict:
+        """착장 전체 문서 일괄 조회 (Redis MGET 우선, 없는 파일만 S3에서 조회)"""
+        if not filenames:
+            return {}
         
-        # 패션 키워드 목록
-        fashion_keywords = [
-            "니트", "데님", "가죽", "면", "실크", "울", "폴리에스터",
-            "긴팔", "반팔", "와이드", "스키니", "레귤러", "오버핏", "슬림",
-            "블랙", "화이트", "그레이", "브라운", "네이비", "베이지",
-            "티셔츠", "셔츠", "니트", "스웨터", "후드티", "맨투맨",
-            "슬랙스", "청바지", "팬츠", "반바지", "스커트",
-            "스니커즈", "로퍼", "옥스포드", "부츠", "샌들",
-            "넣기", "턱", "핏", "실루엣", "밸런스"
-        ]
+        contents = fashion_index_service.get_documents_many(filenames)
+        missing = [filename for filename in filenames if filename not in contents]
         
-        for keyword in fashion_keywords:
-            if keyword in text:
-                keywords.append(keyword)
+        # Redis에 없는 파일은 S3에서 동시 조회
+        s3_contents = s3_service.get_json_contents(missing)
+        contents.update(s3_contents)
+        for filename in missing:
+            if filename not in s3_contents:
+                print(f"❌ 착장 문서 조회 실패: {filename}")
         
-        return keywords
+        if missing:
+            print(f"📦 착장 문서 조회: Redis {len(filenames) - len(missing)}개, S3 {len(missing)}개")
+        
+        return contents
+    
+    async def load_outfit_contents_async(self, filenames: list) -> dict:
+        """비동기 경로용 착장 전체 문서 일괄 조회 (Redis MGET은 워커 스레드에서, 없는 파일은 비동기 S3 파사드로 동시 조회)"""
+        if not filenames:
+            return {}
+        
+        contents = await asyncio.to_thread(fashion_index_service.get_documents_many, filenames)
+        missing = [filename for filename in filenames if filename not in contents]
+        if not missing:
+            return contents
+        
+        s3_contents = await async_s3_service.get_many(missing)
+        contents.update(s3_contents)
+        for filename in missing:
+            if filename not in s3_contents:
+                print(f"❌ 착장 문서 조회 실패: {filename}")
+        
+        print(f"📦 착장 문서 조회: Redis {len(filenames) - len(missing)}개, S3 {len(missing)}개")
+        return contents
+    
+    def score_contents(self, user_input: str, contents: dict, expert_type: str) -> dict:
+        """파일명 → 문서 딕셔너리 전체를 배치로 점수 계산 (파일명 → 점수)"""
+        filenames = [filename for filename, content in contents.items() if content]
+        scores = self.score_calculator.score_many(
+            user_input, [contents[filename] for filename in filenames], expert_type, cache_keys=filenames
+        )
+        return dict(zip(filenames, scores))
+    
+    def _extract_keywords_from_text(self, text: str) -> list:
+        """텍스트에서 패션 키워드 추출"""
+        return FASHION_KEYWORD_MATCHER.keywords_in(text)
     
     def _find_candidates_with_index(self, criteria: dict) -> list:
         """인덱스를 사용하여 후보 파일들 찾기"""
@@ -2,6 +2,7 @@ import redis
 import json
 import logging
 import os
+import uuid
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -166,6 +167,58 @@ class RedisService:
             return False
 
     # 인덱스 서비스를 위한 추가 메서드들
+    def get(self, key: str) -> Optional[str]:
+        """문자열 값 조회"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        try:
+            return self.redis_client.get(key)
+        except Exception as e:
+            logger.error(f"Redis 값 조회 실패: {e}")
+            return None
+    
+    def set(self, key: str, value: str, expire_time: int = 0, nx: bool = False) -> bool:
+        """문자열 값 저장 (expire_time이 0이면 영구 저장, nx=True면 키가 없을 때만 저장)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return False
+        
+        try:
+            result = self.redis_client.set(key, value, ex=expire_time if expire_time > 0 else None, nx=nx)
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Redis 값 저장 실패: {e}")
+            return False
+    
+    def incr(self, key: str) -> int:
+        """정수 값 1 증가 (새 값 반환)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0
+        
+        try:
+            return self.redis_client.incr(key)
+        except Exception as e:
+            logger.error(f"Redis 값 증가 실패: {e}")
+            return 0
+    
+    def mget(self, keys: list) -> list:
+        """여러 문자열 값을 한 번에 조회 (keys 순서 유지, 없는 키는 None)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return [None] * len(keys)
+        
+        if not keys:
+            return []
+        
+        try:
+            return self.redis_client.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis 값 일괄 조회 실패: {e}")
+            return [None] * len(keys)
+    
     def set_json(self, key: str, data: dict, expire_time: int = 86400) -> bool:
         """JSON 데이터를 Redis에 저장"""
         if not self.redis_client:
@@ -204,6 +257,27 @@ class RedisService:
             logger.error(f"Redis JSON 데이터 조회 실패: {e}")
             return None
     
+    def mget_json(self, keys: list) -> list:
+        """여러 JSON 데이터를 MGET 한 번으로 조회 (keys 순서대로, 없으면 None)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return [None] * len(keys)
+        
+        if not keys:
+            return []
+        
+        try:
+            results = []
+            for json_data in self.redis_client.mget(keys):
+                try:
+                    results.append(json.loads(json_data) if json_data else None)
+                except (TypeError, ValueError):
+                    results.append(None)
+            return results
+        except Exception as e:
+            logger.error(f"Redis JSON 데이터 일괄 조회 실패: {e}")
+            return [None] * len(keys)
+    
     def sadd(self, key: str, *members) -> int:
         """Set에 멤버 추가"""
         if not self.redis_client:
@@ -226,6 +300,18 @@ class RedisService:
             logger.error(f"Redis Set 추가 실패: {e}")
             return 0
     
+    def hgetall(self, key: str) -> dict:
+        """Hash 전체 필드 조회"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return {}
+        
+        try:
+            return self.redis_client.hgetall(key)
+        except Exception as e:
+            logger.error(f"Redis Hash 조회 실패: {e}")
+            return {}
+    
     def smembers(self, key: str) -> set:
         """Set의 모든 멤버 조회"""
         if not self.redis_client:
@@ -238,17 +324,315 @@ class RedisService:
             logger.error(f"Redis Set 조회 실패: {e}")
             return set()
     
-    def keys(self, pattern: str) -> list:
-        """패턴에 맞는 키들 조회"""
+    def scard(self, key: str) -> int:
+        """Set의 멤버 수 조회"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0
+        
+        try:
+            return self.redis_client.scard(key)
+        except Exception as e:
+            logger.error(f"Redis Set 크기 조회 실패: {e}")
+            return 0
+    
+    def srandmember(self, key: str, count: int) -> list:
+        """Set에서 중복 없이 최대 count개 멤버를 랜덤 조회"""
         if not self.redis_client:
             logger.warning("Redis 클라이언트가 연결되지 않았습니다")
             return []
         
         try:
-            return self.redis_client.keys(pattern)
+            return self.redis_client.srandmember(key, count) or []
         except Exception as e:
-            logger.error(f"Redis 키 조회 실패: {e}")
+            logger.error(f"Redis Set 랜덤 조회 실패: {e}")
+            return []
+    
+    def sinter_sample(self, keys: list, count: int) -> tuple:
+        """여러 Set의 교집합을 서버에서 계산하고 (교집합 크기, 최대 count개 멤버) 반환"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0, []
+        
+        if not keys:
+            return 0, []
+        
+        try:
+            # 임시 키에 교집합 저장 → 필요한 개수만 전송 → 임시 키 삭제 (한 번의 MULTI)
+            tmp_key = f"tmp:sinter:{uuid.uuid4().hex}"
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.sinterstore(tmp_key, keys)
+            pipe.srandmember(tmp_key, count)
+            pipe.delete(tmp_key)
+            cardinality, members, _ = pipe.execute()
+            return cardinality, members or []
+        except Exception as e:
+            logger.error(f"Redis Set 교집합 조회 실패: {e}")
+            return 0, []
+    
+    def zunion_top(self, weighted_keys: dict, count: int) -> list:
+        """Set들의 가중치 합집합을 서버에서 계산하고 점수 상위 count개 (멤버, 점수) 반환"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return []
+        
+        if not weighted_keys:
+            return []
+        
+        try:
+            # Set 멤버는 점수 1로 취급되므로 결과 점수 = 멤버가 속한 키들의 가중치 합
+            tmp_key = f"tmp:zunion:{uuid.uuid4().hex}"
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.zunionstore(tmp_key, weighted_keys)
+            pipe.zrevrange(tmp_key, 0, count - 1, withscores=True)
+            pipe.delete(tmp_key)
+            _, ranked, _ = pipe.execute()
+            return ranked or []
+        except Exception as e:
+            logger.error(f"Redis 가중치 합집합 조회 실패: {e}")
+            return []
+    
+    def sunion_inter(self, key_groups: list) -> set:
+        """키 그룹별 합집합들의 교집합을 서버에서 계산 (SUNIONSTORE × N → SINTER, 한 번의 MULTI)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return set()
+        
+        if not key_groups or not all(key_groups):
+            return set()
+        
+        try:
+            tmp_keys = [f"tmp:sunion:{uuid.uuid4().hex}" for _ in key_groups]
+            pipe = self.redis_client.pipeline(transaction=True)
+            for tmp_key, keys in zip(tmp_keys, key_groups):
+                pipe.sunionstore(tmp_key, keys)
+            pipe.sinter(tmp_keys)
+            pipe.delete(*tmp_keys)
+            results = pipe.execute()
+            return results[-2] or set()
+        except Exception as e:
+            logger.error(f"Redis Set 합집합-교집합 조회 실패: {e}")
+            return set()
+    
+    def append_changelog_many(self, version_key: str, changelog_key: str, members: list, max_entries: int) -> int:
+        """버전을 멤버 수만큼 증가시킨 뒤 변경 로그에 멤버별 버전으로 한 번에 기록, 마지막 버전 반환"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0
+        
+        if not members:
+            return 0
+        
+        try:
+            version = self.redis_client.incrby(version_key, len(members))
+            first_version = version - len(members) + 1
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.zadd(changelog_key, {member: first_version + i for i, member in enumerate(members)})
+            pipe.zremrangebyrank(changelog_key, 0, -(max_entries + 1))  # 오래된 기록부터 제거
+            pipe.execute()
+            return version
+        except Exception as e:
+            logger.error(f"Redis 변경 로그 일괄 기록 실패: {e}")
+            return 0
+    
+    def execute_pipeline(self, commands: list, transaction: bool = False) -> Optional[list]:
+        """여러 명령을 한 번의 왕복으로 실행 (commands: [(명령 이름, 인자...), ...], 실패 시 None)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        if not commands:
             return []
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=transaction)
+            for command, *args in commands:
+                getattr(pipe, command)(*args)
+            return pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis 파이프라인 실행 실패: {e}")
+            return None
+    
+    def watched_transaction(self, watch_keys: list, build_commands, retries: int = 5) -> Optional[list]:
+        """키들을 WATCH한 뒤 build_commands()로 만든 명령을 MULTI로 실행 (그 사이 다른 클라이언트가 키를 바꾸면 명령을 다시 만들어 재시도, 실패 시 None)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        for _ in range(retries):
+            try:
+                with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.watch(*watch_keys)
+                    commands = build_commands()
+                    pipe.multi()
+                    for command, *args in commands:
+                        getattr(pipe, command)(*args)
+                    return pipe.execute()
+            except redis.WatchError:
+                continue
+            except Exception as e:
+                logger.error(f"Redis 조건부 트랜잭션 실행 실패: {e}")
+                return None
+        
+        logger.error(f"Redis 조건부 트랜잭션 재시도 초과: {len(watch_keys)}개 키")
+        return None
+    
+    def get_changelog_since(self, changelog_key: str, version: int) -> tuple:
+        """변경 로그에서 version 이후 변경된 멤버 목록, 로그 크기, 가장 오래된 기록의 버전 반환"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return [], 0, 0
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zrangebyscore(changelog_key, f"({version}", "+inf")
+            pipe.zcard(changelog_key)
+            pipe.zrange(changelog_key, 0, 0, withscores=True)
+            members, size, oldest = pipe.execute()
+            return members, size, int(oldest[0][1]) if oldest else 0
+        except Exception as e:
+            logger.error(f"Redis 변경 로그 조회 실패: {e}")
+            return [], 0, 0
+    
+    def scan_iter(self, pattern: str, count: int = 1000):
+        """패턴에 맞는 키들을 SCAN으로 순회 (KEYS와 달리 Redis를 블로킹하지 않음)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return
+        
+        try:
+            for key in self.redis_client.scan_iter(match=pattern, count=count):
+                yield key
+        except Exception as e:
+            logger.error(f"Redis 키 순회 실패: {e}")
+    
+    def keys(self, pattern: str) -> list:
+        """패턴에 맞는 키들 조회 (SCAN 기반, 관리용 경로 전용)"""
+        return list(self.scan_iter(pattern))
+    
+    def unlink(self, *keys) -> int:
+        """키들 삭제 (메모리 해제는 Redis 백그라운드 스레드에서 수행해 큰 Set 삭제 시에도 블로킹하지 않음)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0
+        
+        try:
+            return self.redis_client.unlink(*keys)
+        except Exception as e:
+            logger.error(f"Redis 키 삭제 실패: {e}")
+            return 0
+    
+    def xadd(self, key: str, fields: dict, maxlen: int) -> Optional[str]:
+        """Stream에 이벤트 추가 (대략 maxlen개까지만 유지), 이벤트 ID 반환"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        try:
+            return self.redis_client.xadd(key, fields, maxlen=maxlen, approximate=True)
+        except Exception as e:
+            logger.error(f"Redis Stream 추가 실패: {e}")
+            return None
+    
+    def xlen(self, key: str) -> int:
+        """Stream 길이"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0
+        
+        try:
+            return self.redis_client.xlen(key)
+        except Exception as e:
+            logger.error(f"Redis Stream 길이 조회 실패: {e}")
+            return 0
+    
+    def ensure_stream_group(self, key: str, group: str) -> bool:
+        """Stream 소비자 그룹 생성 (Stream이 없으면 함께 생성, 이미 있으면 그대로 사용)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return False
+        
+        try:
+            self.redis_client.xgroup_create(key, group, id="0", mkstream=True)
+            return True
+        except redis.exceptions.ResponseError as e:
+            if "BUSYGROUP" in str(e):
+                return True
+            logger.error(f"Redis Stream 소비자 그룹 생성 실패: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Redis Stream 소비자 그룹 생성 실패: {e}")
+            return False
+    
+    def xreadgroup(self, key: str, group: str, consumer: str, read_id: str, count: int, block_ms: int) -> Optional[list]:
+        """소비자 그룹으로 Stream 읽기 ([(이벤트 ID, 필드), ...], 실패 시 None)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return None
+        
+        try:
+            response = self.redis_client.xreadgroup(group, consumer, {key: read_id}, count=count, block=block_ms)
+            if not response:
+                return []
+            # 이미 삭제된 이벤트는 필드가 None으로 돌아옴
+            return [(entry_id, fields or {}) for entry_id, fields in response[0][1]]
+        except Exception as e:
+            logger.error(f"Redis Stream 읽기 실패: {e}")
+            return None
+    
+    def xack_delete(self, key: str, group: str, entry_ids: list) -> int:
+        """처리한 이벤트를 ACK 후 Stream에서 삭제 (한 번의 MULTI, Stream 길이 = 남은 처리량)"""
+        if not self.redis_client:
+            logger.warning("Redis 클라이언트가 연결되지 않았습니다")
+            return 0
+        
+        if not entry_ids:
+            return 0
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.xack(key, group, *entry_ids)
+            pipe.xdel(key, *entry_ids)
+            acked, _ = pipe.execute()
+            return acked
+        except Exception as e:
+            logger.error(f"Redis Stream ACK 실패: {e}")
+            return 0
+    
+    def acquire_lock(self, key: str, token: str, ttl_ms: int) -> bool:
+        """분산 락 획득 (SET NX PX)"""
+        if not self.redis_client:
+            return False
+        
+        try:
+            return bool(self.redis_client.set(key, token, nx=True, px=ttl_ms))
+        except Exception as e:
+            logger.error(f"Redis 락 획득 실패: {e}")
+            return False
+    
+    def renew_lock(self, key: str, token: str, ttl_ms: int) -> bool:
+        """자신이 보유한 락만 만료 시간 연장"""
+        if not self.redis_client:
+            return False
+        
+        try:
+            script = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+            return bool(self.redis_client.eval(script, 1, key, token, ttl_ms))
+        except Exception as e:
+            logger.error(f"Redis 락 연장 실패: {e}")
+            return False
+    
+    def release_lock(self, key: str, token: str) -> bool:
+        """자신이 보유한 락만 해제"""
+        if not self.redis_client:
+            return False
+        
+        try:
+            script = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+            return bool(self.redis_client.eval(script, 1, key, token))
+        except Exception as e:
+            logger.error(f"Redis 락 해제 실패: {e}")
+            return False
     
     def delete(self, *keys) -> int:
         """키들 삭제"""
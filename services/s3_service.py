@@ -1,13 +1,45 @@
 import boto3
+import copy
 import logging
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from urllib.parse import urlparse, unquote
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from config import settings
+from services.redis_service import redis_service
+from services.image_preprocessor import FORMAT_EXTENSIONS, output_format
 
 logger = logging.getLogger(__name__)
 
 class S3Service:
     def __init__(self):
         """S3 서비스 초기화"""
+        # get_json_content 결과 캐시 (filename -> {"etag", "last_modified", "content", "fetched_at"})
+        self._json_cache = OrderedDict()
+        self._json_cache_lock = threading.Lock()
+        self.json_cache_max_entries = settings.S3_JSON_CACHE_MAX_ENTRIES
+        self.json_cache_ttl = settings.S3_JSON_CACHE_TTL
+        self.json_cache_stats = {"hits": 0, "misses": 0, "revalidations": 0, "evictions": 0}
+        
+        # 동시 S3 요청용 스레드 풀 (boto3 클라이언트는 스레드 안전, 커넥션 풀 크기 이하로 유지)
+        self.max_concurrency = max(1, min(settings.S3_MAX_CONCURRENCY, settings.S3_MAX_POOL_CONNECTIONS))
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="s3-io")
+        
+        # 목록(manifest) 캐시: 프로세스 메모리 + Redis 공유, 자체 업로드/삭제 시 세대 번호 증가로 무효화
+        self._manifest_cache = {}  # kind -> {"generation", "files", "fetched_at"}
+        self._manifest_lock = threading.Lock()
+        self.manifest_ttl = settings.S3_MANIFEST_TTL
+        self.manifest_key_prefix = "s3_manifest"
+        
+        # 동시 업로드 시 이미지 키(밀리초 타임스탬프) 충돌 방지
+        self._image_key_lock = threading.Lock()
+        self._last_image_timestamp = None
+        
         try:
             print(f"🔧 S3 서비스 초기화 시작...")
             print(f"   - AWS_ACCESS_KEY: {'설정됨' if settings.AWS_ACCESS_KEY_ID else 'NOT_SET'}")
@@ -20,11 +52,16 @@ class S3Service:
                 's3',
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
+                region_name=settings.AWS_REGION,
+                config=Config(
+                    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                    retries={"max_attempts": 5, "mode": "adaptive"}
+                )
             )
             self.bucket_name = settings.S3_COMBINATION_BUCKET_NAME
             self.bucket_prefix = settings.S3_COMBINATION_BUCKET_IMAGE_PREFIX
             self.bucket_json_prefix = settings.S3_COMBINATION_BUCKET_JSON_PREFIX
+            self.bucket_thumbnail_prefix = settings.S3_COMBINATION_BUCKET_THUMBNAIL_PREFIX
             
             # 연결 테스트
             self.s3_client.head_bucket(Bucket=self.bucket_name)
@@ -65,7 +102,7 @@ class S3Service:
             content_type = content_type_mapping.get(file_extension, 'image/jpeg')
             
             # 타임스탬프 기반 파일명 생성 (마이크로초 포함)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 마이크로초 3자리만 사용
+            timestamp = self._next_image_timestamp()
             s3_key = f"{self.bucket_prefix}/{timestamp}.{file_extension}"
             
             # S3에 업로드
@@ -76,6 +113,8 @@ class S3Service:
                 ContentType=content_type
             )
             
+            self.invalidate_manifest("image")
+            
             # S3 URL 생성
             s3_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
             
@@ -87,6 +126,38 @@ class S3Service:
             logger.error(f"S3 업로드 실패: {e}")
             raise Exception(f"S3 업로드 실패: {str(e)}")
     
+    def _next_image_timestamp(self) -> str:
+        """이미지 키용 밀리초 타임스탬프 (동시 업로드에서도 중복되지 않도록 단조 증가)"""
+        with self._image_key_lock:
+            now = datetime.now()
+            now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+            if self._last_image_timestamp is not None and now <= self._last_image_timestamp:
+                now = self._last_image_timestamp + timedelta(milliseconds=1)
+            self._last_image_timestamp = now
+        return now.strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 마이크로초 3자리만 사용
+    
+    def map_concurrent(self, func, items: list) -> list:
+        """items 각각에 func를 S3 스레드 풀에서 동시 실행 (입력 순서대로 결과 또는 예외 반환)"""
+        futures = [self.executor.submit(func, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def get_json_contents(self, filenames: list) -> dict:
+        """여러 JSON 파일 내용을 동시에 조회 (실패한 파일은 결과에서 제외)"""
+        if not filenames:
+            return {}
+        
+        contents = {}
+        for filename, result in zip(filenames, self.map_concurrent(self.get_json_content, filenames)):
+            if not isinstance(result, Exception):
+                contents[filename] = result
+        return contents
+    
     def upload_json(self, json_data: dict, filename: str) -> str:
         """JSON 데이터를 S3에 업로드"""
         try:
@@ -110,6 +181,10 @@ class S3Service:
                 ContentType='application/json'
             )
             
+            # 캐시된 이전 내용과 목록 무효화
+            self.invalidate_json_cache(filename)
+            self.invalidate_manifest("json")
+            
             # S3 URL 생성
             s3_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
             
@@ -137,35 +212,86 @@ class S3Service:
             # 파일이 존재하지 않는 경우
             return False
     
-    def list_image_files(self) -> list:
-        """S3의 /image 디렉토리에서 모든 이미지 파일 목록을 가져옴"""
+    def _list_objects(self, prefix: str) -> list:
+        """프리픽스 아래 모든 객체 조회 (list_objects_v2 페이지네이션, 1000개 제한 없음)"""
+        objects = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            objects.extend(page.get('Contents', []))
+        return objects
+    
+    def _build_manifest(self, kind: str) -> list:
+        """S3 목록으로 파일 manifest 생성 (filename, s3_url, size, etag, last_modified)"""
+        prefix = (self.bucket_prefix if kind == "image" else self.bucket_json_prefix) + "/"
+        
+        files = []
+        for obj in self._list_objects(prefix):
+            key = obj['Key']
+            # 해당 디렉토리의 파일만 필터링
+            if not key.startswith(prefix) or key == prefix:
+                continue
+            
+            # 파일명 추출 (이미지는 확장자 제거, JSON은 .json 제거)
+            if kind == "image":
+                filename = key.split('/')[-1].split('.')[0]
+            else:
+                filename = key.split('/')[-1].replace('.json', '')
+            
+            files.append({
+                "s3_key": key,
+                "filename": filename,
+                "s3_url": f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{key}",
+                "size": obj['Size'],
+                "etag": obj.get('ETag', '').strip('"'),
+                "last_modified": obj['LastModified'].isoformat()
+            })
+        return files
+    
+    def _get_manifest(self, kind: str, use_cache: bool) -> list:
+        """manifest 조회 (use_cache면 메모리 → Redis → S3 순, 아니면 항상 S3 목록 조회 후 캐시 갱신)"""
+        generation_key = f"{self.manifest_key_prefix}:{kind}:generation"
+        manifest_key = f"{self.manifest_key_prefix}:{kind}"
+        generation = redis_service.get(generation_key) or "0"
+        
+        if use_cache:
+            # 1. 프로세스 메모리 (같은 세대이고 TTL 이내)
+            with self._manifest_lock:
+                entry = self._manifest_cache.get(kind)
+            if entry and entry["generation"] == generation and time.time() - entry["fetched_at"] < self.manifest_ttl:
+                return [dict(file_info) for file_info in entry["files"]]
+            
+            # 2. Redis 공유 manifest (다른 워커가 만든 목록)
+            cached = redis_service.get_json(manifest_key)
+            if cached and cached.get("generation") == generation:
+                with self._manifest_lock:
+                    self._manifest_cache[kind] = {"generation": generation, "files": cached["files"], "fetched_at": cached["fetched_at"]}
+                if time.time() - cached["fetched_at"] < self.manifest_ttl:
+                    return [dict(file_info) for file_info in cached["files"]]
+        
+        # 3. S3 목록 조회 후 캐시 저장
+        files = self._build_manifest(kind)
+        fetched_at = time.time()
+        with self._manifest_lock:
+            self._manifest_cache[kind] = {"generation": generation, "files": files, "fetched_at": fetched_at}
+        redis_service.set_json(manifest_key, {"generation": generation, "files": files, "fetched_at": fetched_at},
+                               expire_time=max(1, int(self.manifest_ttl)))
+        return [dict(file_info) for file_info in files]
+    
+    def invalidate_manifest(self, kind: str = None):
+        """목록 캐시 무효화 (세대 번호 증가로 다른 워커의 메모리 캐시도 무효화, kind가 없으면 전체)"""
+        for manifest_kind in ([kind] if kind else ["image", "json"]):
+            with self._manifest_lock:
+                self._manifest_cache.pop(manifest_kind, None)
+            redis_service.incr(f"{self.manifest_key_prefix}:{manifest_kind}:generation")
+            redis_service.delete(f"{self.manifest_key_prefix}:{manifest_kind}")
+    
+    def list_image_files(self, use_cache: bool = False) -> list:
+        """S3의 /image 디렉토리에서 모든 이미지 파일 목록을 가져옴 (use_cache면 캐시된 manifest 사용)"""
         try:
             if not self.s3_client:
                 return []
             
-            # S3에서 /image 디렉토리의 모든 객체 조회
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=self.bucket_prefix + "/"
-            )
-            
-            image_files = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    key = obj['Key']
-                    # /image/ 디렉토리의 파일만 필터링
-                    if key.startswith(self.bucket_prefix + "/") and key != self.bucket_prefix + "/":
-                        # 파일명 추출 (확장자 제거)
-                        filename = key.split('/')[-1].split('.')[0]
-                        s3_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
-                        
-                        image_files.append({
-                            "s3_key": key,
-                            "filename": filename,
-                            "s3_url": s3_url,
-                            "size": obj['Size'],
-                            "last_modified": obj['LastModified'].isoformat()
-                        })
+            image_files = self._get_manifest("image", use_cache)
             
             print(f"✅ S3 이미지 파일 목록 조회 완료: {len(image_files)}개 파일")
             return image_files
@@ -179,12 +305,10 @@ class S3Service:
         """JSON 파일이 없는 이미지 파일들만 반환"""
         try:
             image_files = self.list_image_files()
-            files_without_json = []
             
-            for image_file in image_files:
-                filename = image_file['filename']
-                if not self.check_json_exists(filename):
-                    files_without_json.append(image_file)
+            # 파일별 HEAD 요청 대신 JSON 목록 한 번으로 비교
+            json_filenames = {json_file['filename'] for json_file in self.list_json_files()}
+            files_without_json = [image_file for image_file in image_files if image_file['filename'] not in json_filenames]
             
             print(f"✅ JSON이 없는 이미지 파일 조회 완료: {len(files_without_json)}개 파일")
             return files_without_json
@@ -194,35 +318,13 @@ class S3Service:
             logger.error(f"JSON이 없는 이미지 파일 조회 실패: {e}")
             return []
     
-    def list_json_files(self) -> list:
-        """S3의 /json 디렉토리에서 모든 JSON 파일 목록을 가져옴"""
+    def list_json_files(self, use_cache: bool = False) -> list:
+        """S3의 /json 디렉토리에서 모든 JSON 파일 목록을 가져옴 (use_cache면 캐시된 manifest 사용)"""
         try:
             if not self.s3_client:
                 return []
             
-            # S3에서 /json 디렉토리의 모든 객체 조회
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=self.bucket_json_prefix + "/"
-            )
-            
-            json_files = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    key = obj['Key']
-                    # /json/ 디렉토리의 파일만 필터링
-                    if key.startswith(self.bucket_json_prefix + "/") and key != self.bucket_json_prefix + "/":
-                        # 파일명 추출 (.json 확장자 제거)
-                        filename = key.split('/')[-1].replace('.json', '')
-                        s3_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
-                        
-                        json_files.append({
-                            "s3_key": key,
-                            "filename": filename,
-                            "s3_url": s3_url,
-                            "size": obj['Size'],
-                            "last_modified": obj['LastModified'].isoformat()
-                        })
+            json_files = self._get_manifest("json", use_cache)
             
             print(f"✅ S3 JSON 파일 목록 조회 완료: {len(json_files)}개 파일")
             return json_files
@@ -233,30 +335,122 @@ class S3Service:
             return []
     
     def get_json_content(self, filename: str) -> dict:
-        """특정 JSON 파일의 내용을 가져옴"""
+        """특정 JSON 파일의 내용을 가져옴 (LRU + TTL 캐시, 만료 시 ETag 재검증)"""
+        return self._load_json_content(filename, use_ttl=True)[0]
+    
+    def get_json_content_with_source(self, filename: str, expected_etag: Optional[str] = None) -> Tuple[dict, dict]:
+        """JSON 내용과 그 내용의 ETag/LastModified 반환 (캐시는 ETag가 expected_etag와 같을 때만 그대로 사용, 그 외에는 조건부 요청으로 재검증)"""
+        return self._load_json_content(filename, use_ttl=False, expected_etag=expected_etag)
+    
+    def _load_json_content(self, filename: str, use_ttl: bool, expected_etag: Optional[str] = None) -> Tuple[dict, dict]:
+        """JSON 내용과 출처({"etag", "last_modified"}) 조회 (use_ttl이면 TTL 이내 캐시는 S3 호출 없이 반환)"""
         try:
             if not self.s3_client:
                 raise Exception("S3 클라이언트가 초기화되지 않았습니다.")
             
             s3_key = f"{self.bucket_json_prefix}/{filename}.json"
             
-            # S3에서 JSON 파일 다운로드
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
+            # 캐시 조회 (TTL 이내이거나 호출자가 알고 있는 ETag와 같으면 S3 호출 없이 반환)
+            cached = self._get_cached_json(filename)
+            if cached:
+                cached_source = {"etag": (cached.get('etag') or '').strip('"'), "last_modified": cached.get('last_modified', '')}
+                is_fresh = time.time() - cached['fetched_at'] < self.json_cache_ttl
+                if (use_ttl and is_fresh) or (expected_etag and cached_source['etag'] == expected_etag):
+                    self._count_json_cache("hits")
+                    return copy.deepcopy(cached['content']), cached_source
+            
+            request_kwargs = {"Bucket": self.bucket_name, "Key": s3_key}
+            if cached and cached.get('etag'):
+                request_kwargs["IfNoneMatch"] = cached['etag']
+            
+            # S3에서 JSON 파일 다운로드 (캐시가 있으면 조건부 요청)
+            try:
+                response = self.s3_client.get_object(**request_kwargs)
+            except ClientError as e:
+                error_code = str(e.response.get('Error', {}).get('Code', ''))
+                if cached and error_code in ('304', 'NotModified'):
+                    # 변경 없음 - 캐시 유효기간만 갱신
+                    self._store_cached_json(filename, cached['etag'], cached['content'], cached.get('last_modified', ''))
+                    self._count_json_cache("revalidations")
+                    return copy.deepcopy(cached['content']), cached_source
+                if error_code in ('NoSuchKey', '404'):
+                    # 삭제된 파일 - 이전 내용이 캐시에서 다시 쓰이지 않도록 제거
+                    self.invalidate_json_cache(filename)
+                raise
             
             # JSON 내용 파싱
             import json as json_module
             json_content = json_module.loads(response['Body'].read().decode('utf-8'))
+            last_modified = response['LastModified'].isoformat() if response.get('LastModified') else ''
+            
+            self._store_cached_json(filename, response.get('ETag'), json_content, last_modified)
+            self._count_json_cache("misses")
             
             print(f"✅ JSON 파일 내용 조회 완료: {filename}")
-            return json_content
+            return copy.deepcopy(json_content), {"etag": (response.get('ETag') or '').strip('"'), "last_modified": last_modified}
             
         except Exception as e:
             print(f"❌ JSON 파일 내용 조회 실패: {filename} - {e}")
             logger.error(f"JSON 파일 내용 조회 실패: {filename} - {e}")
-            raise Exception(f"JSON 파일 내용 조회 실패: {str(e)}")
+            raise Exception(f"JSON 파일 내용 조회 실패: {str(e)}") from e
+    
+    def is_missing_error(self, error: Exception) -> bool:
+        """조회 예외가 S3에 파일이 없어서 난 것인지 확인 (NoSuchKey/404, 감싼 예외의 원인까지 확인)"""
+        while error is not None:
+            if isinstance(error, ClientError) and str(error.response.get('Error', {}).get('Code', '')) in ('NoSuchKey', '404'):
+                return True
+            error = error.__cause__
+        return False
+    
+    def _get_cached_json(self, filename: str):
+        """캐시 엔트리 조회 (LRU 순서 갱신)"""
+        with self._json_cache_lock:
+            entry = self._json_cache.get(filename)
+            if entry is not None:
+                self._json_cache.move_to_end(filename)
+            return entry
+    
+    def _store_cached_json(self, filename: str, etag: str, content: dict, last_modified: str = ''):
+        """캐시 엔트리 저장 및 최대 개수 초과 시 가장 오래된 엔트리 제거"""
+        if self.json_cache_max_entries <= 0:
+            return
+        
+        with self._json_cache_lock:
+            self._json_cache[filename] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "content": content,
+                "fetched_at": time.time()
+            }
+            self._json_cache.move_to_end(filename)
+            while len(self._json_cache) > self.json_cache_max_entries:
+                self._json_cache.popitem(last=False)
+                self.json_cache_stats["evictions"] += 1
+    
+    def _count_json_cache(self, counter: str):
+        """캐시 카운터 증가"""
+        with self._json_cache_lock:
+            self.json_cache_stats[counter] += 1
+    
+    def invalidate_json_cache(self, filename: str = None):
+        """JSON 캐시 무효화 (filename이 없으면 전체)"""
+        with self._json_cache_lock:
+            if filename is None:
+                self._json_cache.clear()
+            else:
+                self._json_cache.pop(filename, None)
+    
+    def get_json_cache_stats(self) -> dict:
+        """JSON 캐시 통계 (hit/miss/eviction)"""
+        with self._json_cache_lock:
+            stats = dict(self.json_cache_stats)
+            stats["size"] = len(self._json_cache)
+        
+        lookups = stats["hits"] + stats["revalidations"] + stats["misses"]
+        stats["max_entries"] = self.json_cache_max_entries
+        stats["ttl_seconds"] = self.json_cache_ttl
+        stats["hit_rate"] = round((stats["hits"] + stats["revalidations"]) / lookups, 4) if lookups else 0.0
+        return stats
     
     def update_json_situations(self, filename: str, situations: list) -> str:
         """JSON 파일의 situations 필드를 업데이트"""
@@ -296,6 +490,16 @@ class S3Service:
                 Bucket=self.bucket_name,
                 Key=key
             )
+            self.invalidate_manifest("image")
+            
+            # 비전 분석용 썸네일도 삭제 (없으면 무시)
+            try:
+                self.s3_client.delete_object(
+                    Bucket=self.bucket_name,
+                    Key=self.thumbnail_key(key.split('/')[-1].rsplit('.', 1)[0])
+                )
+            except Exception as e:
+                logger.error(f"썸네일 삭제 실패: {key} - {e}")
             
             print(f"✅ S3 삭제 성공: {key}")
             return True
@@ -305,6 +509,101 @@ class S3Service:
             logger.error(f"S3 삭제 실패: {e}")
             return False
     
+    def s3_key_from_url(self, url: str) -> Optional[str]:
+        """우리 버킷 객체 URL이면 S3 키 반환 (virtual-hosted/path-style 모두, 아니면 None)"""
+        try:
+            if not self.s3_client:
+                return None
+            
+            parsed = urlparse(url)
+            host, path = parsed.netloc.lower(), unquote(parsed.path.lstrip('/'))
+            if not host.endswith(".amazonaws.com"):
+                return None
+            
+            # https://{bucket}.s3.{region}.amazonaws.com/{key}
+            if host.startswith(f"{self.bucket_name}.s3.") or host.startswith(f"{self.bucket_name}.s3-"):
+                return path or None
+            
+            # https://s3.{region}.amazonaws.com/{bucket}/{key}
+            if host.startswith("s3.") or host.startswith("s3-"):
+                bucket, _, key = path.partition('/')
+                return key if bucket == self.bucket_name and key else None
+            
+            return None
+        except Exception:
+            return None
+    
+    def get_image_bytes(self, s3_key: str) -> Tuple[bytes, str]:
+        """이미지 객체를 S3 클라이언트(커넥션 풀)로 직접 조회 ((바이트, ContentType))"""
+        if not self.s3_client:
+            raise Exception("S3 클라이언트가 초기화되지 않았습니다.")
+        
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+        return response['Body'].read(), response.get('ContentType', '')
+    
+    def thumbnail_key(self, filename: str) -> str:
+        """비전 분석용 썸네일 S3 키 (이미지 파일명 기준, 확장자는 전처리 출력 포맷)"""
+        return f"{self.bucket_thumbnail_prefix}/{filename}.{FORMAT_EXTENSIONS[output_format()]}"
+    
+    def get_thumbnail(self, filename: str) -> Optional[bytes]:
+        """저장된 비전 분석용 썸네일 조회 (없으면 None)"""
+        try:
+            if not self.s3_client:
+                return None
+            
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.thumbnail_key(filename))
+            return response['Body'].read()
+            
+        except ClientError as e:
+            if str(e.response.get('Error', {}).get('Code', '')) not in ('NoSuchKey', '404'):
+                logger.error(f"썸네일 조회 실패: {filename} - {e}")
+            return None
+        except Exception as e:
+            logger.error(f"썸네일 조회 실패: {filename} - {e}")
+            return None
+    
+    def upload_thumbnail(self, filename: str, image_bytes: bytes, content_type: str) -> bool:
+        """전처리된 이미지를 비전 분석용 썸네일로 저장 (재분석 시 원본 대신 사용)"""
+        try:
+            if not self.s3_client:
+                return False
+            
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=self.thumbnail_key(filename),
+                Body=image_bytes,
+                ContentType=content_type
+            )
+            print(f"✅ 썸네일 저장 완료: {self.thumbnail_key(filename)} ({len(image_bytes)} bytes)")
+            return True
+            
+        except Exception as e:
+            print(f"❌ 썸네일 저장 실패: {e}")
+            logger.error(f"썸네일 저장 실패: {filename} - {e}")
+            return False
+    
+    def delete_json(self, filename: str) -> bool:
+        """S3에서 JSON 파일 삭제 (내용/목록 캐시 무효화)"""
+        try:
+            if not self.s3_client:
+                raise Exception("S3 클라이언트가 초기화되지 않았습니다.")
+            
+            key = f"{self.bucket_json_prefix}/{filename}.json"
+            self.s3_client.delete_object(
+                Bucket=self.bucket_name,
+                Key=key
+            )
+            self.invalidate_json_cache(filename)
+            self.invalidate_manifest("json")
+            
+            print(f"✅ JSON 삭제 성공: {key}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ JSON 삭제 실패: {e}")
+            logger.error(f"JSON 삭제 실패: {e}")
+            return False
+    
     def get_image_url(self, s3_key: str) -> str:
         """S3 키로부터 이미지 URL 생성"""
         return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
@@ -1,6 +1,14 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
 class ScoreCalculator:
     """점수 계산을 담당하는 클래스"""
 
+    # 배치 점수 계산용 착장별 정적 특징 캐시 크기
+    FEATURE_CACHE_MAX_ENTRIES = 5000
+
     def __init__(self):
         # 여름 시즌 부적합 아이템
         self.summer_inappropriate_items = [
@@ -36,6 +44,38 @@ class ScoreCalculator:
             "여행": ["여행", "아웃도어", "야외", "레저", "휴가", "액티비티", "운동"]
         }
 
+        # 격식 상황 판단 키워드
+        self.formal_keywords = ["소개팅", "데이트", "면접", "출근", "비즈니스", "회사", "미팅", "회의", "오피스"]
+
+        # 소개팅/비즈니스에 부적절한 아이템들 (감점용)
+        self.formal_penalty_items = [
+            "그래픽", "오버사이즈", "맨투맨", "후드티", "크롭", 
+            "티셔츠", "후드", "스웨트", "트레이닝", "운동복",
+            # 하의(반바지/쇼츠) 계열 키워드(동의어 포함)
+            "반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"
+        ]
+
+        # 자켓/블레이저와 반바지 조합은 격식 상황에 부적절
+        self.jacket_keywords = ["자켓", "재킷", "블레이저", "블레이져", "재킷"]
+        self.shorts_keywords = ["반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"]
+
+        # 여성 전용 아이템 목록
+        self.female_only_items = [
+            "스커트", "드레스", "블라우스", "미디", "미니", "맥시", "원피스",
+            "플리츠", "주름", "리본", "레이스", "프릴", "볼륨", "플레어",
+            "A라인", "H라인", "X라인", "Y라인", "I라인", "O라인",
+            "펌프스", "힐", "웨지", "플랫폼", "스틸레토", "메리제인",
+            "크롭", "캐미솔", "탑", "튜브탑", "할리톱", "오프숄더",
+            "원숄더", "스트랩리스", "백리스", "키홀", "컷아웃", "하프팬츠", "스키니", "숏팬츠"
+        ]
+
+        # 배치 점수 계산용 캐시 (착장별 정적 특징, 문자열 ID)
+        self._feature_cache = OrderedDict()
+        self._feature_cache_lock = threading.Lock()
+        self._term_ids = {}
+        self._terms = []
+        self._situation_categories = list(self.situation_keywords.keys())
+
     def calculate_match_score(self, user_input: str, json_content: dict, expert_type: str) -> float:
         """사용자 입력과 JSON 내용의 매칭 점수 계산"""
         score = 0.0
@@ -77,6 +117,158 @@ class ScoreCalculator:
             print(f"❌ 매칭 점수 계산 실패: {e}")
             return 0.0
 
+    def score_many(self, user_input: str, docs: list, expert_type: str, cache_keys: list = None) -> list:
+        """여러 착장의 매칭 점수를 한 번에 계산 (calculate_match_score와 동일한 점수, docs 순서 유지)"""
+        if not docs:
+            return []
+
+        user_input_lower = user_input.lower()
+        scores = [0.0] * len(docs)
+
+        # 착장별 정적 특징 (캐시 키가 있으면 재사용)
+        features = []
+        positions = []
+        for i, doc in enumerate(docs):
+            cache_key = cache_keys[i] if cache_keys else None
+            feature = self._get_static_features(doc, cache_key)
+            if feature is None:
+                # 특징 추출이 불가능한 문서는 기존 방식으로 계산
+                scores[i] = self.calculate_match_score(user_input, doc, expert_type)
+                continue
+            features.append(feature)
+            positions.append(i)
+
+        if not features:
+            return scores
+
+        try:
+            count = len(features)
+            female_only = np.array([f['female_only'] for f in features])
+            static_score = np.array([f['static_score'] for f in features])
+            has_styling = np.array([f['has_styling'] for f in features])
+            has_situations = np.array([f['has_situations'] for f in features])
+            situation_onehot = np.array([f['situation_onehot'] for f in features], dtype=float).reshape(count, -1)
+            jacket_and_shorts = np.array([f['jacket_and_shorts'] for f in features])
+            top_inappropriate = np.array([f['top_inappropriate'] for f in features])
+            bottom_inappropriate = np.array([f['bottom_inappropriate'] for f in features])
+
+            # 1. 상황 적합성: 상황 태그 직접 매칭 → 없으면 상황 키워드 유사성
+            situation_rows, situation_hits = self._match_terms(
+                [f['situation_term_ids'] for f in features], user_input_lower
+            )
+            direct_match = np.bincount(situation_rows, weights=situation_hits, minlength=count) > 0
+            category_hits = np.array([
+                any(keyword in user_input_lower for keyword in self.situation_keywords[situation])
+                for situation in self._situation_categories
+            ], dtype=float)
+            similarity = np.minimum(situation_onehot @ category_hits * 0.6 + has_situations * 0.1, 0.8)
+            situation_score = np.where(direct_match, 0.4, similarity)
+
+            # 2. 아이템/스타일링 문자열 매칭 (문자열별 포함 여부는 요청당 한 번만 계산)
+            text_rows, text_hits = self._match_terms([f['text_term_ids'] for f in features], user_input_lower)
+            text_weights = np.concatenate([f['text_weights'] for f in features])
+            text_score = np.bincount(text_rows, weights=text_weights * text_hits, minlength=count)
+
+            # 3. 전문가 타입별 가중치
+            styling_bonus = has_styling * 0.1 if expert_type == "stylist" else np.zeros(count)
+
+            # 4. 격식 상황 부적절 아이템 감점
+            if any(keyword in user_input_lower for keyword in self.formal_keywords):
+                penalty = np.where(jacket_and_shorts, -10.0, top_inappropriate * -0.8 + bottom_inappropriate * -0.6)
+            else:
+                penalty = np.zeros(count)
+
+            total = np.minimum(static_score + situation_score + text_score + styling_bonus + penalty, 1.0)
+            total = np.where(female_only, -1.0, total)
+
+            for position, score in zip(positions, total.tolist()):
+                scores[position] = score
+
+            return scores
+
+        except Exception as e:
+            print(f"❌ 배치 점수 계산 실패, 개별 계산으로 전환: {e}")
+            return [self.calculate_match_score(user_input, doc, expert_type) for doc in docs]
+
+    def _match_terms(self, term_id_lists: list, user_input: str) -> tuple:
+        """착장별 문자열 ID 목록을 (행 번호 배열, 입력 포함 여부 배열)로 변환"""
+        lengths = [len(term_ids) for term_ids in term_id_lists]
+        rows = np.repeat(np.arange(len(term_id_lists)), lengths)
+        if not rows.size:
+            return rows, np.zeros(0)
+
+        term_ids = np.concatenate(term_id_lists)
+        unique_ids, inverse = np.unique(term_ids, return_inverse=True)
+        unique_hits = np.fromiter(
+            (self._terms[term_id] in user_input for term_id in unique_ids.tolist()),
+            dtype=float, count=len(unique_ids)
+        )
+        return rows, unique_hits[inverse]
+
+    def _get_static_features(self, json_content: dict, cache_key: str = None):
+        """착장별 정적 특징 조회 (캐시 키와 분석 시각이 같으면 캐시 사용)"""
+        signature = (json_content.get('analysis_timestamp', ''), json_content.get('updated_at', ''))
+
+        if cache_key is not None:
+            with self._feature_cache_lock:
+                cached = self._feature_cache.get(cache_key)
+                if cached and cached[0] == signature:
+                    self._feature_cache.move_to_end(cache_key)
+                    return cached[1]
+
+        feature = self._extract_static_features(json_content)
+
+        if cache_key is not None and feature is not None:
+            with self._feature_cache_lock:
+                self._feature_cache[cache_key] = (signature, feature)
+                self._feature_cache.move_to_end(cache_key)
+                while len(self._feature_cache) > self.FEATURE_CACHE_MAX_ENTRIES:
+                    self._feature_cache.popitem(last=False)
+
+        return feature
+
+    def _extract_static_features(self, json_content: dict):
+        """사용자 입력과 무관한 착장 특징 추출 (실패 시 None)"""
+        try:
+            extracted_items = json_content.get('extracted_items', {})
+            situations = json_content.get('situations', [])
+
+            text_terms = self._item_match_terms(extracted_items) + self._styling_match_terms(extracted_items)
+            jacket_and_shorts, top_inappropriate, bottom_inappropriate = self._formal_penalty_flags(extracted_items)
+
+            return {
+                'female_only': self._has_female_only_items(extracted_items),
+                'static_score': (
+                    self._calculate_season_score(extracted_items)
+                    + self._calculate_color_score(extracted_items)
+                    + self._calculate_diversity_bonus(situations, extracted_items)
+                ),
+                'has_styling': bool(extracted_items.get('styling_methods', {})),
+                'has_situations': bool(situations),
+                'situation_onehot': [situation in situations for situation in self._situation_categories],
+                'situation_term_ids': np.array([self._get_term_id(situation.lower()) for situation in situations], dtype=np.int64),
+                'text_term_ids': np.array([self._get_term_id(term) for term, _ in text_terms], dtype=np.int64),
+                'text_weights': np.array([weight for _, weight in text_terms], dtype=float),
+                'jacket_and_shorts': jacket_and_shorts,
+                'top_inappropriate': top_inappropriate is not None,
+                'bottom_inappropriate': bottom_inappropriate is not None
+            }
+        except Exception as e:
+            print(f"⚠️ 착장 특징 추출 실패: {e}")
+            return None
+
+    def _get_term_id(self, term: str) -> int:
+        """문자열 ID 조회 (없으면 새로 할당)"""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            with self._feature_cache_lock:
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    term_id = len(self._terms)
+                    self._terms.append(term)
+                    self._term_ids[term] = term_id
+        return term_id
+
     def _calculate_season_score(self, extracted_items: dict) -> float:
         """시즌 적합성 점수 계산"""
         score = 0.0
@@ -129,33 +321,39 @@ class ScoreCalculator:
         """아이템 매칭 점수 계산"""
         score = 0.0
 
+        for term, weight in self._item_match_terms(extracted_items):
+            if term in user_input:
+                score += weight
+
+        return score
+
+    def _item_match_terms(self, extracted_items: dict) -> list:
+        """아이템 매칭에 쓰는 (문자열, 점수) 목록 - 사용자 입력에 문자열이 포함되면 점수 부여"""
+        terms = []
+
         for category, item_info in extracted_items.items():
             if isinstance(item_info, dict):
                 item_name = item_info.get('item', '').lower()
                 item_color = item_info.get('color', '').lower()
                 item_fit = item_info.get('fit', '').lower()
 
-                if item_name and item_name in user_input:
-                    score += 0.3
-                if item_color and item_color in user_input:
-                    score += 0.2
-                if item_fit and item_fit in user_input:
-                    score += 0.2
+                if item_name:
+                    terms.append((item_name, 0.3))
+                if item_color:
+                    terms.append((item_color, 0.2))
+                if item_fit:
+                    terms.append((item_fit, 0.2))
 
-        return score
+        return terms
 
     def _calculate_styling_score(self, user_input: str, extracted_items: dict, expert_type: str) -> float:
         """스타일링 방법 점수 계산"""
         score = 0.0
 
         styling_methods = extracted_items.get('styling_methods', {})
-        if isinstance(styling_methods, dict):
-            for method_key, method_value in styling_methods.items():
-                if isinstance(method_value, str) and method_value.lower() in user_input:
-                    if method_key in ['top_wearing_method', 'tuck_degree', 'fit_details', 'silhouette_balance']:
-                        score += 0.3
-                    else:
-                        score += 0.2
+        for term, weight in self._styling_match_terms(extracted_items):
+            if term in user_input:
+                score += weight
 
         # 전문가 타입별 가중치
         if expert_type == "stylist" and styling_methods:
@@ -163,6 +361,21 @@ class ScoreCalculator:
 
         return score
 
+    def _styling_match_terms(self, extracted_items: dict) -> list:
+        """스타일링 방법 매칭에 쓰는 (문자열, 점수) 목록"""
+        terms = []
+
+        styling_methods = extracted_items.get('styling_methods', {})
+        if isinstance(styling_methods, dict):
+            for method_key, method_value in styling_methods.items():
+                if isinstance(method_value, str):
+                    if method_key in ['top_wearing_method', 'tuck_degree', 'fit_details', 'silhouette_balance']:
+                        terms.append((method_value.lower(), 0.3))
+                    else:
+                        terms.append((method_value.lower(), 0.2))
+
+        return terms
+
     def _calculate_diversity_bonus(self, situations: list, extracted_items: dict) -> float:
         """다양성 보너스 점수 계산"""
         bonus = 0.0
@@ -224,64 +437,46 @@ class ScoreCalculator:
         penalty = 0.0
         
         # 소개팅/비즈니스 상황 체크
-        formal_keywords = ["소개팅", "데이트", "면접", "출근", "비즈니스", "회사", "미팅", "회의", "오피스"]
-        is_formal_occasion = any(keyword in user_input for keyword in formal_keywords)
+        is_formal_occasion = any(keyword in user_input for keyword in self.formal_keywords)
         
         if is_formal_occasion:
-            top_item = extracted_items.get("top", {}).get("item", "").lower()
-            bottom_item = extracted_items.get("bottom", {}).get("item", "").lower()
-            
-            # 소개팅/비즈니스에 부적절한 아이템들
-            formal_inappropriate_items = [
-                "그래픽", "오버사이즈", "맨투맨", "후드티", "크롭", 
-                "티셔츠", "후드", "스웨트", "트레이닝", "운동복",
-                # 하의(반바지/쇼츠) 계열 키워드(동의어 포함)
-                "반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"
-            ]
-            
-            # 자켓/블레이저와 반바지 조합은 격식 상황에 부적절
-            jacket_keywords = ["자켓", "재킷", "블레이저", "블레이져", "재킷"]
-            shorts_keywords = ["반바지", "쇼츠", "하프팬츠", "숏팬츠", "숏츠", "쇼트팬츠"]
-            
-            top_item_no_space = top_item.replace(" ", "")
-            bottom_item_no_space = bottom_item.replace(" ", "")
-            
-            has_jacket = any(k in top_item_no_space for k in jacket_keywords)
-            has_shorts = any(k in bottom_item_no_space for k in shorts_keywords)
+            has_jacket_and_shorts, top_inappropriate, bottom_inappropriate = self._formal_penalty_flags(extracted_items)
             
             # 자켓+반바지 조합은 격식 상황에 매우 부적절 - 완전 제외
-            if has_jacket and has_shorts:
+            if has_jacket_and_shorts:
                 penalty -= 10.0  # 완전 제외를 위한 최대 감점
                 print(f"🚫 소개팅/비즈니스에 부적절한 조합(자켓+반바지) 완전 제외 (-10.0점)")
             else:
                 # 상의에서 부적절한 아이템 체크
-                for item in formal_inappropriate_items:
-                    if item in top_item_no_space:
-                        penalty -= 0.8  # 큰 감점
-                        print(f"⚠️ 소개팅/비즈니스에 부적절한 상의 발견: {item} (-0.8점)")
-                        break
+                if top_inappropriate:
+                    penalty -= 0.8  # 큰 감점
+                    print(f"⚠️ 소개팅/비즈니스에 부적절한 상의 발견: {top_inappropriate} (-0.8점)")
                 
                 # 하의에서 부적절한 아이템 체크
-                for item in formal_inappropriate_items:
-                    if item in bottom_item_no_space:
-                        penalty -= 0.6  # 중간 감점
-                        print(f"⚠️ 소개팅/비즈니스에 부적절한 하의 발견: {item} (-0.6점)")
-                        break
+                if bottom_inappropriate:
+                    penalty -= 0.6  # 중간 감점
+                    print(f"⚠️ 소개팅/비즈니스에 부적절한 하의 발견: {bottom_inappropriate} (-0.6점)")
         
         return penalty
 
+    def _formal_penalty_flags(self, extracted_items: dict) -> tuple:
+        """격식 상황 감점 판단 (자켓+반바지 여부, 상의 부적절 아이템, 하의 부적절 아이템)"""
+        top_item = extracted_items.get("top", {}).get("item", "").lower()
+        bottom_item = extracted_items.get("bottom", {}).get("item", "").lower()
+        
+        top_item_no_space = top_item.replace(" ", "")
+        bottom_item_no_space = bottom_item.replace(" ", "")
+        
+        has_jacket = any(k in top_item_no_space for k in self.jacket_keywords)
+        has_shorts = any(k in bottom_item_no_space for k in self.shorts_keywords)
+        
+        top_inappropriate = next((item for item in self.formal_penalty_items if item in top_item_no_space), None)
+        bottom_inappropriate = next((item for item in self.formal_penalty_items if item in bottom_item_no_space), None)
+        
+        return has_jacket and has_shorts, top_inappropriate, bottom_inappropriate
+
     def _has_female_only_items(self, extracted_items: dict) -> bool:
         """여성 전용 아이템이 포함되어 있는지 체크"""
-        # 여성 전용 아이템 목록
-        female_only_items = [
-            "스커트", "드레스", "블라우스", "미디", "미니", "맥시", "원피스",
-            "플리츠", "주름", "리본", "레이스", "프릴", "볼륨", "플레어",
-            "A라인", "H라인", "X라인", "Y라인", "I라인", "O라인",
-            "펌프스", "힐", "웨지", "플랫폼", "스틸레토", "메리제인",
-            "크롭", "캐미솔", "탑", "튜브탑", "할리톱", "오프숄더",
-            "원숄더", "스트랩리스", "백리스", "키홀", "컷아웃", "하프팬츠", "스키니", "숏팬츠"
-        ]
-        
         # 모든 아이템 카테고리에서 여성 전용 아이템 체크
         for category, item_info in extracted_items.items():
             if isinstance(item_info, dict):
@@ -292,7 +487,7 @@ class ScoreCalculator:
                 # 아이템명, 스타일, 핏에서 여성 전용 키워드 체크 (공백 제거)
                 all_item_text = f"{item_name} {item_style} {item_fit}".lower().replace(" ", "")
                 
-                for female_item in female_only_items:
+                for female_item in self.female_only_items:
                     if female_item in all_item_text:
                         print(f"🚫 여성 전용 아이템 발견: {female_item} in {category}")
                         return True
@@ -0,0 +1,209 @@
+import hashlib
+import io
+import json
+import logging
+import time
+from typing import Optional
+
+from services.redis_service import redis_service
+from config import settings
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 SHA-256 완전 일치만 사용
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+class VisionCacheService:
+    """이미지 내용(SHA-256, 설정 시 dHash + 색상 히스토그램) 기반 비전 분석 결과 캐시 (Redis, TTL + 최대 개수 초과 시 오래된 항목부터 제거)"""
+    
+    BAND_COUNT = 4  # 64비트 dHash를 16비트씩 나눈 LSH 밴드 (해밍 거리 3 이하는 반드시 한 밴드 이상 일치)
+    COLOR_LEVELS = 4  # 색상 히스토그램 채널별 구간 수 (4 x 4 x 4 = 64칸)
+    
+    def __init__(self):
+        self.prefix = "vision_cache"
+        self.lru_key = f"{self.prefix}:lru"
+        self.enabled = settings.VISION_CACHE_ENABLED
+        self.ttl = settings.VISION_CACHE_TTL
+        self.max_entries = settings.VISION_CACHE_MAX_ENTRIES
+        # dHash는 흑백 기준이라 같은 구도의 색상 변형도 가깝게 나옴 → 유사 이미지 재사용은 설정 시에만, 색상 히스토그램까지 비슷해야 사용
+        self.similar_enabled = settings.VISION_CACHE_SIMILAR_ENABLED
+        self.hamming_threshold = settings.VISION_CACHE_HAMMING_THRESHOLD
+        self.color_similarity = settings.VISION_CACHE_COLOR_SIMILARITY
+        self.max_candidates = 32
+        self.stats = {
+            "exact_hits": 0,
+            "similar_hits": 0,
+            "color_rejections": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0
+        }
+    
+    def _entry_key(self, sha: str, prompt_sig: str) -> str:
+        return f"{self.prefix}:entry:{prompt_sig}:{sha}"
+    
+    def _band_keys(self, dhash: str, prompt_sig: str) -> list:
+        width = len(dhash) // self.BAND_COUNT
+        return [f"{self.prefix}:band:{prompt_sig}:{band}:{dhash[band * width:(band + 1) * width]}" for band in range(self.BAND_COUNT)]
+    
+    def _perceptual_signatures(self, image_bytes: bytes) -> tuple:
+        """(64비트 difference hash 16자리 hex, 64칸 색상 히스토그램), 디코딩 불가/Pillow 없음이면 (None, None)"""
+        if Image is None:
+            return None, None
+        
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as image:
+                image.draft("RGB", (64, 64))  # JPEG은 축소 디코딩으로 해시 계산 시간 단축
+                small = image.convert("RGB").resize((16, 16), Image.LANCZOS)
+            
+            pixels = list(small.convert("L").resize((9, 8), Image.LANCZOS).getdata())
+            bits = 0
+            for row in range(8):
+                for col in range(8):
+                    bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+            
+            # 채널별 COLOR_LEVELS 구간으로 나눈 RGB 히스토그램 (16x16 = 256픽셀)
+            step = 256 // self.COLOR_LEVELS
+            color_hist = [0] * (self.COLOR_LEVELS ** 3)
+            for r, g, b in small.getdata():
+                color_hist[((r // step) * self.COLOR_LEVELS + g // step) * self.COLOR_LEVELS + b // step] += 1
+            return f"{bits:016x}", color_hist
+        except Exception as e:
+            logger.error(f"이미지 dHash 계산 실패: {e}")
+            return None, None
+    
+    def _color_overlap(self, hist_a: Optional[list], hist_b: Optional[list]) -> float:
+        """두 색상 히스토그램의 교집합 비율 (0~1, 히스토그램이 없으면 0)"""
+        if not hist_a or not hist_b or len(hist_a) != len(hist_b):
+            return 0.0
+        return sum(min(a, b) for a, b in zip(hist_a, hist_b)) / max(sum(hist_a), 1)
+    
+    def fingerprint(self, image_bytes: bytes, prompt: Optional[str] = None) -> dict:
+        """캐시 조회/저장용 지문 (프롬프트가 다르면 다른 결과로 취급)"""
+        dhash, color_hist = self._perceptual_signatures(image_bytes) if self.enabled and self.similar_enabled else (None, None)
+        return {
+            "sha": hashlib.sha256(image_bytes).hexdigest(),
+            "dhash": dhash,
+            "color_hist": color_hist,
+            "prompt_sig": hashlib.sha256((prompt or "").encode("utf-8")).hexdigest()[:12]
+        }
+    
+    def lookup(self, fingerprint: dict) -> Optional[dict]:
+        """완전 일치 → 유사 이미지(해밍 거리 기준) 순으로 캐시된 분석 결과 조회 (없으면 None)"""
+        if not self.enabled:
+            return None
+        
+        try:
+            sha, prompt_sig = fingerprint["sha"], fingerprint["prompt_sig"]
+            entry = redis_service.get_json(self._entry_key(sha, prompt_sig))
+            if entry:
+                self._touch(sha, prompt_sig)
+                self.stats["exact_hits"] += 1
+                return entry["result"]
+            
+            dhash = fingerprint.get("dhash")
+            if dhash and self.similar_enabled:
+                match = self._find_similar(dhash, fingerprint.get("color_hist"), prompt_sig)
+                if match:
+                    self._touch(match["sha"], prompt_sig)
+                    self.stats["similar_hits"] += 1
+                    print(f"⚡ 유사 이미지 분석 결과 재사용 (해밍 거리 {match['distance']})")
+                    return match["result"]
+            
+            self.stats["misses"] += 1
+            return None
+        except Exception as e:
+            logger.error(f"비전 캐시 조회 실패: {e}")
+            return None
+    
+    def _find_similar(self, dhash: str, color_hist: Optional[list], prompt_sig: str) -> Optional[dict]:
+        """LSH 밴드로 후보를 좁힌 뒤 색상 히스토그램도 비슷한 항목 중 해밍 거리가 가장 가까운 항목 반환 (색상 변형의 분석 결과 재사용 방지)"""
+        band_members = redis_service.execute_pipeline([("smembers", key) for key in self._band_keys(dhash, prompt_sig)])
+        candidates = sorted(set().union(*band_members))[:self.max_candidates] if band_members else []
+        if not candidates:
+            return None
+        
+        entries = redis_service.mget_json([self._entry_key(sha, prompt_sig) for sha in candidates])
+        best = None
+        for sha, entry in zip(candidates, entries):
+            if not entry or not entry.get("dhash"):
+                continue
+            distance = bin(int(dhash, 16) ^ int(entry["dhash"], 16)).count("1")
+            if distance > self.hamming_threshold or (best is not None and distance >= best["distance"]):
+                continue
+            if self._color_overlap(color_hist, entry.get("color_hist")) < self.color_similarity:
+                self.stats["color_rejections"] += 1
+                continue
+            best = {"sha": sha, "distance": distance, "result": entry["result"]}
+        return best
+    
+    def _touch(self, sha: str, prompt_sig: str):
+        """최근 사용 시각 갱신 (최대 개수 초과 시 제거 순서)"""
+        redis_service.execute_pipeline([("zadd", self.lru_key, {f"{prompt_sig}:{sha}": time.time()})])
+    
+    def store(self, fingerprint: dict, result: dict) -> bool:
+        """분석 결과 저장 (파싱 실패 결과는 저장하지 않음)"""
+        if not self.enabled or not isinstance(result, dict) or "error" in result:
+            return False
+        
+        try:
+            sha, dhash, prompt_sig = fingerprint["sha"], fingerprint.get("dhash"), fingerprint["prompt_sig"]
+            entry = {"result": result, "dhash": dhash, "color_hist": fingerprint.get("color_hist"), "created_at": time.time()}
+            
+            commands = [("set", self._entry_key(sha, prompt_sig), json.dumps(entry, ensure_ascii=False), self.ttl)]
+            if dhash:
+                for band_key in self._band_keys(dhash, prompt_sig):
+                    commands.append(("sadd", band_key, sha))
+                    commands.append(("expire", band_key, self.ttl))
+            commands.append(("zadd", self.lru_key, {f"{prompt_sig}:{sha}": time.time()}))
+            commands.append(("zcard", self.lru_key))
+            
+            results = redis_service.execute_pipeline(commands, transaction=True)
+            if results is None:
+                return False
+            
+            self.stats["stores"] += 1
+            if results[-1] > self.max_entries:
+                self._evict(results[-1] - self.max_entries)
+            return True
+        except Exception as e:
+            logger.error(f"비전 캐시 저장 실패: {e}")
+            return False
+    
+    def _evict(self, count: int):
+        """가장 오래 사용되지 않은 항목부터 제거 (밴드 멤버십 포함)"""
+        popped = redis_service.execute_pipeline([("zpopmin", self.lru_key, count)])
+        members = [member for member, _ in popped[0]] if popped else []
+        if not members:
+            return
+        
+        entry_keys = [self._entry_key(*member.split(":", 1)[::-1]) for member in members]
+        entries = redis_service.mget_json(entry_keys)
+        
+        commands = [("delete", *entry_keys)]
+        for member, entry in zip(members, entries):
+            prompt_sig, sha = member.split(":", 1)
+            if entry and entry.get("dhash"):
+                commands.extend(("srem", band_key, sha) for band_key in self._band_keys(entry["dhash"], prompt_sig))
+        redis_service.execute_pipeline(commands)
+        
+        self.stats["evictions"] += len(members)
+    
+    def get_stats(self) -> dict:
+        """적중률 및 저장 개수"""
+        hits = self.stats["exact_hits"] + self.stats["similar_hits"]
+        lookups = hits + self.stats["misses"]
+        entries = redis_service.execute_pipeline([("zcard", self.lru_key)])
+        return {
+            "enabled": self.enabled,
+            "similar_matching": self.similar_enabled and Image is not None,
+            "entries": entries[0] if entries else 0,
+            "max_entries": self.max_entries,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            **self.stats
+        }
+
+# 전역 인스턴스
+vision_cache_service = VisionCacheService()
@@ -0,0 +1,77 @@
+import sys
+import os
+import time
+import asyncio
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from test_incremental_index_etag import _start_backends, _outfit
+
+
+def test_async_s3_facade():
+    """비동기 S3 파사드가 S3 스레드 풀에서 동시에 실행되고 조회/수정/삭제 결과가 S3와 일치하는지 확인 (moto)"""
+
+    print("🧪 비동기 S3 파사드 테스트")
+    print("=" * 50)
+
+    mock, _ = _start_backends()
+    try:
+        from services.s3_service import s3_service
+        from services.async_s3_service import async_s3_service
+        from services.outfit_matcher_service import outfit_matcher_service
+
+        filenames = [f"outfit_{i}" for i in range(6)]
+
+        # 조회를 감싸 실행 스레드와 최대 동시 실행 수 기록
+        original_get = s3_service.get_json_content
+        threads, active, peak = set(), [0], [0]
+        lock = threading.Lock()
+
+        def tracked_get(filename):
+            with lock:
+                threads.add(threading.current_thread().name)
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            try:
+                time.sleep(0.05)
+                return original_get(filename)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        async def scenario():
+            # 업로드 (동시 실행)
+            await asyncio.gather(*[async_s3_service.upload_json(_outfit(["일상"]), filename) for filename in filenames])
+            listed = await async_s3_service.list_json_files(use_cache=False)
+            assert {file_info["filename"] for file_info in listed} == set(filenames), listed
+
+            # 동시 조회 (없는 파일은 결과에서 제외)
+            s3_service.invalidate_json_cache()
+            s3_service.get_json_content = tracked_get
+            try:
+                contents = await async_s3_service.get_many(filenames + ["missing_outfit"])
+            finally:
+                s3_service.get_json_content = original_get
+            assert set(contents) == set(filenames), contents.keys()
+            assert threads and all(name.startswith("s3-io") for name in threads), threads
+            assert peak[0] > 1, f"동시 실행되지 않음: {peak[0]}"
+
+            # 인덱스에 없는 문서는 비동기 파사드로 S3에서 조회
+            loaded = await outfit_matcher_service.load_outfit_contents_async(filenames[:3])
+            assert set(loaded) == set(filenames[:3]), loaded.keys()
+
+            # situations 수정 / 삭제
+            await async_s3_service.update_json_situations(filenames[0], ["소개팅"])
+            assert (await async_s3_service.get_json_content(filenames[0]))["situations"] == ["소개팅"]
+            assert await async_s3_service.delete_json(filenames[1])
+            listed = await async_s3_service.list_json_files(use_cache=False)
+            assert filenames[1] not in {file_info["filename"] for file_info in listed}
+
+        asyncio.run(scenario())
+        print(f"✅ 파사드 조회/수정/삭제 정상 (S3 스레드 풀 {len(threads)}개 스레드, 최대 동시 {peak[0]}개)")
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    test_async_s3_facade()
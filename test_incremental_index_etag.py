@@ -0,0 +1,94 @@
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+BUCKET_NAME = "thefirsttake-combination"
+REGION = "ap-northeast-2"
+
+
+def _start_backends():
+    """moto S3 + fakeredis로 서비스 연결 (실제 AWS/Redis 없이 실행)"""
+    os.environ.setdefault("AWS_EC2_METADATA_DISABLED", "true")
+    for name in ("AWS_ACCESS_KEY", "AWS_SECRET_KEY", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        os.environ.setdefault(name, "test")
+    os.environ["S3_COMBINATION_BUCKET_NAME"] = BUCKET_NAME
+    os.environ["AWS_REGION"] = REGION
+
+    from moto import mock_aws
+    mock = mock_aws()
+    mock.start()
+
+    import boto3
+    import fakeredis
+    s3_client = boto3.client("s3", region_name=REGION)
+    s3_client.create_bucket(Bucket=BUCKET_NAME, CreateBucketConfiguration={"LocationConstraint": REGION})
+
+    from api import fashion_routes  # noqa: F401 (services ↔ api 순환 import를 main.py와 같은 순서로 초기화)
+    from services.redis_service import redis_service
+    from services.s3_service import s3_service
+
+    redis_service.redis_client = fakeredis.FakeRedis(decode_responses=True)
+    s3_service.s3_client = s3_client
+    s3_service.bucket_name = BUCKET_NAME
+    s3_service.invalidate_json_cache()
+    return mock, s3_client
+
+
+def _outfit(situations: list) -> dict:
+    """테스트용 착장 분석 JSON"""
+    return {
+        "extracted_items": {
+            "top": {"item": "린넨 반팔 셔츠", "color": "화이트", "fit": "레귤러"},
+            "bottom": {"item": "와이드 슬랙스", "color": "네이비", "fit": "와이드"}
+        },
+        "situations": situations,
+        "analysis_timestamp": "2025-01-01"
+    }
+
+
+def test_incremental_index_reads_out_of_band_change():
+    """다른 워커/업로더가 바꾼 JSON이 캐시된 이전 내용이 아니라 새 내용으로 재인덱싱되는지 확인"""
+
+    print("🧪 증분 인덱싱 외부 변경 반영 테스트")
+    print("=" * 50)
+
+    mock, s3_client = _start_backends()
+    try:
+        from services.s3_service import s3_service
+        from services.fashion_index_service import fashion_index_service
+
+        s3_service.upload_json(_outfit(["일상"]), "outfit_a")
+        s3_service.upload_json(_outfit(["여행"]), "outfit_b")
+
+        result = fashion_index_service.build_indexes()
+        assert result["indexed"] == 2, result
+
+        # 이 워커의 JSON 캐시에 이전 내용이 남아 있는 상태 (TTL 이내)
+        assert s3_service.get_json_content("outfit_a")["situations"] == ["일상"]
+
+        # 다른 워커/업로더가 S3를 직접 수정 (이 워커의 캐시는 무효화되지 않음)
+        s3_client.put_object(
+            Bucket=BUCKET_NAME,
+            Key=f"{s3_service.bucket_json_prefix}/outfit_a.json",
+            Body=json.dumps(_outfit(["소개팅"]), ensure_ascii=False).encode("utf-8"),
+            ContentType="application/json"
+        )
+
+        result = fashion_index_service.build_indexes()
+        assert result["updated"] == 1, result
+        metadata = fashion_index_service.get_metadata_many(["outfit_a"])
+        assert metadata and metadata[0]["situations"] == ["소개팅"], metadata
+        assert fashion_index_service.search_by_situation("소개팅"), "새 상황 인덱스에 없음"
+
+        # 저장된 ETag가 실제 내용과 일치해야 다음 실행에서 변경 없음으로 판단
+        result = fashion_index_service.build_indexes()
+        assert result["updated"] == 0 and result["unchanged"] == 2, result
+
+        print("✅ 외부 변경이 새 내용으로 재인덱싱되고 이후 실행은 변경 없음")
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    test_incremental_index_reads_out_of_band_change()
@@ -0,0 +1,73 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from test_incremental_index_etag import _start_backends, _outfit
+
+
+def test_concurrent_writers_do_not_leave_stale_postings():
+    """두 워커가 같은 파일을 동시에 기록/제거해도 먼저 기록된 인덱스 키가 남지 않는지 확인 (moto + fakeredis)"""
+
+    print("🧪 동시 기록 인덱스 키 정합성 테스트")
+    print("=" * 50)
+
+    mock, _ = _start_backends()
+    try:
+        from services.redis_service import redis_service
+        from services.fashion_index_service import fashion_index_service
+
+        redis_service.redis_client.flushall()
+        fashion_index_service._generation_checked_at = 0.0
+        fashion_index_service.reindex_file("outfit_a", _outfit(["일상"]))
+
+        # 이전 인덱스 키를 읽은 직후 다른 워커가 같은 파일을 기록 (한 번만)
+        original_stored_posting_keys = fashion_index_service._stored_posting_keys
+        interleaved = []
+
+        def stored_posting_keys_then_interleave(interleaving_content):
+            def stored_posting_keys(filenames, generation):
+                stored_keys = original_stored_posting_keys(filenames, generation)
+                if not interleaved:
+                    interleaved.append(True)
+                    fashion_index_service._stored_posting_keys = original_stored_posting_keys
+                    try:
+                        if interleaving_content is None:
+                            fashion_index_service.remove_file("outfit_a")
+                        else:
+                            fashion_index_service.reindex_file("outfit_a", interleaving_content)
+                    finally:
+                        fashion_index_service._stored_posting_keys = stored_posting_keys
+                return stored_keys
+            return stored_posting_keys
+
+        # 1) 기록 도중 다른 기록
+        fashion_index_service._stored_posting_keys = stored_posting_keys_then_interleave(_outfit(["소개팅"]))
+        try:
+            assert fashion_index_service.reindex_file("outfit_a", _outfit(["여행"]))
+        finally:
+            fashion_index_service._stored_posting_keys = original_stored_posting_keys
+
+        assert interleaved
+        assert not fashion_index_service.search_by_situation("소개팅"), "먼저 기록된 인덱스 키가 남아 있음"
+        assert not fashion_index_service.search_by_situation("일상")
+        assert [metadata["filename"] for metadata in fashion_index_service.search_by_situation("여행")] == ["outfit_a"]
+        print("✅ 기록 도중 끼어든 기록의 인덱스 키까지 정리")
+
+        # 2) 제거 도중 다른 기록
+        interleaved.clear()
+        fashion_index_service._stored_posting_keys = stored_posting_keys_then_interleave(_outfit(["출근"]))
+        try:
+            assert fashion_index_service.remove_file("outfit_a")
+        finally:
+            fashion_index_service._stored_posting_keys = original_stored_posting_keys
+
+        assert interleaved
+        for situation in ("출근", "여행"):
+            assert not fashion_index_service.search_by_situation(situation), f"{situation} 인덱스 키가 남아 있음"
+        print("✅ 제거 도중 끼어든 기록의 인덱스 키까지 제거")
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    test_concurrent_writers_do_not_leave_stale_postings()
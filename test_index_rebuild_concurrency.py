@@ -0,0 +1,115 @@
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from test_incremental_index_etag import _start_backends, _outfit
+
+
+def _generation_keys(redis_client, number: int) -> list:
+    """세대에 남아 있는 키 목록"""
+    return list(redis_client.scan_iter(f"fashion_index:v{number}:*"))
+
+
+def test_overlapping_rebuilds_do_not_leak_generations():
+    """겹친 전체 재구축이 세대를 누수시키지 않고, 전환 사이 기록된 변경도 현재 세대에 반영되는지 확인 (moto + fakeredis)"""
+
+    print("🧪 전체 재구축 동시 실행 테스트")
+    print("=" * 50)
+
+    mock, _ = _start_backends()
+    try:
+        from services.redis_service import redis_service
+        from services.s3_service import s3_service
+        from services.fashion_index_service import fashion_index_service
+
+        redis_client = redis_service.redis_client
+        redis_client.flushall()
+        fashion_index_service._generation_checked_at = 0.0
+        fashion_index_service.gc_delay_seconds = 3600  # 정리는 테스트에서 직접 실행
+
+        s3_service.upload_json(_outfit(["일상"]), "outfit_a")
+        s3_service.upload_json(_outfit(["여행"]), "outfit_b")
+
+        # 1) 재구축 진행 중 두 번째 재구축 요청은 건너뜀
+        original_run_build = fashion_index_service._run_build
+        building, release = threading.Event(), threading.Event()
+
+        def slow_run_build(*args, **kwargs):
+            building.set()
+            release.wait(10)
+            return original_run_build(*args, **kwargs)
+
+        results = {}
+        fashion_index_service._run_build = slow_run_build
+        try:
+            first = threading.Thread(target=lambda: results.setdefault("first", fashion_index_service.build_indexes(force_rebuild=True)))
+            first.start()
+            assert building.wait(10)
+            second = fashion_index_service.build_indexes(force_rebuild=True)
+            release.set()
+            first.join(10)
+        finally:
+            fashion_index_service._run_build = original_run_build
+
+        assert second.get("already_running"), second
+        assert results["first"]["indexed"] == 2, results
+        active = results["first"]["generation"]
+        fashion_index_service.collect_retired_generations()
+        print(f"✅ 두 번째 재구축은 already_running (v{active} 활성)")
+
+        # 2) 락을 거치지 않고 포인터가 바뀐 경우: 실제로 가리키던 세대를 정리 대상으로 등록하고 그 세대의 변경을 반영
+        def run_build_with_overlap(file_infos, label, generation=None):
+            build_stats = original_run_build(file_infos, label, generation=generation)
+            if not results.get("overlapped"):
+                # 이 구축이 기록을 마친 뒤 다른 재구축이 먼저 전환하고, 그 세대에 변경이 기록됨
+                results["overlapped"] = True
+                overlap = fashion_index_service._rebuild_into_new_generation()
+                s3_service.upload_json(_outfit(["소개팅"]), "outfit_a")
+                fashion_index_service.apply_changes(["outfit_a"], [])
+                results["overlap_generation"] = overlap["generation"]
+            return build_stats
+
+        fashion_index_service._run_build = run_build_with_overlap
+        try:
+            rebuilt = fashion_index_service.build_indexes(force_rebuild=True)
+        finally:
+            fashion_index_service._run_build = original_run_build
+
+        overlap_generation = results["overlap_generation"]
+        current = fashion_index_service.current_generation(refresh=True).number
+        assert current == rebuilt["generation"] and len({current, overlap_generation, active}) == 3, (current, overlap_generation, active)
+        retired = redis_client.smembers(fashion_index_service.retired_generations_key)
+        assert {str(active), str(overlap_generation)} <= retired, retired
+
+        fashion_index_service.collect_retired_generations()
+        for number in (active, overlap_generation):
+            assert not _generation_keys(redis_client, number), f"v{number} 키가 남아 있음"
+        metadata = fashion_index_service.get_metadata_many(["outfit_a"])
+        assert metadata and metadata[0]["situations"] == ["소개팅"], metadata
+        print(f"✅ 겹친 세대 v{overlap_generation}도 정리되고 그 사이 변경은 v{current}에 반영")
+
+        # 3) 구축 중 예외가 나면 발급한 세대를 정리
+        def failing_run_build(*args, **kwargs):
+            generation = kwargs["generation"]
+            redis_client.set(generation.schema_version_key, "2")
+            raise RuntimeError("Redis 연결 끊김")
+
+        fashion_index_service._run_build = failing_run_build
+        try:
+            failed = fashion_index_service.build_indexes(force_rebuild=True)
+        finally:
+            fashion_index_service._run_build = original_run_build
+
+        assert failed["indexed"] == 0, failed
+        assert fashion_index_service.current_generation(refresh=True).number == current
+        leaked = [key for key in redis_client.scan_iter("fashion_index:v*") if not key.startswith(f"fashion_index:v{current}:")]
+        assert not leaked, leaked
+        assert redis_client.get(fashion_index_service.rebuild_lock_key) is None
+        print("✅ 구축 실패 시 새 세대 정리, 락 해제")
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    test_overlapping_rebuilds_do_not_leak_generations()
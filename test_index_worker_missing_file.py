@@ -0,0 +1,50 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from test_incremental_index_etag import _start_backends, _outfit
+
+
+def test_upsert_for_deleted_file_is_applied_as_delete():
+    """S3에서 이미 삭제된 파일의 upsert 이벤트가 재시도/dead-letter 대신 인덱스 제거로 반영되는지 확인 (moto + fakeredis)"""
+
+    print("🧪 삭제된 파일 upsert 이벤트 테스트")
+    print("=" * 50)
+
+    mock, _ = _start_backends()
+    try:
+        from services.redis_service import redis_service
+        from services.s3_service import s3_service
+        from services.fashion_index_service import fashion_index_service
+        from services.index_worker_service import index_worker_service
+
+        redis_service.redis_client.flushall()
+        fashion_index_service._generation_checked_at = 0.0
+        redis_service.ensure_stream_group(index_worker_service.stream_key, index_worker_service.group_name)
+
+        s3_service.upload_json(_outfit(["일상"]), "outfit_a")
+        fashion_index_service.reindex_file("outfit_a")
+        assert fashion_index_service.search_by_situation("일상")
+
+        # situations 수정 이벤트가 반영되기 전에 착장이 삭제된 경우 (upsert 이벤트만 남음)
+        worker_enabled = index_worker_service.enabled
+        index_worker_service.enabled = True
+        try:
+            assert index_worker_service.enqueue("upsert", "outfit_a", "update_situations")
+        finally:
+            index_worker_service.enabled = worker_enabled
+        s3_service.delete_json("outfit_a")
+
+        entries = redis_service.xreadgroup(index_worker_service.stream_key, index_worker_service.group_name, "test", ">", 10, 1)
+        assert index_worker_service._apply(entries), "삭제된 파일이 실패로 처리됨"
+
+        assert not fashion_index_service.search_by_situation("일상"), "삭제된 파일이 인덱스에 남아 있음"
+        assert redis_service.xlen(index_worker_service.stream_key) == 0
+        assert redis_service.xlen(index_worker_service.dead_letter_key) == 0
+        print("✅ 삭제된 파일의 upsert는 제거로 반영, 재시도/dead-letter 없음")
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    test_upsert_for_deleted_file_is_applied_as_delete()
@@ -0,0 +1,97 @@
+import sys
+import os
+import random
+import importlib.util
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 서비스 패키지 초기화(Redis/S3 연결) 없이 점수 계산 모듈만 로드
+_spec = importlib.util.spec_from_file_location(
+    "score_calculator_service",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "services", "score_calculator_service.py")
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+ScoreCalculator = _module.ScoreCalculator
+
+TOLERANCE = 1e-9
+
+USER_INPUTS = [
+    "소개팅 가는데 블랙 셔츠 추천해줘",
+    "면접 복장 추천해줘",
+    "여름에 친구랑 카페 갈 때 입을 옷",
+    "화이트 반팔 티셔츠에 와이드 슬랙스 어때?",
+    "파티에 입고 갈 레드 자켓",
+    "다른거는?",
+    "오버핏 맨투맨 캐주얼하게",
+    "여행 갈 때 편한 반바지",
+    "데이트룩으로 살짝 넣기 스타일",
+    ""
+]
+
+EXPERT_TYPES = ["style_analyst", "trend_expert", "color_expert", "fitting_coordinator", "stylist"]
+
+
+def _random_outfit(rng: random.Random) -> dict:
+    """테스트용 착장 문서 생성"""
+    tops = ["린넨 반팔 셔츠", "오버핏 맨투맨", "그래픽 티셔츠", "울 블레이저", "니트 스웨터", "블라우스", "후드티", "크롭 탑", ""]
+    bottoms = ["와이드 슬랙스", "데님 반바지", "카고 팬츠", "하프팬츠", "플리츠 스커트", "스트레이트 청바지", "쇼츠", ""]
+    shoes = ["로퍼", "스니커즈", "첼시 부츠", "컨버스", "더비 슈즈", ""]
+    colors = ["블랙", "화이트", "네이비", "베이지", "레드", "그레이", "블랙", ""]
+    fits = ["레귤러", "오버핏", "슬림", "와이드", "스키니", ""]
+    situations = ["일상", "캐주얼", "소개팅", "면접", "파티", "여행", "출근"]
+    styling_keys = ["top_wearing_method", "tuck_degree", "fit_details", "silhouette_balance", "color_combination", "accessory"]
+    styling_values = ["살짝 넣기", "빼입기", "오버핏 실루엣", "톤온톤", "", "넣어 입기"]
+
+    extracted_items = {}
+    for category, names in [("top", tops), ("bottom", bottoms), ("shoes", shoes)]:
+        if rng.random() < 0.9:
+            extracted_items[category] = {
+                "item": rng.choice(names),
+                "color": rng.choice(colors),
+                "fit": rng.choice(fits)
+            }
+    if rng.random() < 0.3:
+        extracted_items["accessories"] = {"item": "가죽 벨트", "color": rng.choice(colors)}
+    if rng.random() < 0.8:
+        extracted_items["styling_methods"] = {
+            key: rng.choice(styling_values) for key in rng.sample(styling_keys, rng.randint(0, len(styling_keys)))
+        }
+
+    return {
+        "extracted_items": extracted_items,
+        "situations": rng.sample(situations, rng.randint(0, 3)),
+        "analysis_timestamp": f"2025-01-{rng.randint(1, 28):02d}"
+    }
+
+
+def test_score_parity():
+    """score_many와 calculate_match_score 점수 일치 테스트"""
+
+    print("🧮 배치 점수 계산 일치 테스트")
+    print("=" * 50)
+
+    rng = random.Random(42)
+    docs = [_random_outfit(rng) for _ in range(300)]
+    docs.append({"extracted_items": {"top": "잘못된 형식"}, "situations": ["일상"]})  # 개별 계산으로 처리되는 문서
+    cache_keys = [f"outfit_{i}" for i in range(len(docs))]
+
+    calculator = ScoreCalculator()
+    compared = 0
+
+    for expert_type in EXPERT_TYPES:
+        for user_input in USER_INPUTS:
+            expected = [calculator.calculate_match_score(user_input, doc, expert_type) for doc in docs]
+
+            # 캐시 없이, 캐시 사용(두 번째 호출부터 캐시 적중) 모두 확인
+            for keys in (None, cache_keys, cache_keys):
+                actual = calculator.score_many(user_input, docs, expert_type, cache_keys=keys)
+                assert len(actual) == len(expected)
+                for i, (a, e) in enumerate(zip(actual, expected)):
+                    assert abs(a - e) <= TOLERANCE, f"점수 불일치: '{user_input}' / {expert_type} / #{i}: {a} != {e}"
+                compared += len(actual)
+
+    print(f"✅ {compared}개 점수 일치")
+
+
+if __name__ == "__main__":
+    test_score_parity()